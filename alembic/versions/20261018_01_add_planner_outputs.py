@@ -0,0 +1,92 @@
+"""add planner output tables
+
+Revision ID: 20261018_01
+Revises: 20260222_01
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_01"
+down_revision = "20260222_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "planner_thread_pass",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("thread_id", sa.String(length=255), nullable=False),
+        sa.Column("pass_id", sa.String(length=255), nullable=False),
+        sa.Column("pass_index", sa.Integer(), nullable=False),
+        sa.Column("planner_summary", sa.Text(), nullable=False),
+        sa.Column("skill_registry_id", sa.String(length=255), nullable=False),
+        sa.Column("action_card_ids", sa.Text(), nullable=False),
+        sa.Column("timeline_event_ids", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("pass_id"),
+    )
+    op.create_index("ix_planner_thread_pass_thread_id", "planner_thread_pass", ["thread_id"])
+
+    op.create_table(
+        "planner_skill_registry",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("pass_id", sa.String(length=255), nullable=False),
+        sa.Column("registry_id", sa.String(length=255), nullable=False),
+        sa.Column("generated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("skills", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_planner_skill_registry_pass_id", "planner_skill_registry", ["pass_id"])
+
+    op.create_table(
+        "planner_action_card",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("pass_id", sa.String(length=255), nullable=False),
+        sa.Column("card_id", sa.String(length=255), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("owner", sa.String(length=255), nullable=True),
+        sa.Column("details", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_planner_action_card_pass_id", "planner_action_card", ["pass_id"])
+
+    op.create_table(
+        "planner_timeline_event",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("pass_id", sa.String(length=255), nullable=False),
+        sa.Column("event_id", sa.String(length=255), nullable=False),
+        sa.Column("event_type", sa.String(length=64), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("actor", sa.String(length=255), nullable=True),
+        sa.Column("action_card_id", sa.String(length=255), nullable=True),
+        sa.Column("details", sa.Text(), nullable=True),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_planner_timeline_event_pass_id", "planner_timeline_event", ["pass_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_planner_timeline_event_pass_id", table_name="planner_timeline_event")
+    op.drop_table("planner_timeline_event")
+
+    op.drop_index("ix_planner_action_card_pass_id", table_name="planner_action_card")
+    op.drop_table("planner_action_card")
+
+    op.drop_index("ix_planner_skill_registry_pass_id", table_name="planner_skill_registry")
+    op.drop_table("planner_skill_registry")
+
+    op.drop_index("ix_planner_thread_pass_thread_id", table_name="planner_thread_pass")
+    op.drop_table("planner_thread_pass")
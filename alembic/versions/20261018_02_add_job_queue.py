@@ -0,0 +1,44 @@
+"""add job_queue
+
+Revision ID: 20261018_02
+Revises: 20261018_01
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_02"
+down_revision = "20261018_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_queue",
+        sa.Column("id", sa.String(length=64), nullable=False),
+        sa.Column("kind", sa.String(length=128), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("available_at", sa.Float(), nullable=False),
+        sa.Column("reserved_until", sa.Float(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_job_queue_status_priority_available_at",
+        "job_queue",
+        ["status", "priority", "available_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_queue_status_priority_available_at", table_name="job_queue")
+    op.drop_table("job_queue")
@@ -0,0 +1,185 @@
+"""partition audit_log by month
+
+Postgres: ``audit_log`` becomes a ``PARTITION BY RANGE (created_at)`` table
+with one ``audit_log_pYYYYMM`` partition per month (existing months up to three
+months ahead) plus a default partition, and existing rows are copied across.
+Other dialects keep ``audit_log`` as an empty base table and move rows into
+one ordinary ``audit_log_pYYYYMM`` table per month, matching what
+``apps.api.app.auth.audit_store`` creates on demand.
+
+Both replace the single-column ``action``/``actor_id`` indexes with
+``(actor_id, created_at, id)`` and ``(action, created_at, id)``.
+
+Revision ID: 20261018_03
+Revises: 20261018_02
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_03"
+down_revision = "20261018_02"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = "id, action, actor_id, method, path, client_ip, user_agent, details, created_at"
+_DATA_COLUMNS = "action, actor_id, method, path, client_ip, user_agent, details, created_at"
+
+
+def _create_composite_indexes(table: str) -> None:
+    op.create_index(f"ix_{table}_actor_id_created_at", table, ["actor_id", "created_at", "id"])
+    op.create_index(f"ix_{table}_action_created_at", table, ["action", "created_at", "id"])
+
+
+def _drop_composite_indexes(table: str) -> None:
+    op.drop_index(f"ix_{table}_action_created_at", table_name=table)
+    op.drop_index(f"ix_{table}_actor_id_created_at", table_name=table)
+
+
+def _audit_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("action", sa.String(length=128), nullable=False),
+        sa.Column("actor_id", sa.String(length=255), nullable=True),
+        sa.Column("method", sa.String(length=16), nullable=False),
+        sa.Column("path", sa.String(length=1024), nullable=False),
+        sa.Column("client_ip", sa.String(length=64), nullable=True),
+        sa.Column("user_agent", sa.String(length=1024), nullable=True),
+        sa.Column("details", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    ]
+
+
+def _upgrade_postgresql() -> None:
+    op.drop_index("ix_audit_log_actor_id", table_name="audit_log")
+    op.drop_index("ix_audit_log_action", table_name="audit_log")
+    op.execute("ALTER TABLE audit_log RENAME TO audit_log_unpartitioned")
+    op.execute(
+        "ALTER TABLE audit_log_unpartitioned "
+        "RENAME CONSTRAINT audit_log_pkey TO audit_log_unpartitioned_pkey"
+    )
+    op.execute("ALTER SEQUENCE audit_log_id_seq OWNED BY NONE")
+    op.execute(
+        """
+        CREATE TABLE audit_log (
+            id INTEGER NOT NULL DEFAULT nextval('audit_log_id_seq'),
+            action VARCHAR(128) NOT NULL,
+            actor_id VARCHAR(255),
+            method VARCHAR(16) NOT NULL,
+            path VARCHAR(1024) NOT NULL,
+            client_ip VARCHAR(64),
+            user_agent VARCHAR(1024),
+            details TEXT,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT audit_log_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE audit_log_id_seq OWNED BY audit_log.id")
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month timestamptz := date_trunc(
+                'month',
+                coalesce((SELECT min(created_at) FROM audit_log_unpartitioned), now()),
+                'UTC'
+            );
+            last_month timestamptz := date_trunc('month', now(), 'UTC') + interval '3 months';
+        BEGIN
+            WHILE month <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF audit_log FOR VALUES FROM (%L) TO (%L)',
+                    'audit_log_p' || to_char(month AT TIME ZONE 'UTC', 'YYYYMM'),
+                    month,
+                    month + interval '1 month'
+                );
+                month := month + interval '1 month';
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute("CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT")
+    _create_composite_indexes("audit_log")
+    op.execute(f"INSERT INTO audit_log ({_COLUMNS}) SELECT {_COLUMNS} FROM audit_log_unpartitioned")
+    op.execute("DROP TABLE audit_log_unpartitioned")
+
+
+def _downgrade_postgresql() -> None:
+    op.execute("ALTER TABLE audit_log RENAME TO audit_log_partitioned")
+    op.execute(
+        "ALTER TABLE audit_log_partitioned "
+        "RENAME CONSTRAINT audit_log_pkey TO audit_log_partitioned_pkey"
+    )
+    op.execute("ALTER INDEX ix_audit_log_actor_id_created_at RENAME TO ix_audit_log_partitioned_actor")
+    op.execute("ALTER INDEX ix_audit_log_action_created_at RENAME TO ix_audit_log_partitioned_action")
+    op.execute("ALTER SEQUENCE audit_log_id_seq OWNED BY NONE")
+    op.create_table(
+        "audit_log",
+        *_audit_columns(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute("ALTER TABLE audit_log ALTER COLUMN id SET DEFAULT nextval('audit_log_id_seq')")
+    op.execute("ALTER TABLE audit_log ALTER COLUMN created_at SET DEFAULT now()")
+    op.execute("ALTER SEQUENCE audit_log_id_seq OWNED BY audit_log.id")
+    op.execute(f"INSERT INTO audit_log ({_COLUMNS}) SELECT {_COLUMNS} FROM audit_log_partitioned")
+    op.execute("DROP TABLE audit_log_partitioned CASCADE")
+    op.create_index("ix_audit_log_action", "audit_log", ["action"])
+    op.create_index("ix_audit_log_actor_id", "audit_log", ["actor_id"])
+
+
+def _upgrade_per_table() -> None:
+    bind = op.get_bind()
+    months = bind.execute(
+        sa.text("SELECT DISTINCT strftime('%Y%m', created_at) FROM audit_log")
+    ).scalars()
+    for month in list(months):
+        table = f"audit_log_p{month}"
+        op.create_table(table, *_audit_columns(), sa.PrimaryKeyConstraint("id"))
+        _create_composite_indexes(table)
+        op.execute(
+            f"INSERT INTO {table} ({_DATA_COLUMNS}) SELECT {_DATA_COLUMNS} FROM audit_log "
+            f"WHERE strftime('%Y%m', created_at) = '{month}' ORDER BY created_at, id"
+        )
+    op.execute("DELETE FROM audit_log")
+    op.drop_index("ix_audit_log_actor_id", table_name="audit_log")
+    op.drop_index("ix_audit_log_action", table_name="audit_log")
+    _create_composite_indexes("audit_log")
+
+
+def _downgrade_per_table() -> None:
+    bind = op.get_bind()
+    tables = sorted(
+        name
+        for name in sa.inspect(bind).get_table_names()
+        if name.startswith("audit_log_p") and name[len("audit_log_p"):].isdigit()
+    )
+    for table in tables:
+        op.execute(
+            f"INSERT INTO audit_log ({_DATA_COLUMNS}) SELECT {_DATA_COLUMNS} FROM {table} "
+            "ORDER BY created_at, id"
+        )
+        _drop_composite_indexes(table)
+        op.drop_table(table)
+    _drop_composite_indexes("audit_log")
+    op.create_index("ix_audit_log_action", "audit_log", ["action"])
+    op.create_index("ix_audit_log_actor_id", "audit_log", ["actor_id"])
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _upgrade_postgresql()
+    else:
+        _upgrade_per_table()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _downgrade_postgresql()
+    else:
+        _downgrade_per_table()
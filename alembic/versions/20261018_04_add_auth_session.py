@@ -0,0 +1,39 @@
+"""add auth_session
+
+Revision ID: 20261018_04
+Revises: 20261018_03
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_04"
+down_revision = "20261018_03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "auth_session",
+        sa.Column("session_id", sa.String(length=64), nullable=False),
+        sa.Column("user_id", sa.String(length=255), nullable=True),
+        sa.Column("roles", sa.Text(), nullable=False),
+        sa.Column("roles_version", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.Float(), nullable=False),
+        sa.Column("expires_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("session_id"),
+    )
+    op.create_index("ix_auth_session_user_id", "auth_session", ["user_id"])
+    op.create_index("ix_auth_session_expires_at", "auth_session", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_auth_session_expires_at", table_name="auth_session")
+    op.drop_index("ix_auth_session_user_id", table_name="auth_session")
+    op.drop_table("auth_session")
@@ -0,0 +1,43 @@
+"""add auth_session_revocation and auth_revocation_epoch
+
+Revision ID: 20261018_05
+Revises: 20261018_04
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_05"
+down_revision = "20261018_04"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "auth_session_revocation",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("session_id", sa.String(length=64), nullable=False),
+        sa.Column("expires_at", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_auth_session_revocation_expires_at", "auth_session_revocation", ["expires_at"]
+    )
+    op.create_table(
+        "auth_revocation_epoch",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("epoch", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("auth_revocation_epoch")
+    op.drop_index("ix_auth_session_revocation_expires_at", table_name="auth_session_revocation")
+    op.drop_table("auth_session_revocation")
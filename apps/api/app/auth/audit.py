@@ -0,0 +1,241 @@
+"""Buffered, batched writer for ``audit_log`` rows.
+
+Request handlers hand records to ``AuditSink.submit``, which only appends to a
+bounded in-memory buffer. A background thread drains the buffer with bulk
+inserts through ``AuditLogStore``, either once ``batch_size`` records are
+waiting or every ``flush_interval`` seconds, so auth endpoints never pay a
+database round-trip per action. When the buffer is full the ``overflow`` policy decides between
+blocking the producer for up to ``block_timeout`` seconds (backpressure),
+dropping the new record, or dropping the oldest buffered one.
+
+A batch whose insert fails is put back at the front of the buffer and retried
+after ``retry_delay`` seconds, up to ``max_retries`` times before it is logged
+and dropped. If putting it back overflows the buffer, the overflow policy
+picks what to drop: ``drop_oldest`` drops the oldest of the failed records,
+the other policies the newest buffered ones. ``close`` drains everything that
+is still buffered; ``auth_lifespan`` calls it on shutdown.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Literal
+
+from fastapi import Request
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["block", "drop_newest", "drop_oldest"]
+
+DEFAULT_MAX_BUFFERED = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 0.05
+DEFAULT_BLOCK_TIMEOUT = 0.1
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_DELAY = 0.5
+
+_AUDIT_COLUMNS = (
+    "action",
+    "actor_id",
+    "method",
+    "path",
+    "client_ip",
+    "user_agent",
+    "details",
+    "created_at",
+)
+
+
+@dataclass
+class AuditSinkStats:
+    submitted: int = 0
+    written: int = 0
+    dropped: int = 0
+    failed: int = 0
+    retried: int = 0
+    batches: int = 0
+
+
+def audit_row(record: dict[str, Any], *, created_at: datetime | None = None) -> dict[str, Any]:
+    """Map a ``build_audit_record`` dict onto ``audit_log`` columns."""
+    row = {column: record.get(column) for column in _AUDIT_COLUMNS}
+    if row["created_at"] is None:
+        row["created_at"] = created_at or datetime.now(UTC)
+    return row
+
+
+class AuditSink:
+    """Bounded audit buffer flushed to ``audit_log`` in bulk by a writer thread."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        max_buffered: int = DEFAULT_MAX_BUFFERED,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        overflow: OverflowPolicy = "block",
+        block_timeout: float = DEFAULT_BLOCK_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> None:
+        if max_buffered < 1 or batch_size < 1:
+            raise ValueError("max_buffered and batch_size must be positive")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        if overflow not in ("block", "drop_newest", "drop_oldest"):
+            raise ValueError(f"unknown overflow policy: {overflow!r}")
+        # Imported here so that importing the auth routes does not load SQLAlchemy.
+        from .audit_store import AuditLogStore
+
+        self._store = AuditLogStore(engine)
+        self._max_buffered = max_buffered
+        self._batch_size = batch_size
+        self._interval = flush_interval
+        self._overflow = overflow
+        self._block_timeout = block_timeout
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._failures = 0
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._stopping = False
+        self._writer: threading.Thread | None = None
+        self.stats = AuditSinkStats()
+
+    def submit(self, record: dict[str, Any]) -> bool:
+        """Buffer ``record`` for writing. Returns False if it was dropped."""
+        row = audit_row(record)
+        with self._condition:
+            if len(self._buffer) >= self._max_buffered:
+                if self._overflow == "drop_oldest":
+                    self._buffer.popleft()
+                    self.stats.dropped += 1
+                elif self._overflow == "drop_newest" or not self._condition.wait_for(
+                    lambda: len(self._buffer) < self._max_buffered, self._block_timeout
+                ):
+                    self.stats.dropped += 1
+                    return False
+            self._buffer.append(row)
+            self.stats.submitted += 1
+            if len(self._buffer) >= self._batch_size:
+                self._condition.notify_all()
+            return True
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """Write everything buffered so far from the calling thread."""
+        written = 0
+        while batch := self._take_batch():
+            if self._write(batch):
+                written += len(batch)
+            elif self.pending_count():
+                time.sleep(self._retry_delay)
+        return written
+
+    def start(self) -> None:
+        if self._writer is not None:
+            return
+        with self._condition:
+            self._stopping = False
+        self._writer = threading.Thread(target=self._run, name="audit-sink-writer", daemon=True)
+        self._writer.start()
+
+    def close(self) -> None:
+        """Stop the writer thread and drain the buffer."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self.flush()
+
+    def __enter__(self) -> AuditSink:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        with self._condition:
+            count = min(self._batch_size, len(self._buffer))
+            batch = [self._buffer.popleft() for _ in range(count)]
+            if batch:
+                self._condition.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopping or len(self._buffer) >= self._batch_size,
+                    self._interval,
+                )
+                if self._stopping:
+                    return
+            while batch := self._take_batch():
+                if not self._write(batch):
+                    with self._condition:
+                        self._condition.wait_for(lambda: self._stopping, self._retry_delay)
+                    break
+                if self.pending_count() < self._batch_size:
+                    break
+
+    def _write(self, batch: list[dict[str, Any]]) -> bool:
+        """Insert ``batch``; on failure put it back for a retry or drop it."""
+        with self._write_lock:
+            try:
+                self._store.insert(batch)
+            except Exception:
+                self._failures += 1
+                if self._failures > self._max_retries:
+                    logger.exception(
+                        "dropping %d audit records after %d failed writes",
+                        len(batch),
+                        self._failures,
+                    )
+                    self._failures = 0
+                    self.stats.failed += len(batch)
+                else:
+                    logger.warning(
+                        "failed to write %d audit records, will retry", len(batch), exc_info=True
+                    )
+                    self._requeue(batch)
+                return False
+            self._failures = 0
+        self.stats.written += len(batch)
+        self.stats.batches += 1
+        return True
+
+    def _requeue(self, batch: list[dict[str, Any]]) -> None:
+        with self._condition:
+            excess = len(self._buffer) + len(batch) - self._max_buffered
+            if excess > 0:
+                if self._overflow == "drop_oldest":
+                    batch = batch[excess:]
+                else:
+                    for _ in range(excess):
+                        self._buffer.pop()
+                self.stats.dropped += excess
+            self._buffer.extendleft(reversed(batch))
+            self.stats.retried += len(batch)
+
+
+def get_audit_sink(request: Request) -> AuditSink | None:
+    """FastAPI dependency returning the sink stored on ``app.state.audit_sink``."""
+    sink: AuditSink | None = getattr(request.app.state, "audit_sink", None)
+    return sink
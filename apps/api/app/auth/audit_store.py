@@ -0,0 +1,302 @@
+"""Month-partitioned ``audit_log`` storage, keyset queries and retention.
+
+On Postgres ``audit_log`` is a native ``PARTITION BY RANGE (created_at)``
+table (see the ``20261018_03`` migration) with one ``audit_log_pYYYYMM``
+partition per month, so range filters on ``created_at`` prune to the relevant
+months. Other dialects (SQLite in tests and local runs) get the same layout
+as one ordinary table per month, and this module routes inserts and queries
+to those tables itself.
+
+Queries page with a ``(created_at, id)`` keyset cursor instead of ``OFFSET``,
+served by the ``(actor_id, created_at, id)`` and ``(action, created_at, id)``
+indexes. Retention drops whole partitions rather than deleting rows.
+"""
+
+from __future__ import annotations
+
+import base64
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Engine,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    inspect,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..db.models import AuditLog
+
+PARTITION_PREFIX = "audit_log_p"
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MONTHS_AHEAD = 2
+
+_AUDIT_LOG: Table = AuditLog.__table__  # type: ignore[assignment]
+_PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{4}})(\d{{2}})$")
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Naive datetimes (as SQLite returns them) are taken to be UTC."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC)
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant (UTC) of the month containing ``moment``."""
+    moment = _as_utc(moment)
+    return datetime(moment.year, moment.month, 1, tzinfo=UTC)
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + count
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def _partition_month(name: str) -> datetime | None:
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=UTC)
+
+
+def _partition_table(name: str) -> Table:
+    """A standalone monthly table mirroring ``AuditLog`` (non-Postgres fallback)."""
+    return Table(
+        name,
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        Column("action", String(128), nullable=False),
+        Column("actor_id", String(255), nullable=True),
+        Column("method", String(16), nullable=False),
+        Column("path", String(1024), nullable=False),
+        Column("client_ip", String(64), nullable=True),
+        Column("user_agent", String(1024), nullable=True),
+        Column("details", Text, nullable=True),
+        Column("created_at", DateTime(timezone=True), nullable=False),
+        Index(f"ix_{name}_actor_id_created_at", "actor_id", "created_at", "id"),
+        Index(f"ix_{name}_action_created_at", "action", "created_at", "id"),
+    )
+
+
+@dataclass(frozen=True)
+class AuditCursor:
+    """Position after the last row of a page; rows are ordered newest first."""
+
+    created_at: datetime
+    id: int
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> AuditCursor:
+        try:
+            created_at, _, row_id = base64.urlsafe_b64decode(token).decode().partition("|")
+            return cls(datetime.fromisoformat(created_at), int(row_id))
+        except ValueError as exc:
+            raise ValueError("invalid audit cursor") from exc
+
+
+@dataclass(frozen=True)
+class AuditPage:
+    rows: list[dict[str, Any]]
+    next_cursor: AuditCursor | None
+
+
+class AuditLogStore:
+    """Partition-aware access to ``audit_log``."""
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self.native_partitions = engine.dialect.name == "postgresql"
+        self._known: set[str] = set()
+        self._tables: dict[str, Table] = {}
+
+    def partitions(self) -> dict[datetime, str]:
+        """Existing monthly partitions keyed by month start, oldest first."""
+        if self.native_partitions:
+            statement = text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "WHERE parent.relname = 'audit_log'"
+            )
+            with self._engine.connect() as connection:
+                names = list(connection.execute(statement).scalars())
+        else:
+            names = inspect(self._engine).get_table_names()
+        found = {}
+        for name in names:
+            month = _partition_month(name)
+            if month is not None:
+                found[month] = name
+        return dict(sorted(found.items()))
+
+    def ensure_partitions(self, start: datetime, end: datetime) -> list[str]:
+        """Create partitions for every month from ``start`` through ``end``."""
+        month, last = month_start(start), month_start(end)
+        created = []
+        with self._engine.begin() as connection:
+            while month <= last:
+                name = partition_name(month)
+                if name not in self._known:
+                    if self.native_partitions:
+                        connection.execute(
+                            text(
+                                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF audit_log '
+                                f"FOR VALUES FROM ('{month.isoformat()}') "
+                                f"TO ('{add_months(month, 1).isoformat()}')"
+                            )
+                        )
+                    else:
+                        self._table(name).create(connection, checkfirst=True)
+                    self._known.add(name)
+                    created.append(name)
+                month = add_months(month, 1)
+        return created
+
+    def insert(self, rows: Iterable[dict[str, Any]]) -> int:
+        """Bulk insert audit rows; each must carry ``created_at``."""
+        by_month: dict[datetime, list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            by_month[month_start(row["created_at"])].append(row)
+        if not by_month:
+            return 0
+        self.ensure_partitions(min(by_month), max(by_month))
+        with self._engine.begin() as connection:
+            if self.native_partitions:
+                connection.execute(
+                    _AUDIT_LOG.insert(), [row for batch in by_month.values() for row in batch]
+                )
+            else:
+                for month, batch in by_month.items():
+                    connection.execute(self._table(partition_name(month)).insert(), batch)
+        return sum(len(batch) for batch in by_month.values())
+
+    def query(
+        self,
+        *,
+        actor_id: str | None = None,
+        action: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: AuditCursor | None = None,
+    ) -> AuditPage:
+        """Return up to ``limit`` rows newest first, continuing after ``after``.
+
+        ``since`` is inclusive and ``until`` exclusive.
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        if self.native_partitions:
+            tables = [_AUDIT_LOG]
+        else:
+            tables = self._fallback_tables(since, until, after)
+
+        rows: list[dict[str, Any]] = []
+        for table in tables:
+            conditions: list[ColumnElement[bool]] = []
+            if actor_id is not None:
+                conditions.append(table.c.actor_id == actor_id)
+            if action is not None:
+                conditions.append(table.c.action == action)
+            if since is not None:
+                conditions.append(table.c.created_at >= since)
+            if until is not None:
+                conditions.append(table.c.created_at < until)
+            if after is not None:
+                conditions.append(
+                    tuple_(table.c.created_at, table.c.id) < tuple_(after.created_at, after.id)
+                )
+            statement = (
+                select(table)
+                .where(*conditions)
+                .order_by(table.c.created_at.desc(), table.c.id.desc())
+                .limit(limit + 1 - len(rows))
+            )
+            with self._engine.connect() as connection:
+                rows.extend(dict(row) for row in connection.execute(statement).mappings())
+            if len(rows) > limit:
+                break
+
+        if len(rows) <= limit:
+            return AuditPage(rows, None)
+        rows = rows[:limit]
+        return AuditPage(rows, AuditCursor(rows[-1]["created_at"], rows[-1]["id"]))
+
+    def _table(self, name: str) -> Table:
+        table = self._tables.get(name)
+        if table is None:
+            table = self._tables[name] = _partition_table(name)
+        return table
+
+    def _fallback_tables(
+        self, since: datetime | None, until: datetime | None, after: AuditCursor | None
+    ) -> list[Table]:
+        """Partitions that can hold matching rows, newest first."""
+        lower = month_start(since) if since is not None else None
+        bounds = [month_start(bound) for bound in (until, after and after.created_at) if bound]
+        upper = min(bounds) if bounds else None
+        return [
+            self._table(name)
+            for month, name in reversed(self.partitions().items())
+            if (lower is None or month >= lower) and (upper is None or month <= upper)
+        ]
+
+    def drop_partitions_before(self, cutoff: datetime) -> list[str]:
+        """Drop every partition whose whole month lies before ``cutoff``."""
+        cutoff = _as_utc(cutoff)
+        dropped = []
+        with self._engine.begin() as connection:
+            for month, name in self.partitions().items():
+                if add_months(month, 1) > cutoff:
+                    break
+                if self.native_partitions:
+                    connection.execute(text(f'ALTER TABLE audit_log DETACH PARTITION "{name}"'))
+                connection.execute(text(f'DROP TABLE "{name}"'))
+                self._known.discard(name)
+                self._tables.pop(name, None)
+                dropped.append(name)
+        return dropped
+
+
+def run_audit_retention(
+    engine: Engine,
+    *,
+    retain_months: int,
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+    now: datetime | None = None,
+) -> list[str]:
+    """Maintenance job: pre-create upcoming partitions and drop expired ones.
+
+    Keeps the current month plus ``retain_months`` full months before it and
+    returns the names of the dropped partitions.
+    """
+    if retain_months < 0:
+        raise ValueError("retain_months must not be negative")
+    current = month_start(now or datetime.now(UTC))
+    store = AuditLogStore(engine)
+    store.ensure_partitions(current, add_months(current, months_ahead))
+    return store.drop_partitions_before(add_months(current, -retain_months))
+
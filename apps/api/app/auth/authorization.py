@@ -0,0 +1,198 @@
+"""Per-session authorization decisions backed by ``PolicyEngine``.
+
+``Authorizer`` resolves a session's roles and evaluates the policy once per
+``(session_id, role-set version, action)``; repeated checks on hot endpoints
+are answered from ``DecisionCache``. Changing a session's roles bumps its
+role-set version, and ``Authorizer.replace_policy`` bumps the cache's policy
+version, which drops every cached decision at once.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from fastapi import Depends, HTTPException, Request, status
+from packages.instrumentation import counter
+from packages.policy.policy import PolicyEngine
+
+from .session import SESSION_COOKIE_NAME
+
+DECISION_CACHE_MAX_ENTRIES = 65_536
+DECISION_CACHE_TTL_SECONDS = 60.0
+
+DecisionKey = tuple[str, int, str]
+
+_DECISIONS = counter(
+    "authorization_decisions_total",
+    "Authorization decisions, by outcome and whether the decision cache answered.",
+)
+
+
+@dataclass(frozen=True)
+class SessionRoles:
+    """Roles granted to a session; ``version`` changes whenever ``roles`` does."""
+
+    roles: frozenset[str]
+    version: int = 0
+
+
+RoleResolver = Callable[[str], SessionRoles | None]
+
+
+@dataclass(frozen=True)
+class DecisionCacheStats:
+    hits: int
+    misses: int
+    size: int
+    version: int
+
+
+class DecisionCache:
+    """Bounded LRU of allow/deny decisions with per-entry TTL and a policy version."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DECISION_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DECISION_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[DecisionKey, tuple[float, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: DecisionKey) -> bool | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: DecisionKey, allowed: bool, *, version: int) -> None:
+        """Store a decision computed under policy ``version``; stale ones are ignored."""
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            if version != self.version:
+                return
+            self._entries[key] = (self._clock() + self._ttl, allowed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> int:
+        """Drop every decision and return the new policy version."""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+            return self.version
+
+    def stats(self) -> DecisionCacheStats:
+        with self._lock:
+            return DecisionCacheStats(self.hits, self.misses, len(self._entries), self.version)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Authorizer:
+    """Answer "may this session perform this action" with cached decisions."""
+
+    def __init__(
+        self,
+        policy: PolicyEngine,
+        resolve_roles: RoleResolver,
+        *,
+        cache: DecisionCache | None = None,
+    ) -> None:
+        self._policy = policy
+        self._resolve_roles = resolve_roles
+        self.cache = cache if cache is not None else DecisionCache()
+
+    def replace_policy(self, policy: PolicyEngine) -> None:
+        """Swap in a recompiled permission table and invalidate all decisions."""
+        self._policy = policy
+        self.cache.invalidate()
+
+    def is_allowed(self, session_id: str, action: str) -> bool:
+        session_roles = self._resolve_roles(session_id)
+        if session_roles is None:
+            return False
+        return self._decide(session_id, session_roles, action)
+
+    def check_many(self, session_id: str, actions: Iterable[str]) -> list[bool]:
+        session_roles = self._resolve_roles(session_id)
+        if session_roles is None:
+            return [False for _ in actions]
+        return [self._decide(session_id, session_roles, action) for action in actions]
+
+    def _decide(self, session_id: str, session_roles: SessionRoles, action: str) -> bool:
+        key = (session_id, session_roles.version, action)
+        allowed = self.cache.get(key)
+        source = "cache"
+        if allowed is None:
+            version, policy = self.cache.version, self._policy
+            allowed = any(policy.is_allowed(role, action) for role in session_roles.roles)
+            self.cache.put(key, allowed, version=version)
+            source = "policy"
+        if _DECISIONS.enabled:
+            _DECISIONS.inc(result="allow" if allowed else "deny", source=source)
+        return allowed
+
+
+@dataclass(frozen=True)
+class SessionDecisions:
+    """An ``Authorizer`` bound to the current request's session."""
+
+    authorizer: Authorizer
+    session_id: str | None
+
+    def allowed(self, action: str) -> bool:
+        if self.session_id is None:
+            return False
+        return self.authorizer.is_allowed(self.session_id, action)
+
+    def check_many(self, actions: Iterable[str]) -> list[bool]:
+        if self.session_id is None:
+            return [False for _ in actions]
+        return self.authorizer.check_many(self.session_id, actions)
+
+
+def get_authorizer(request: Request) -> Authorizer:
+    """FastAPI dependency returning the ``Authorizer`` on ``app.state.authorizer``."""
+    authorizer: Authorizer | None = getattr(request.app.state, "authorizer", None)
+    if authorizer is None:
+        raise RuntimeError("app.state.authorizer is not configured")
+    return authorizer
+
+
+def get_session_decisions(
+    request: Request, authorizer: Authorizer = Depends(get_authorizer)
+) -> SessionDecisions:
+    return SessionDecisions(authorizer, request.cookies.get(SESSION_COOKIE_NAME))
+
+
+def require_action(action: str) -> Callable[[SessionDecisions], None]:
+    """Dependency factory rejecting the request with 403 unless ``action`` is allowed."""
+
+    def dependency(decisions: SessionDecisions = Depends(get_session_decisions)) -> None:
+        if not decisions.allowed(action):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+    return dependency
@@ -0,0 +1,47 @@
+"""Run the auth components' background work for the lifetime of the app.
+
+``auth_lifespan`` is a FastAPI lifespan handler. On startup it starts the
+background thread of every auth component configured on ``app.state``; on
+shutdown it closes them in reverse order, which also flushes whatever they
+still hold in memory::
+
+    app = FastAPI(lifespan=auth_lifespan)
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Protocol
+
+from fastapi import FastAPI
+
+
+class BackgroundComponent(Protocol):
+    def start(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def background_components(app: FastAPI) -> list[BackgroundComponent]:
+    """The configured components with background work, in start order."""
+    state: Any = app.state
+    components: list[BackgroundComponent | None] = [
+        getattr(state, "audit_sink", None),
+        getattr(getattr(state, "session_tokens", None), "revocations", None),
+    ]
+    return [component for component in components if component is not None]
+
+
+@asynccontextmanager
+async def auth_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    components = background_components(app)
+    started: list[BackgroundComponent] = []
+    try:
+        for component in components:
+            component.start()
+            started.append(component)
+        yield
+    finally:
+        for component in reversed(started):
+            component.close()
@@ -0,0 +1,269 @@
+"""Read-through MSAL token cache store backed by the ``msal_cache`` table.
+
+Decrypted caches are kept in a per-process LRU so repeated Graph calls for the
+same user skip the row load, decryption and deserialisation. Writes happen only
+when MSAL reports ``has_state_changed``, and bursts of changes to one
+``cache_key`` are coalesced into a single write after ``coalesce_window``
+seconds. Each write is guarded by the ``updated_at`` value last seen, so a
+concurrent writer in another process wins instead of being silently
+overwritten; the local entry is then dropped and reloaded on next use.
+
+Database reads and writes, decryption and deserialisation run outside the
+store-wide lock, under a lock striped by ``cache_key``, so concurrent misses
+for one key load the row once while other keys proceed independently.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Protocol
+
+from sqlalchemy import Engine, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from ..db.models import MsalCache
+from .msal_store import decrypt_blob, encrypt_blob
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_COALESCE_WINDOW = 0.25
+KEY_LOCK_STRIPES = 64
+
+
+class SerializableTokenCache(Protocol):
+    """The subset of ``msal.SerializableTokenCache`` used by the store."""
+
+    has_state_changed: bool
+
+    def serialize(self) -> str: ...
+
+    def deserialize(self, state: str | None) -> None: ...
+
+
+def _msal_cache_factory() -> SerializableTokenCache:
+    import msal  # type: ignore[import-not-found]
+
+    cache: SerializableTokenCache = msal.SerializableTokenCache()
+    return cache
+
+
+@dataclass
+class _Entry:
+    user_id: str
+    cache: SerializableTokenCache
+    version: datetime | None
+    loaded_at: float
+    dirty_since: float | None = None
+
+
+@dataclass
+class CacheStoreStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    coalesced: int = 0
+    conflicts: int = 0
+
+
+class MsalTokenCacheStore:
+    """Per-process LRU of decrypted MSAL caches with coalesced, versioned writes."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        cache_factory: Callable[[], SerializableTokenCache] = _msal_cache_factory,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._engine = engine
+        self._cache_factory = cache_factory
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._window = coalesce_window
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        # ``_lock`` only guards the LRU and stats; row reads and writes run
+        # under a per-key lock so one user's miss or flush never waits on another's.
+        self._lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(KEY_LOCK_STRIPES)]
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self.stats = CacheStoreStats()
+
+    def load(self, user_id: str, cache_key: str) -> SerializableTokenCache:
+        """Return the token cache for ``cache_key``, reading the row only on a miss."""
+        entry = self._lookup(cache_key)
+        if entry is not None:
+            return entry.cache
+        with self._key_lock(cache_key):
+            # Another thread may have loaded the key while this one waited.
+            entry = self._lookup(cache_key)
+            if entry is not None:
+                return entry.cache
+            with self._lock:
+                self.stats.misses += 1
+            with self._engine.connect() as connection:
+                row = connection.execute(
+                    select(MsalCache.encrypted_blob, MsalCache.updated_at).where(
+                        MsalCache.cache_key == cache_key
+                    )
+                ).first()
+            cache = self._cache_factory()
+            version: datetime | None = None
+            if row is not None:
+                cache.deserialize(decrypt_blob(row.encrypted_blob).decode("utf-8"))
+                version = row.updated_at
+            cache.has_state_changed = False
+            with self._lock:
+                self._entries[cache_key] = _Entry(user_id, cache, version, self._clock())
+                self._entries.move_to_end(cache_key)
+        self._evict()
+        return cache
+
+    def save(self, cache_key: str) -> None:
+        """Record that MSAL may have changed the cache; writes are coalesced."""
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None or not entry.cache.has_state_changed:
+                return
+            now = self._clock()
+            if entry.dirty_since is None:
+                entry.dirty_since = now
+            else:
+                self.stats.coalesced += 1
+            if now - entry.dirty_since < self._window:
+                return
+        with self._key_lock(cache_key):
+            self._write(cache_key, entry)
+
+    def flush(self, *, due_only: bool = False) -> int:
+        """Write pending changes (only those past the window if ``due_only``)."""
+        with self._lock:
+            now = self._clock()
+            pending = [
+                (cache_key, entry)
+                for cache_key, entry in self._entries.items()
+                if entry.dirty_since is not None
+                and not (due_only and now - entry.dirty_since < self._window)
+            ]
+        written = 0
+        for cache_key, entry in pending:
+            with self._key_lock(cache_key):
+                written += self._write(cache_key, entry)
+        return written
+
+    def start(self) -> None:
+        """Flush due writes from a background thread every ``coalesce_window``."""
+        if self._flusher is not None:
+            return
+        self._stop.clear()
+        self._flusher = threading.Thread(
+            target=self._run, name="msal-cache-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._window):
+            try:
+                self.flush(due_only=True)
+            except Exception:
+                logger.exception("msal cache flush failed")
+
+    def _lookup(self, cache_key: str) -> _Entry | None:
+        """The cached entry if it can be served without a read; counts a hit."""
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None or (
+                entry.dirty_since is None and self._clock() - entry.loaded_at >= self._ttl
+            ):
+                return None
+            self._entries.move_to_end(cache_key)
+            self.stats.hits += 1
+            return entry
+
+    def _key_lock(self, cache_key: str) -> threading.Lock:
+        return self._key_locks[hash(cache_key) % len(self._key_locks)]
+
+    def _evict(self) -> None:
+        while True:
+            with self._lock:
+                if len(self._entries) <= self._max_entries:
+                    return
+                cache_key, entry = next(iter(self._entries.items()))
+                if entry.dirty_since is None:
+                    del self._entries[cache_key]
+                    continue
+            with self._key_lock(cache_key):
+                self._write(cache_key, entry)
+            with self._lock:
+                if self._entries.get(cache_key) is entry and entry.dirty_since is None:
+                    del self._entries[cache_key]
+
+    def _write(self, cache_key: str, entry: _Entry) -> int:
+        """Write ``entry`` if it is still dirty; the caller holds its key lock.
+
+        The dirty state is cleared only once the row is written, so a failed
+        write leaves the changes pending for the next save or flush. Changes
+        MSAL makes while the write is in flight keep the entry dirty.
+        """
+        with self._lock:
+            if entry.dirty_since is None:
+                return 0
+        blob = encrypt_blob(entry.cache.serialize().encode("utf-8"))
+        entry.cache.has_state_changed = False
+        version = datetime.now(UTC)
+        try:
+            with self._engine.begin() as connection:
+                if entry.version is None:
+                    connection.execute(
+                        insert(MsalCache).values(
+                            user_id=entry.user_id,
+                            cache_key=cache_key,
+                            encrypted_blob=blob,
+                            updated_at=version,
+                        )
+                    )
+                    written = 1
+                else:
+                    written = connection.execute(
+                        update(MsalCache)
+                        .where(
+                            MsalCache.cache_key == cache_key,
+                            MsalCache.updated_at == entry.version,
+                        )
+                        .values(encrypted_blob=blob, updated_at=version)
+                    ).rowcount
+        except IntegrityError:
+            written = 0
+        except BaseException:
+            entry.cache.has_state_changed = True
+            raise
+        with self._lock:
+            if not written:
+                self.stats.conflicts += 1
+                if self._entries.get(cache_key) is entry:
+                    del self._entries[cache_key]
+                return 0
+            entry.version = version
+            if not entry.cache.has_state_changed:
+                entry.dirty_since = None
+            self.stats.writes += 1
+            return 1
@@ -0,0 +1,57 @@
+"""Background re-encoding of legacy v1 MSAL cache envelopes to the v2 format.
+
+Rows are processed in id order with keyset pagination, one short transaction
+per batch. Each update is a compare-and-swap on the old blob, so a concurrent
+cache write is never overwritten with stale content.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Engine, select, update
+
+from ..db.models import MsalCache
+from .msal_store import is_legacy_envelope, reencode_v1_envelope
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def reencode_msal_cache_batch(
+    engine: Engine, *, after_id: int = 0, batch_size: int = DEFAULT_BATCH_SIZE
+) -> tuple[int, int | None]:
+    """Re-encode one batch of rows with ``id > after_id``.
+
+    Returns ``(converted, next_after_id)``; ``next_after_id`` is None when the
+    table has been fully scanned.
+    """
+    with engine.begin() as connection:
+        rows = connection.execute(
+            select(MsalCache.id, MsalCache.encrypted_blob)
+            .where(MsalCache.id > after_id)
+            .order_by(MsalCache.id)
+            .limit(batch_size)
+        ).all()
+        converted = 0
+        for row_id, blob in rows:
+            if not is_legacy_envelope(blob):
+                continue
+            result = connection.execute(
+                update(MsalCache)
+                .where(MsalCache.id == row_id, MsalCache.encrypted_blob == blob)
+                .values(encrypted_blob=reencode_v1_envelope(blob))
+            )
+            converted += result.rowcount
+    if len(rows) < batch_size:
+        return converted, None
+    return converted, rows[-1][0]
+
+
+def reencode_msal_cache(engine: Engine, *, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Re-encode every legacy envelope in ``msal_cache``. Returns the number converted."""
+    total = 0
+    after_id: int | None = 0
+    while after_id is not None:
+        converted, after_id = reencode_msal_cache_batch(
+            engine, after_id=after_id, batch_size=batch_size
+        )
+        total += converted
+    return total
@@ -4,6 +4,18 @@ Envelope encryption layout:
 - Generate a random data encryption key (DEK) per payload.
 - Encrypt plaintext with DEK using Fernet.
 - Encrypt DEK with APP_MASTER_KEY using Fernet.
+
+``encrypt_blob`` emits the compact v2 binary envelope; ``decrypt_blob`` also
+reads legacy v1 JSON envelopes, which ``reencode_v1_envelope`` converts to v2
+without touching key material.
+
+The master ``Fernet`` is cached per key value, and unwrapped DEKs are kept in a
+bounded, TTL-evicting cache keyed by the encrypted DEK, so repeated reads of the
+same blob skip the master unwrap. Changing APP_MASTER_KEY or calling
+``invalidate_key_caches`` drops both caches.
+
+``cryptography`` is imported on the first encrypt or unwrap rather than at
+module load, so importing this module costs nothing until a blob is touched.
 """
 
 from __future__ import annotations
@@ -11,20 +23,115 @@ from __future__ import annotations
 import base64
 import json
 import os
-from typing import Any
+import struct
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from packages.instrumentation import counter, histogram
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
 
-from cryptography.fernet import Fernet
+DEK_CACHE_MAX_ENTRIES = 4096
+DEK_CACHE_TTL_SECONDS = 300.0
+
+# v2 envelope: magic, version, raw encrypted-DEK length, raw ciphertext length,
+# followed by both Fernet tokens in raw (base64-decoded) form.
+_V2_MAGIC = b"ME"
+_V2_HEADER = struct.Struct(">2sBHI")
+
+_CRYPTO_SECONDS = histogram(
+    "msal_blob_crypto_seconds", "Wall time of MSAL cache envelope crypto, by operation."
+)
+_DEK_CACHE_LOOKUPS = counter(
+    "msal_dek_cache_lookups_total", "Unwrapped-DEK cache lookups, by result (hit or miss)."
+)
 
 
 class MissingMasterKeyError(RuntimeError):
     """Raised when APP_MASTER_KEY is not configured."""
 
 
+class DekCache:
+    """Bounded LRU of unwrapped DEK ``Fernet`` objects with per-entry TTL."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEK_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DEK_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str | bytes, tuple[float, Fernet]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, encrypted_dek: str | bytes) -> Fernet | None:
+        with self._lock:
+            entry = self._entries.get(encrypted_dek)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                del self._entries[encrypted_dek]
+                return None
+            self._entries.move_to_end(encrypted_dek)
+            return entry[1]
+
+    def put(self, encrypted_dek: str | bytes, dek_fernet: Fernet) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[encrypted_dek] = (self._clock() + self._ttl, dek_fernet)
+            self._entries.move_to_end(encrypted_dek)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_dek_cache = DekCache()
+_master_lock = threading.Lock()
+_master: tuple[str, Fernet] | None = None
+
+
+def invalidate_key_caches() -> None:
+    """Forget the cached master key and every unwrapped DEK.
+
+    Call this after rotating APP_MASTER_KEY out-of-band; a changed environment
+    value is also detected automatically on the next call.
+    """
+    global _master
+    with _master_lock:
+        _master = None
+        _dek_cache.clear()
+
+
 def _get_master_fernet() -> Fernet:
+    global _master
     key = os.getenv("APP_MASTER_KEY")
     if not key:
         raise MissingMasterKeyError("APP_MASTER_KEY is required for MSAL cache encryption")
-    return Fernet(key.encode("utf-8"))
+    cached = _master
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    from cryptography.fernet import Fernet
+
+    master = Fernet(key.encode("utf-8"))
+    with _master_lock:
+        if _master is None or _master[0] != key:
+            _dek_cache.clear()
+            _master = (key, master)
+    return master
 
 
 def _b64_encode(value: bytes) -> str:
@@ -35,34 +142,94 @@ def _b64_decode(value: str) -> bytes:
     return base64.urlsafe_b64decode(value.encode("ascii"))
 
 
-def encrypt_blob(payload: bytes) -> str:
-    """Encrypt bytes with envelope encryption and return a serialized token string."""
-    dek_key = Fernet.generate_key()
-    dek_fernet = Fernet(dek_key)
-    ciphertext = dek_fernet.encrypt(payload)
+def _token_to_raw(token: bytes) -> bytes:
+    return base64.urlsafe_b64decode(token)
+
+
+def _raw_to_token(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw)
+
+
+def _pack_v2(encrypted_dek_token: bytes, ciphertext_token: bytes) -> bytes:
+    raw_dek = _token_to_raw(encrypted_dek_token)
+    raw_ciphertext = _token_to_raw(ciphertext_token)
+    header = _V2_HEADER.pack(_V2_MAGIC, 2, len(raw_dek), len(raw_ciphertext))
+    return b"".join((header, raw_dek, raw_ciphertext))
+
+
+def _unpack_v2(blob: bytes) -> tuple[bytes, bytes]:
+    """Return the raw encrypted DEK and raw ciphertext of a v2 envelope."""
+    if len(blob) < _V2_HEADER.size:
+        raise ValueError("Truncated envelope")
+    _, version, dek_length, ciphertext_length = _V2_HEADER.unpack_from(blob)
+    if version != 2:
+        raise ValueError("Unsupported envelope version")
+    dek_end = _V2_HEADER.size + dek_length
+    if len(blob) != dek_end + ciphertext_length:
+        raise ValueError("Truncated envelope")
+    return blob[_V2_HEADER.size : dek_end], blob[dek_end:]
+
 
+def encrypt_blob(payload: bytes) -> bytes:
+    """Encrypt bytes with envelope encryption and return a v2 binary envelope."""
+    from cryptography.fernet import Fernet
+
+    with _CRYPTO_SECONDS.time(operation="encrypt"):
+        dek_key = Fernet.generate_key()
+        dek_fernet = Fernet(dek_key)
+        ciphertext = dek_fernet.encrypt(payload)
+
+        master = _get_master_fernet()
+        encrypted_dek = master.encrypt(dek_key)
+        return _pack_v2(encrypted_dek, ciphertext)
+
+
+def _dek_fernet(cache_key: str | bytes, encrypted_dek_token: Callable[[], bytes]) -> Fernet:
     master = _get_master_fernet()
-    encrypted_dek = master.encrypt(dek_key)
+    dek_fernet = _dek_cache.get(cache_key)
+    if dek_fernet is None:
+        _DEK_CACHE_LOOKUPS.inc(result="miss")
+        from cryptography.fernet import Fernet
+
+        dek_fernet = Fernet(master.decrypt(encrypted_dek_token()))
+        _dek_cache.put(cache_key, dek_fernet)
+    else:
+        _DEK_CACHE_LOOKUPS.inc(result="hit")
+    return dek_fernet
 
-    envelope: dict[str, Any] = {
-        "v": 1,
-        "alg": "fernet-envelope",
-        "edk": _b64_encode(encrypted_dek),
-        "ct": _b64_encode(ciphertext),
-    }
-    return json.dumps(envelope, separators=(",", ":"))
 
+def decrypt_blob(token: str | bytes) -> bytes:
+    """Decrypt a v2 binary envelope or a legacy v1 JSON envelope."""
+    with _CRYPTO_SECONDS.time(operation="decrypt"):
+        return _decrypt_blob(token)
+
+
+def _decrypt_blob(token: str | bytes) -> bytes:
+    if isinstance(token, bytes) and token[:2] == _V2_MAGIC:
+        raw_dek, raw_ciphertext = _unpack_v2(token)
+        dek_fernet = _dek_fernet(raw_dek, lambda: _raw_to_token(raw_dek))
+        return dek_fernet.decrypt(_raw_to_token(raw_ciphertext))
 
-def decrypt_blob(token: str) -> bytes:
-    """Decrypt a token string produced by ``encrypt_blob``."""
     envelope = json.loads(token)
     if envelope.get("v") != 1:
         raise ValueError("Unsupported envelope version")
 
-    master = _get_master_fernet()
-    encrypted_dek = _b64_decode(envelope["edk"])
-    dek_key = master.decrypt(encrypted_dek)
-
+    encoded_dek = envelope["edk"]
+    dek_fernet = _dek_fernet(encoded_dek, lambda: _b64_decode(encoded_dek))
     ciphertext = _b64_decode(envelope["ct"])
-    dek_fernet = Fernet(dek_key)
     return dek_fernet.decrypt(ciphertext)
+
+
+def is_legacy_envelope(token: str | bytes) -> bool:
+    return not (isinstance(token, bytes) and token[:2] == _V2_MAGIC)
+
+
+def reencode_v1_envelope(token: str | bytes) -> bytes:
+    """Convert a v1 JSON envelope to v2 without decrypting anything.
+
+    Both versions carry the same Fernet tokens, so no key material is needed.
+    """
+    envelope = json.loads(token)
+    if envelope.get("v") != 1:
+        raise ValueError("Unsupported envelope version")
+    return _pack_v2(_b64_decode(envelope["edk"]), _b64_decode(envelope["ct"]))
@@ -2,28 +2,65 @@ from __future__ import annotations
 
 import secrets
 
-from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from .session import build_audit_record, issue_session_cookies, verify_csrf
+from .audit import AuditSink, get_audit_sink
+from .session import (
+    DEFAULT_COOKIE_CONFIG,
+    SESSION_COOKIE_NAME,
+    build_audit_record,
+    issue_session_cookies,
+    verify_csrf,
+)
+from .session_store import SessionStore, get_session_store
+from .session_tokens import SessionTokenCodec, get_session_tokens, issue_signed_session_cookies
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/login")
-def login(response: Response) -> dict[str, str]:
+def login(
+    response: Response,
+    session_store: SessionStore | None = Depends(get_session_store),
+    session_tokens: SessionTokenCodec | None = Depends(get_session_tokens),
+) -> dict[str, str]:
     """Create a session and issue CSRF-safe cookies."""
-    session_id = secrets.token_urlsafe(32)
-    csrf_token = issue_session_cookies(response=response, session_id=session_id)
+    if session_tokens is not None:
+        return {"csrf_token": issue_signed_session_cookies(response, session_tokens)}
+    config = DEFAULT_COOKIE_CONFIG
+    if session_store is not None:
+        session_id = session_store.create().session_id
+        config = session_store.config
+    else:
+        session_id = secrets.token_urlsafe(32)
+    csrf_token = issue_session_cookies(response=response, session_id=session_id, config=config)
     return {"csrf_token": csrf_token}
 
 
 @router.post("/logout")
-def logout(request: Request, response: Response) -> dict[str, str]:
-    if not verify_csrf(request):
+def logout(
+    request: Request,
+    response: Response,
+    audit_sink: AuditSink | None = Depends(get_audit_sink),
+    session_store: SessionStore | None = Depends(get_session_store),
+    session_tokens: SessionTokenCodec | None = Depends(get_session_tokens),
+) -> dict[str, str]:
+    if session_tokens is not None:
+        csrf_ok = session_tokens.verify_csrf(request)
+    else:
+        csrf_ok = verify_csrf(request)
+    if not csrf_ok:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid CSRF token")
 
+    session_id = request.cookies.get(SESSION_COOKIE_NAME)
+    if session_tokens is not None and session_id:
+        session_tokens.revoke(session_id)
+    elif session_store is not None and session_id:
+        session_store.revoke(session_id)
+
     response.delete_cookie("session_id")
     response.delete_cookie("csrf_token")
 
-    _ = build_audit_record(request, action="auth.logout", actor_id=None)
+    if audit_sink is not None:
+        audit_sink.submit(build_audit_record(request, action="auth.logout", actor_id=None))
     return {"status": "ok"}
@@ -46,6 +46,32 @@ def issue_session_cookies(response: Response, session_id: str, config: CookieCon
     return csrf_token
 
 
+def refresh_session_cookies(
+    request: Request,
+    response: Response,
+    *,
+    max_age: int,
+    config: CookieConfig = DEFAULT_COOKIE_CONFIG,
+) -> None:
+    """Re-set the request's session and CSRF cookies with a new ``max_age``.
+
+    Called when the server extends a session, so the browser keeps the cookies
+    for as long as the session itself lives.
+    """
+    for key, httponly in ((SESSION_COOKIE_NAME, True), (CSRF_COOKIE_NAME, False)):
+        value = request.cookies.get(key)
+        if value is None:
+            continue
+        response.set_cookie(
+            key=key,
+            value=value,
+            httponly=httponly,
+            secure=config.secure,
+            samesite=config.same_site,  # type: ignore[arg-type]
+            max_age=max_age,
+        )
+
+
 def verify_csrf(request: Request) -> bool:
     """Double-submit CSRF verification."""
     cookie_token = request.cookies.get(CSRF_COOKIE_NAME)
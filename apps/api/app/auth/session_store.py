@@ -0,0 +1,333 @@
+"""Server-side session store with pluggable backends.
+
+``SessionStore`` issues session ids, validates them with sliding expiry and
+revokes them by primary key. Backends only store records:
+
+* ``InMemorySessionBackend`` - a dict plus an expiry heap, for single-process
+  deployments and tests;
+* ``SqlSessionBackend`` - the ``auth_session`` table on SQLite or Postgres;
+* ``ShardedSessionBackend`` - spreads sessions over several backends by a
+  stable hash of the session id.
+
+Validation is one keyed read. Expiry is only pushed forward once at least
+``touch_interval`` seconds of the window have been used, so a busy session
+costs one write per interval rather than one per request. Expired rows are
+removed lazily on lookup and in bounded batches by ``sweep``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import secrets
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Protocol
+
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from .authorization import SessionRoles
+from .session import (
+    DEFAULT_COOKIE_CONFIG,
+    SESSION_COOKIE_NAME,
+    CookieConfig,
+    refresh_session_cookies,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine, Table
+
+DEFAULT_TOUCH_INTERVAL = 60.0
+DEFAULT_SWEEP_BATCH = 1000
+
+
+@dataclass(frozen=True)
+class SessionRecord:
+    session_id: str
+    user_id: str | None
+    roles: frozenset[str]
+    created_at: float
+    expires_at: float
+    roles_version: int = 0
+
+
+class SessionBackend(Protocol):
+    def add(self, record: SessionRecord) -> None: ...
+
+    def get(self, session_id: str) -> SessionRecord | None: ...
+
+    def touch(self, session_id: str, expires_at: float) -> None:
+        """Move the expiry of an existing session."""
+        ...
+
+    def remove(self, session_id: str) -> bool:
+        """Delete one session by id. Returns False if it did not exist."""
+        ...
+
+    def sweep(self, now: float, limit: int) -> int:
+        """Delete up to ``limit`` sessions expired at ``now``; return how many."""
+        ...
+
+
+class InMemorySessionBackend:
+    """Thread-safe dict backend; ``sweep`` pops an expiry heap instead of scanning."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: dict[str, SessionRecord] = {}
+        self._expiry: list[tuple[float, str]] = []
+
+    def add(self, record: SessionRecord) -> None:
+        with self._lock:
+            self._records[record.session_id] = record
+            heapq.heappush(self._expiry, (record.expires_at, record.session_id))
+
+    def get(self, session_id: str) -> SessionRecord | None:
+        return self._records.get(session_id)
+
+    def touch(self, session_id: str, expires_at: float) -> None:
+        with self._lock:
+            record = self._records.get(session_id)
+            if record is not None:
+                self._records[session_id] = replace(record, expires_at=expires_at)
+
+    def remove(self, session_id: str) -> bool:
+        with self._lock:
+            return self._records.pop(session_id, None) is not None
+
+    def sweep(self, now: float, limit: int) -> int:
+        removed = 0
+        with self._lock:
+            while self._expiry and self._expiry[0][0] <= now and removed < limit:
+                _, session_id = heapq.heappop(self._expiry)
+                record = self._records.get(session_id)
+                if record is None:
+                    continue
+                if record.expires_at > now:
+                    heapq.heappush(self._expiry, (record.expires_at, session_id))
+                    continue
+                del self._records[session_id]
+                removed += 1
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class SqlSessionBackend:
+    """Sessions in the ``auth_session`` table, keyed by ``session_id``.
+
+    SQLAlchemy and the ORM models are imported when a backend is built, so the
+    auth routes and the in-memory backend do not load them.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        from ..db.models import AuthSession
+
+        self._engine = engine
+        self._table: Table = AuthSession.__table__  # type: ignore[assignment]
+
+    def add(self, record: SessionRecord) -> None:
+        from sqlalchemy import insert
+
+        with self._engine.begin() as connection:
+            connection.execute(
+                insert(self._table).values(
+                    session_id=record.session_id,
+                    user_id=record.user_id,
+                    roles=json.dumps(sorted(record.roles)),
+                    roles_version=record.roles_version,
+                    created_at=record.created_at,
+                    expires_at=record.expires_at,
+                )
+            )
+
+    def get(self, session_id: str) -> SessionRecord | None:
+        from sqlalchemy import select
+
+        table = self._table
+        with self._engine.connect() as connection:
+            row = connection.execute(select(table).where(table.c.session_id == session_id)).first()
+        if row is None:
+            return None
+        return SessionRecord(
+            session_id=row.session_id,
+            user_id=row.user_id,
+            roles=frozenset(json.loads(row.roles)),
+            created_at=row.created_at,
+            expires_at=row.expires_at,
+            roles_version=row.roles_version,
+        )
+
+    def touch(self, session_id: str, expires_at: float) -> None:
+        from sqlalchemy import update
+
+        table = self._table
+        with self._engine.begin() as connection:
+            connection.execute(
+                update(table).where(table.c.session_id == session_id).values(expires_at=expires_at)
+            )
+
+    def remove(self, session_id: str) -> bool:
+        from sqlalchemy import delete
+
+        table = self._table
+        with self._engine.begin() as connection:
+            result = connection.execute(delete(table).where(table.c.session_id == session_id))
+        return bool(result.rowcount)
+
+    def sweep(self, now: float, limit: int) -> int:
+        from sqlalchemy import delete, select
+
+        table = self._table
+        expired = select(table.c.session_id).where(table.c.expires_at <= now).limit(limit)
+        with self._engine.begin() as connection:
+            result = connection.execute(
+                delete(table).where(table.c.session_id.in_(expired), table.c.expires_at <= now)
+            )
+        return int(result.rowcount)
+
+
+class ShardedSessionBackend:
+    """Route each session to one of ``shards`` by CRC32 of its id."""
+
+    def __init__(self, shards: Sequence[SessionBackend]) -> None:
+        if not shards:
+            raise ValueError("at least one shard is required")
+        self._shards = tuple(shards)
+
+    def _shard(self, session_id: str) -> SessionBackend:
+        return self._shards[zlib.crc32(session_id.encode("utf-8")) % len(self._shards)]
+
+    def add(self, record: SessionRecord) -> None:
+        self._shard(record.session_id).add(record)
+
+    def get(self, session_id: str) -> SessionRecord | None:
+        return self._shard(session_id).get(session_id)
+
+    def touch(self, session_id: str, expires_at: float) -> None:
+        self._shard(session_id).touch(session_id, expires_at)
+
+    def remove(self, session_id: str) -> bool:
+        return self._shard(session_id).remove(session_id)
+
+    def sweep(self, now: float, limit: int) -> int:
+        removed = 0
+        for shard in self._shards:
+            if removed >= limit:
+                break
+            removed += shard.sweep(now, limit - removed)
+        return removed
+
+
+class SessionStore:
+    """Create, validate (with sliding expiry) and revoke sessions.
+
+    Sessions last ``config.session_max_age`` seconds, the same lifetime as the
+    cookies issued for them.
+    """
+
+    def __init__(
+        self,
+        backend: SessionBackend | None = None,
+        *,
+        config: CookieConfig = DEFAULT_COOKIE_CONFIG,
+        touch_interval: float = DEFAULT_TOUCH_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.backend: SessionBackend = backend or InMemorySessionBackend()
+        self.config = config
+        self._max_age = config.session_max_age
+        self._touch_interval = min(touch_interval, self._max_age)
+        self._clock = clock
+
+    def create(self, *, user_id: str | None = None, roles: Iterable[str] = ()) -> SessionRecord:
+        now = self._clock()
+        record = SessionRecord(
+            session_id=secrets.token_urlsafe(32),
+            user_id=user_id,
+            roles=frozenset(roles),
+            created_at=now,
+            expires_at=now + self._max_age,
+        )
+        self.backend.add(record)
+        return record
+
+    def validate(self, session_id: str) -> SessionRecord | None:
+        """Return the live session for ``session_id`` and slide its expiry."""
+        return self.validate_and_touch(session_id)[0]
+
+    def validate_and_touch(self, session_id: str) -> tuple[SessionRecord | None, bool]:
+        """Like ``validate``, also telling whether the expiry was just extended.
+
+        The session cookie was issued with the old lifetime, so a caller with
+        access to the response should reissue it when this is True.
+        """
+        record = self.backend.get(session_id)
+        if record is None:
+            return None, False
+        now = self._clock()
+        if record.expires_at <= now:
+            self.backend.remove(session_id)
+            return None, False
+        if record.expires_at - now <= self._max_age - self._touch_interval:
+            record = replace(record, expires_at=now + self._max_age)
+            self.backend.touch(session_id, record.expires_at)
+            return record, True
+        return record, False
+
+    def revoke(self, session_id: str) -> bool:
+        return self.backend.remove(session_id)
+
+    def sweep(
+        self, *, batch_size: int = DEFAULT_SWEEP_BATCH, max_batches: int | None = None
+    ) -> int:
+        """Delete expired sessions in batches of ``batch_size``."""
+        now = self._clock()
+        removed = batches = 0
+        while max_batches is None or batches < max_batches:
+            count = self.backend.sweep(now, batch_size)
+            removed += count
+            batches += 1
+            if count < batch_size:
+                break
+        return removed
+
+    def roles(self, session_id: str) -> SessionRoles | None:
+        """``RoleResolver`` for ``Authorizer``."""
+        record = self.validate(session_id)
+        if record is None:
+            return None
+        return SessionRoles(record.roles, record.roles_version)
+
+
+def get_session_store(request: Request) -> SessionStore | None:
+    """FastAPI dependency returning the store on ``app.state.session_store``."""
+    store: SessionStore | None = getattr(request.app.state, "session_store", None)
+    return store
+
+
+def require_session(
+    request: Request,
+    response: Response,
+    store: SessionStore | None = Depends(get_session_store),
+) -> SessionRecord:
+    """FastAPI dependency resolving the request's session cookie or answering 401.
+
+    When validation slides the session's expiry, the session and CSRF cookies
+    are reissued with the new lifetime so the browser does not drop them first.
+    """
+    if store is None:
+        raise RuntimeError("app.state.session_store is not configured")
+    session_id = request.cookies.get(SESSION_COOKIE_NAME)
+    record, touched = store.validate_and_touch(session_id) if session_id else (None, False)
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid session")
+    if touched:
+        refresh_session_cookies(
+            request, response, max_age=store.config.session_max_age, config=store.config
+        )
+    return record
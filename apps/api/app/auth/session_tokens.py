@@ -0,0 +1,403 @@
+"""Stateless, HMAC-signed session tokens with derived CSRF tokens.
+
+An optional alternative to ``SessionStore``: the session cookie carries a
+compact signed token (session id, expiry, revocation epoch) and the CSRF token
+is an HMAC of the session id, so validating a request and its CSRF header is
+pure CPU. The only shared state is ``RevocationList`` - a global epoch plus the
+ids of individually revoked sessions that have not yet expired - which can be
+backed by a ``RevocationStore`` (``SqlRevocationStore``) so that every API
+node sees a logout. Token lifetime and cookie lifetime both come from the
+codec's ``CookieConfig``.
+
+Token layout (base64url, no padding): version byte, 16 raw session-id bytes,
+expiry as unsigned 64-bit epoch seconds, revocation epoch as unsigned 32-bit,
+then the first 16 bytes of HMAC-SHA256 over those 29 bytes.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
+
+from fastapi import Request, Response
+
+from .session import (
+    CSRF_COOKIE_NAME,
+    DEFAULT_COOKIE_CONFIG,
+    SESSION_COOKIE_NAME,
+    CookieConfig,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine, Table
+
+logger = logging.getLogger(__name__)
+
+TOKEN_VERSION = 1
+DEFAULT_REFRESH_INTERVAL = 1.0
+DEFAULT_PRUNE_INTERVAL = 300.0
+_SESSION_BYTES = 16
+_MAC_BYTES = 16
+_PAYLOAD_BYTES = 1 + _SESSION_BYTES + 8 + 4
+
+
+class MissingSigningKeyError(RuntimeError):
+    """Raised when APP_SESSION_SIGNING_KEY is not configured."""
+
+
+@dataclass(frozen=True)
+class SessionClaims:
+    session_id: str
+    expires_at: int
+    epoch: int
+
+
+def _encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+class RevocationStore(Protocol):
+    """Revocations shared by every API node; each node mirrors them in memory."""
+
+    def add(self, session_id: str, expires_at: int) -> None: ...
+
+    def advance_epoch(self) -> int:
+        """Revoke every token issued so far; returns the new epoch."""
+        ...
+
+    def read(self, after: int) -> tuple[int, int, list[tuple[str, int]]]:
+        """The epoch, the newest change id and the revocations added after ``after``."""
+        ...
+
+    def prune(self, now: float) -> int: ...
+
+
+class SqlRevocationStore:
+    """Revocations in the ``auth_session_revocation`` and ``auth_revocation_epoch`` tables.
+
+    SQLAlchemy and the ORM models are imported when the store is built, so the
+    auth routes do not load them.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        from ..db.models import AuthRevocationEpoch, AuthSessionRevocation
+
+        self._engine = engine
+        self._revocations: Table = AuthSessionRevocation.__table__  # type: ignore[assignment]
+        self._epoch: Table = AuthRevocationEpoch.__table__  # type: ignore[assignment]
+
+    def add(self, session_id: str, expires_at: int) -> None:
+        from sqlalchemy import insert
+
+        with self._engine.begin() as connection:
+            connection.execute(
+                insert(self._revocations).values(session_id=session_id, expires_at=expires_at)
+            )
+
+    def advance_epoch(self) -> int:
+        from sqlalchemy import delete, insert, select, update
+        from sqlalchemy.exc import IntegrityError
+
+        epoch = self._epoch
+        while True:
+            try:
+                with self._engine.begin() as connection:
+                    bumped = connection.execute(
+                        update(epoch).where(epoch.c.id == 1).values(epoch=epoch.c.epoch + 1)
+                    ).rowcount
+                    if not bumped:
+                        connection.execute(insert(epoch).values(id=1, epoch=1))
+                    # Older revocations are covered by the epoch now.
+                    connection.execute(delete(self._revocations))
+                    return int(
+                        connection.execute(
+                            select(epoch.c.epoch).where(epoch.c.id == 1)
+                        ).scalar_one()
+                    )
+            except IntegrityError:
+                continue  # another node inserted the epoch row first
+
+    def read(self, after: int) -> tuple[int, int, list[tuple[str, int]]]:
+        from sqlalchemy import select
+
+        revocations, epoch = self._revocations, self._epoch
+        with self._engine.connect() as connection:
+            current = connection.execute(
+                select(epoch.c.epoch).where(epoch.c.id == 1)
+            ).scalar_one_or_none()
+            rows = connection.execute(
+                select(revocations.c.id, revocations.c.session_id, revocations.c.expires_at)
+                .where(revocations.c.id > after)
+                .order_by(revocations.c.id)
+            ).all()
+        cursor = rows[-1].id if rows else after
+        return current or 0, cursor, [(row.session_id, row.expires_at) for row in rows]
+
+    def prune(self, now: float) -> int:
+        from sqlalchemy import delete
+
+        with self._engine.begin() as connection:
+            result = connection.execute(
+                delete(self._revocations).where(self._revocations.c.expires_at <= now)
+            )
+        return int(result.rowcount)
+
+
+class RevocationList:
+    """Global revocation epoch plus individually revoked, not yet expired sessions.
+
+    Without a ``store`` the list is local to the process. With one, revocations
+    are written through to it, and the background thread that ``start`` runs
+    re-reads changes made by other nodes every ``refresh_interval`` seconds and
+    calls ``prune``. A logout on one node therefore rejects the token
+    everywhere within that interval. ``is_revoked`` and ``current_epoch`` only
+    read the in-memory snapshot: they never touch the store, and a store
+    outage leaves the last snapshot in use.
+    """
+
+    def __init__(
+        self,
+        store: RevocationStore | None = None,
+        *,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        prune_interval: float = DEFAULT_PRUNE_INTERVAL,
+    ) -> None:
+        self._lock = threading.Lock()
+        self.epoch = 0
+        self._revoked: dict[str, int] = {}
+        self._store = store
+        self._refresh_interval = refresh_interval
+        self._prune_interval = prune_interval
+        self._refresh_lock = threading.Lock()
+        self._cursor = 0
+        self._stop = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    def revoke(self, claims: SessionClaims) -> None:
+        if self._store is not None:
+            self._store.add(claims.session_id, claims.expires_at)
+        with self._lock:
+            self._revoked[claims.session_id] = claims.expires_at
+
+    def revoke_all(self) -> int:
+        """Invalidate every token issued so far; returns the new epoch."""
+        epoch = self._store.advance_epoch() if self._store is not None else self.epoch + 1
+        with self._lock:
+            self.epoch = epoch
+            self._revoked.clear()
+            return self.epoch
+
+    def current_epoch(self) -> int:
+        """The epoch to put in new tokens, as of the last refresh."""
+        return self.epoch
+
+    def is_revoked(self, claims: SessionClaims) -> bool:
+        return claims.epoch < self.epoch or claims.session_id in self._revoked
+
+    def refresh(self) -> None:
+        """Apply revocations other nodes have written to the store since the last refresh."""
+        if self._store is None or not self._refresh_lock.acquire(blocking=False):
+            return  # nothing shared, or another thread is already refreshing
+        try:
+            epoch, cursor, added = self._store.read(self._cursor)
+            with self._lock:
+                if epoch > self.epoch:
+                    self.epoch = epoch
+                    self._revoked.clear()
+                self._revoked.update(added)
+                self._cursor = cursor
+        finally:
+            self._refresh_lock.release()
+
+    def prune(self, now: float) -> int:
+        """Forget revoked sessions whose tokens have expired anyway."""
+        with self._lock:
+            expired = [key for key, expires_at in self._revoked.items() if expires_at <= now]
+            for key in expired:
+                del self._revoked[key]
+        if self._store is not None:
+            self._store.prune(now)
+        return len(expired)
+
+    def start(self) -> None:
+        """Refresh and prune from a background thread until ``close``."""
+        if self._worker is not None:
+            return
+        self._refresh_logged()
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name="session-revocations", daemon=True)
+        self._worker.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def _refresh_logged(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.exception("session revocation refresh failed; keeping the last snapshot")
+
+    def _run(self) -> None:
+        interval = min(self._refresh_interval, self._prune_interval)
+        refreshed_at = pruned_at = time.monotonic()
+        while not self._stop.wait(interval):
+            if time.monotonic() - refreshed_at >= self._refresh_interval:
+                refreshed_at = time.monotonic()
+                self._refresh_logged()
+            if time.monotonic() - pruned_at >= self._prune_interval:
+                pruned_at = time.monotonic()
+                try:
+                    self.prune(time.time())
+                except Exception:
+                    logger.exception("session revocation prune failed")
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+class SessionTokenCodec:
+    """Issue and verify signed session tokens and their derived CSRF tokens."""
+
+    def __init__(
+        self,
+        key: bytes,
+        *,
+        config: CookieConfig = DEFAULT_COOKIE_CONFIG,
+        revocations: RevocationList | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if len(key) < 32:
+            raise ValueError("session signing key must be at least 32 bytes")
+        self._token_mac = hmac.new(
+            hmac.digest(key, b"session-token", hashlib.sha256), digestmod=hashlib.sha256
+        )
+        self._csrf_mac = hmac.new(
+            hmac.digest(key, b"csrf-token", hashlib.sha256), digestmod=hashlib.sha256
+        )
+        self.config = config
+        self.revocations = revocations if revocations is not None else RevocationList()
+        self._clock = clock
+
+    @classmethod
+    def from_env(
+        cls,
+        *,
+        config: CookieConfig = DEFAULT_COOKIE_CONFIG,
+        revocations: RevocationList | None = None,
+    ) -> SessionTokenCodec:
+        """Build a codec from the base64url APP_SESSION_SIGNING_KEY."""
+        key = os.getenv("APP_SESSION_SIGNING_KEY")
+        if not key:
+            raise MissingSigningKeyError("APP_SESSION_SIGNING_KEY is required for signed sessions")
+        return cls(_decode(key), config=config, revocations=revocations)
+
+    def _sign(self, payload: bytes) -> bytes:
+        mac = self._token_mac.copy()
+        mac.update(payload)
+        return mac.digest()[:_MAC_BYTES]
+
+    def issue(self) -> tuple[str, SessionClaims]:
+        """Return a new token and its claims."""
+        raw_id = secrets.token_bytes(_SESSION_BYTES)
+        expires_at = int(self._clock()) + self.config.session_max_age
+        epoch = self.revocations.current_epoch()
+        payload = (
+            bytes((TOKEN_VERSION,))
+            + raw_id
+            + expires_at.to_bytes(8, "big")
+            + epoch.to_bytes(4, "big")
+        )
+        claims = SessionClaims(_encode(raw_id), expires_at, epoch)
+        return _encode(payload + self._sign(payload)), claims
+
+    def verify(self, token: str) -> SessionClaims | None:
+        """Claims of a valid, unexpired, unrevoked token; None otherwise."""
+        try:
+            raw = _decode(token)
+        except (binascii.Error, ValueError):
+            return None
+        if len(raw) != _PAYLOAD_BYTES + _MAC_BYTES or raw[0] != TOKEN_VERSION:
+            return None
+        payload, mac = raw[:_PAYLOAD_BYTES], raw[_PAYLOAD_BYTES:]
+        if not hmac.compare_digest(mac, self._sign(payload)):
+            return None
+        expires_at = int.from_bytes(payload[1 + _SESSION_BYTES : -4], "big")
+        if expires_at <= self._clock():
+            return None
+        claims = SessionClaims(
+            _encode(payload[1 : 1 + _SESSION_BYTES]),
+            expires_at,
+            int.from_bytes(payload[-4:], "big"),
+        )
+        if self.revocations.is_revoked(claims):
+            return None
+        return claims
+
+    def csrf_token(self, claims: SessionClaims) -> str:
+        mac = self._csrf_mac.copy()
+        mac.update(claims.session_id.encode("ascii"))
+        return _encode(mac.digest()[:_MAC_BYTES])
+
+    def verify_csrf(self, request: Request) -> bool:
+        """Check the ``X-CSRF-Token`` header against the session cookie's token."""
+        token = request.cookies.get(SESSION_COOKIE_NAME)
+        header_token = request.headers.get("X-CSRF-Token")
+        if not token or not header_token:
+            return False
+        claims = self.verify(token)
+        if claims is None:
+            return False
+        return secrets.compare_digest(self.csrf_token(claims), header_token)
+
+    def revoke(self, token: str) -> bool:
+        claims = self.verify(token)
+        if claims is None:
+            return False
+        self.revocations.revoke(claims)
+        return True
+
+
+def issue_signed_session_cookies(response: Response, codec: SessionTokenCodec) -> str:
+    """Stateless counterpart of ``issue_session_cookies``; returns the CSRF token.
+
+    The cookies use ``codec.config``, so they expire together with the token.
+    """
+    config = codec.config
+    token, claims = codec.issue()
+    csrf_token = codec.csrf_token(claims)
+    for key, value, httponly in (
+        (SESSION_COOKIE_NAME, token, True),
+        (CSRF_COOKIE_NAME, csrf_token, False),
+    ):
+        response.set_cookie(
+            key=key,
+            value=value,
+            httponly=httponly,
+            secure=config.secure,
+            samesite=config.same_site,  # type: ignore[arg-type]
+            max_age=config.session_max_age,
+        )
+    return csrf_token
+
+
+def get_session_tokens(request: Request) -> SessionTokenCodec | None:
+    """FastAPI dependency returning the codec on ``app.state.session_tokens``."""
+    codec: SessionTokenCodec | None = getattr(request.app.state, "session_tokens", None)
+    return codec
@@ -0,0 +1,36 @@
+"""Turn ``CreateTaskPayload`` requests into prioritised queue jobs."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from apps.api.schemas import CreateTaskPayload
+from apps.workers.priority import PriorityQueueBackend, PriorityStats
+from apps.workers.queue import Job, JobQueue
+
+TASK_JOB_KIND = "task.create"
+
+
+class TaskScheduler:
+    """Enqueue tasks so that priority 1 is served first, with aging for the rest.
+
+    The task priority maps directly onto the job priority, which every backend
+    dequeues lowest-first. ``PriorityQueueBackend`` and ``SqlQueueBackend`` add
+    aging and metrics.
+    """
+
+    def __init__(self, queue: JobQueue | None = None) -> None:
+        self.queue = queue or JobQueue(PriorityQueueBackend())
+
+    def schedule(self, payload: CreateTaskPayload) -> Job:
+        return self.queue.enqueue(
+            TASK_JOB_KIND,
+            {"task_name": payload.task_name, "priority": payload.priority},
+            priority=payload.priority,
+        )
+
+    def metrics(self) -> dict[int, PriorityStats]:
+        metrics: Callable[[], dict[int, PriorityStats]] | None = getattr(
+            self.queue.backend, "metrics", None
+        )
+        return metrics() if metrics is not None else {}
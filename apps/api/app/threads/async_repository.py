@@ -0,0 +1,106 @@
+"""Async SQLAlchemy persistence for planner outputs.
+
+Kept separate from ``repository`` because ``sqlalchemy.ext.asyncio`` needs the
+optional ``greenlet`` dependency and an async driver such as ``aiosqlite`` or
+``asyncpg``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from packages.schemas.columnar import ActionCardColumns, TimelineEventColumns
+from sqlalchemy import Table, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from .repository import (
+    _ACTION_CARD,
+    _SKILL_REGISTRY,
+    _THREAD_PASS,
+    _TIMELINE_EVENT,
+    DEFAULT_CHUNK_SIZE,
+    _batches,
+    _PassIdentity,
+    action_card_rows,
+    skill_registry_row,
+    thread_pass_row,
+    timeline_event_rows,
+)
+
+
+class AsyncSqlAlchemyPlannerOutputWriter:
+    """Async variant of ``SqlAlchemyPlannerOutputWriter`` on an ``AsyncConnection``."""
+
+    def __init__(
+        self, connection: AsyncConnection, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._connection = connection
+        self._chunk_size = chunk_size
+        self._identity = _PassIdentity()
+
+    @classmethod
+    async def begin(
+        cls, engine: AsyncEngine, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncSqlAlchemyPlannerOutputWriter:
+        connection = await engine.connect()
+        await connection.begin()
+        return cls(connection, chunk_size=chunk_size)
+
+    async def _insert_many(self, table: Table, rows: Iterable[dict[str, Any]]) -> None:
+        for batch in _batches(rows, self._chunk_size):
+            await self._connection.execute(insert(table), batch)
+
+    async def write_thread_pass(self, thread_pass: dict[str, Any]) -> None:
+        await self._connection.execute(insert(_THREAD_PASS), thread_pass_row(thread_pass))
+        for statement in self._identity.resolve(thread_pass["pass_id"]):
+            await self._connection.execute(statement)
+
+    async def write_skill_registry(self, skill_registry: dict[str, Any]) -> None:
+        row = skill_registry_row(self._identity.current(), skill_registry)
+        await self._connection.execute(insert(_SKILL_REGISTRY), row)
+
+    async def write_action_cards(
+        self, action_cards: list[dict[str, Any]] | ActionCardColumns
+    ) -> None:
+        rows = action_card_rows(self._identity.current(), action_cards)
+        await self._insert_many(_ACTION_CARD, rows)
+
+    async def write_timeline_events(
+        self, timeline_events: list[dict[str, Any]] | TimelineEventColumns
+    ) -> None:
+        rows = timeline_event_rows(self._identity.current(), timeline_events)
+        await self._insert_many(_TIMELINE_EVENT, rows)
+
+    async def commit(self) -> None:
+        try:
+            if self._identity.pass_id is None:
+                raise RuntimeError("planner outputs committed without a thread pass")
+            await self._connection.commit()
+        except BaseException:
+            await self.rollback()
+            raise
+        finally:
+            await self._connection.close()
+
+    async def rollback(self) -> None:
+        if self._connection.in_transaction():
+            await self._connection.rollback()
+        await self._connection.close()
+
+
+class AsyncSqlAlchemyPlannerOutputRepository:
+    """Planner output repository for ``AsyncEngine`` with the same bulk-insert strategy."""
+
+    def __init__(self, engine: AsyncEngine, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._engine = engine
+        self._chunk_size = chunk_size
+
+    async def open_planner_outputs(self) -> AsyncSqlAlchemyPlannerOutputWriter:
+        return await AsyncSqlAlchemyPlannerOutputWriter.begin(
+            self._engine, chunk_size=self._chunk_size
+        )
@@ -0,0 +1,276 @@
+"""SQLAlchemy-backed persistence for planner outputs.
+
+Rows are written with Core ``insert`` statements executed in chunks
+(``executemany``) inside a single transaction per planner pass, instead of
+building one ORM object and round-trip per action card or timeline event.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import Any
+
+from packages.instrumentation import histogram
+from packages.schemas.columnar import ActionCardColumns, TimelineEventColumns
+from sqlalchemy import Connection, Engine, Table, Update, insert, update
+
+from ..db.models import (
+    PlannerActionCard,
+    PlannerSkillRegistry,
+    PlannerThreadPass,
+    PlannerTimelineEvent,
+)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_SAVE_SECONDS = histogram(
+    "planner_repository_save_seconds", "Wall time of planner output writes, by operation."
+)
+
+_THREAD_PASS: Table = PlannerThreadPass.__table__  # type: ignore[assignment]
+_SKILL_REGISTRY: Table = PlannerSkillRegistry.__table__  # type: ignore[assignment]
+_ACTION_CARD: Table = PlannerActionCard.__table__  # type: ignore[assignment]
+_TIMELINE_EVENT: Table = PlannerTimelineEvent.__table__  # type: ignore[assignment]
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _dump_json(value: Any) -> str | None:
+    if value is None:
+        return None
+    return json.dumps(value, separators=(",", ":"))
+
+
+def thread_pass_row(thread_pass: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "thread_id": thread_pass["thread_id"],
+        "pass_id": thread_pass["pass_id"],
+        "pass_index": thread_pass["pass_index"],
+        "planner_summary": thread_pass["planner_summary"],
+        "skill_registry_id": thread_pass["skill_registry_id"],
+        "action_card_ids": _dump_json(thread_pass["action_card_ids"]),
+        "timeline_event_ids": _dump_json(thread_pass["timeline_event_ids"]),
+        "created_at": _parse_timestamp(thread_pass["created_at"]),
+    }
+
+
+def skill_registry_row(pass_id: str, skill_registry: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "pass_id": pass_id,
+        "registry_id": skill_registry["registry_id"],
+        "generated_at": _parse_timestamp(skill_registry["generated_at"]),
+        "skills": _dump_json(skill_registry["skills"]),
+    }
+
+
+def action_card_row(pass_id: str, card: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "pass_id": pass_id,
+        "card_id": card["card_id"],
+        "title": card["title"],
+        "kind": card["kind"],
+        "status": card["status"],
+        "priority": card["priority"],
+        "owner": card.get("owner"),
+        "details": _dump_json(card.get("metadata")),
+        "created_at": _parse_timestamp(card["created_at"]),
+    }
+
+
+def timeline_event_row(pass_id: str, event: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "pass_id": pass_id,
+        "event_id": event["event_id"],
+        "event_type": event["event_type"],
+        "message": event["message"],
+        "actor": event.get("actor"),
+        "action_card_id": event.get("action_card_id"),
+        "details": _dump_json(event.get("details")),
+        "occurred_at": _parse_timestamp(event["occurred_at"]),
+    }
+
+
+def action_card_rows(
+    pass_id: str, action_cards: list[dict[str, Any]] | ActionCardColumns
+) -> Iterator[dict[str, Any]]:
+    """Rows for a batch of cards, read straight from the columns when given columns."""
+    if not isinstance(action_cards, ActionCardColumns):
+        for card in action_cards:
+            yield action_card_row(pass_id, card)
+        return
+    columns = action_cards.iter_columns(
+        "card_id", "title", "kind", "status", "priority", "owner", "metadata", "created_at"
+    )
+    for card_id, title, kind, status, priority, owner, details, created_at in columns:
+        yield {
+            "pass_id": pass_id,
+            "card_id": card_id,
+            "title": title,
+            "kind": kind,
+            "status": status,
+            "priority": priority,
+            "owner": owner,
+            "details": details,
+            "created_at": _parse_timestamp(created_at),
+        }
+
+
+def timeline_event_rows(
+    pass_id: str, timeline_events: list[dict[str, Any]] | TimelineEventColumns
+) -> Iterator[dict[str, Any]]:
+    """Rows for a batch of events, read straight from the columns when given columns."""
+    if not isinstance(timeline_events, TimelineEventColumns):
+        for event in timeline_events:
+            yield timeline_event_row(pass_id, event)
+        return
+    columns = timeline_events.iter_columns(
+        "event_id", "event_type", "message", "actor", "action_card_id", "details", "occurred_at"
+    )
+    for event_id, event_type, message, actor, action_card_id, details, occurred_at in columns:
+        yield {
+            "pass_id": pass_id,
+            "event_id": event_id,
+            "event_type": event_type,
+            "message": message,
+            "actor": actor,
+            "action_card_id": action_card_id,
+            "details": details,
+            "occurred_at": _parse_timestamp(occurred_at),
+        }
+
+
+def _relink_statements(provisional_id: str, pass_id: str) -> Iterator[Update]:
+    for table in (_SKILL_REGISTRY, _ACTION_CARD, _TIMELINE_EVENT):
+        yield update(table).where(table.c.pass_id == provisional_id).values(pass_id=pass_id)
+
+
+def _batches(
+    rows: Iterable[dict[str, Any]], chunk_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class _PassIdentity:
+    """Tracks the pass id rows are written under, including the provisional one."""
+
+    def __init__(self) -> None:
+        self.pass_id: str | None = None
+        self.provisional_id: str | None = None
+
+    def current(self) -> str:
+        if self.pass_id is not None:
+            return self.pass_id
+        if self.provisional_id is None:
+            self.provisional_id = f"pending:{uuid.uuid4().hex}"
+        return self.provisional_id
+
+    def resolve(self, pass_id: str) -> list[Update]:
+        self.pass_id = pass_id
+        provisional_id, self.provisional_id = self.provisional_id, None
+        if provisional_id is None:
+            return []
+        return list(_relink_statements(provisional_id, pass_id))
+
+
+class SqlAlchemyPlannerOutputWriter:
+    """Writes one planner pass on a single connection and transaction.
+
+    Cards and events may arrive before the thread pass when streaming. They are
+    then stored under a provisional pass id that is rewritten once the thread
+    pass is known, so arrival order never forces buffering.
+    """
+
+    def __init__(self, connection: Connection, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._connection = connection
+        self._transaction = connection.begin()
+        self._chunk_size = chunk_size
+        self._identity = _PassIdentity()
+
+    def _insert_many(self, table: Table, rows: Iterable[dict[str, Any]]) -> None:
+        with _SAVE_SECONDS.time(operation="insert", table=table.name):
+            for batch in _batches(rows, self._chunk_size):
+                self._connection.execute(insert(table), batch)
+
+    def write_thread_pass(self, thread_pass: dict[str, Any]) -> None:
+        self._connection.execute(insert(_THREAD_PASS), thread_pass_row(thread_pass))
+        for statement in self._identity.resolve(thread_pass["pass_id"]):
+            self._connection.execute(statement)
+
+    def write_skill_registry(self, skill_registry: dict[str, Any]) -> None:
+        row = skill_registry_row(self._identity.current(), skill_registry)
+        self._connection.execute(insert(_SKILL_REGISTRY), row)
+
+    def write_action_cards(self, action_cards: list[dict[str, Any]] | ActionCardColumns) -> None:
+        self._insert_many(_ACTION_CARD, action_card_rows(self._identity.current(), action_cards))
+
+    def write_timeline_events(
+        self, timeline_events: list[dict[str, Any]] | TimelineEventColumns
+    ) -> None:
+        rows = timeline_event_rows(self._identity.current(), timeline_events)
+        self._insert_many(_TIMELINE_EVENT, rows)
+
+    def commit(self) -> None:
+        try:
+            if self._identity.pass_id is None:
+                raise RuntimeError("planner outputs committed without a thread pass")
+            with _SAVE_SECONDS.time(operation="commit"):
+                self._transaction.commit()
+        except BaseException:
+            self.rollback()
+            raise
+        finally:
+            self._connection.close()
+
+    def rollback(self) -> None:
+        if self._transaction.is_active:
+            self._transaction.rollback()
+        self._connection.close()
+
+
+class SqlAlchemyPlannerOutputRepository:
+    """Planner output repository that bulk-inserts rows in one transaction per pass."""
+
+    accepts_columns = True
+
+    def __init__(self, engine: Engine, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._engine = engine
+        self._chunk_size = chunk_size
+
+    def open_planner_outputs(self) -> SqlAlchemyPlannerOutputWriter:
+        return SqlAlchemyPlannerOutputWriter(self._engine.connect(), chunk_size=self._chunk_size)
+
+    def save_planner_outputs(
+        self,
+        *,
+        thread_pass: dict[str, Any],
+        action_cards: list[dict[str, Any]] | ActionCardColumns,
+        skill_registry: dict[str, Any],
+        timeline_events: list[dict[str, Any]] | TimelineEventColumns,
+    ) -> None:
+        with _SAVE_SECONDS.time(operation="save_planner_outputs"):
+            writer = self.open_planner_outputs()
+            try:
+                writer.write_thread_pass(thread_pass)
+                writer.write_skill_registry(skill_registry)
+                writer.write_action_cards(action_cards)
+                writer.write_timeline_events(timeline_events)
+            except BaseException:
+                writer.rollback()
+                raise
+            writer.commit()
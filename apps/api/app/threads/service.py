@@ -1,8 +1,31 @@
 from __future__ import annotations
 
-from typing import Any, Protocol
+import asyncio
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Protocol, TypeGuard
 
-from packages.schemas.validator import validate_planner_bundle
+from packages.instrumentation import histogram
+from packages.schemas.columnar import ActionCardColumns, TimelineEventColumns
+from packages.schemas.ingest import Body, decode_planner_bundle
+from packages.schemas.integrity import check_references
+from packages.schemas.memo import ValidationMemo
+from packages.schemas.streaming import ByteStream, iter_planner_bundle
+from packages.schemas.validator import (
+    BundleValidationError,
+    ValidationIssue,
+    check_planner_bundle,
+    collect_violations,
+    validate_planner_bundle,
+)
+
+DEFAULT_STREAM_CHUNK_SIZE = 500
+DEFAULT_ASYNC_CHUNK_SIZE = 1000
+
+_PERSIST_SECONDS = histogram(
+    "planner_persist_seconds", "Wall time of persist_planner_outputs, by stage."
+)
 
 
 class PlannerOutputRepository(Protocol):
@@ -16,6 +39,71 @@ class PlannerOutputRepository(Protocol):
     ) -> None: ...
 
 
+class ColumnarPlannerOutputRepository(Protocol):
+    """A repository that also takes cards and events as column containers.
+
+    Implementations opt in by setting ``accepts_columns = True``; any other
+    ``PlannerOutputRepository`` keeps receiving lists of dicts.
+    """
+
+    accepts_columns: bool
+
+    def save_planner_outputs(
+        self,
+        *,
+        thread_pass: dict[str, Any],
+        action_cards: list[dict[str, Any]] | ActionCardColumns,
+        skill_registry: dict[str, Any],
+        timeline_events: list[dict[str, Any]] | TimelineEventColumns,
+    ) -> None: ...
+
+
+def _accepts_columns(
+    repository: PlannerOutputRepository,
+) -> TypeGuard[ColumnarPlannerOutputRepository]:
+    return getattr(repository, "accepts_columns", False) is True
+
+
+class PlannerOutputWriter(Protocol):
+    """Incremental writer for one planner pass; nothing is visible until ``commit``."""
+
+    def write_thread_pass(self, thread_pass: dict[str, Any]) -> None: ...
+
+    def write_skill_registry(self, skill_registry: dict[str, Any]) -> None: ...
+
+    def write_action_cards(self, action_cards: list[dict[str, Any]]) -> None: ...
+
+    def write_timeline_events(self, timeline_events: list[dict[str, Any]]) -> None: ...
+
+    def commit(self) -> None: ...
+
+    def rollback(self) -> None: ...
+
+
+class StreamingPlannerOutputRepository(Protocol):
+    def open_planner_outputs(self) -> PlannerOutputWriter: ...
+
+
+class AsyncPlannerOutputWriter(Protocol):
+    """Async counterpart of ``PlannerOutputWriter``; ``rollback`` discards all writes."""
+
+    async def write_thread_pass(self, thread_pass: dict[str, Any]) -> None: ...
+
+    async def write_skill_registry(self, skill_registry: dict[str, Any]) -> None: ...
+
+    async def write_action_cards(self, action_cards: list[dict[str, Any]]) -> None: ...
+
+    async def write_timeline_events(self, timeline_events: list[dict[str, Any]]) -> None: ...
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+
+class AsyncPlannerOutputRepository(Protocol):
+    async def open_planner_outputs(self) -> AsyncPlannerOutputWriter: ...
+
+
 def persist_planner_outputs(
     repository: PlannerOutputRepository,
     *,
@@ -23,23 +111,239 @@ def persist_planner_outputs(
     action_cards: list[dict[str, Any]],
     skill_registry: dict[str, Any],
     timeline_events: list[dict[str, Any]],
+    executor: Executor | None = None,
+    memo: ValidationMemo | None = None,
 ) -> None:
     """Validate planner artifacts before persistence.
 
     Validation is a mandatory gate and will raise before any repository write
-    happens when payloads violate schema contracts.
+    happens when payloads violate schema contracts. The raised
+    ``BundleValidationError`` lists every violation; pass a process pool as
+    ``executor`` to validate very large bundles in parallel, and a shared
+    ``ValidationMemo`` to skip payloads already validated on earlier passes.
     """
 
-    validate_planner_bundle(
-        thread_pass=thread_pass,
-        action_cards=action_cards,
-        skill_registry=skill_registry,
-        timeline_events=timeline_events,
+    with _PERSIST_SECONDS.time(stage="validate"):
+        validate_planner_bundle(
+            thread_pass=thread_pass,
+            action_cards=action_cards,
+            skill_registry=skill_registry,
+            timeline_events=timeline_events,
+            executor=executor,
+            memo=memo,
+        )
+
+    with _PERSIST_SECONDS.time(stage="save"):
+        repository.save_planner_outputs(
+            thread_pass=thread_pass,
+            action_cards=action_cards,
+            skill_registry=skill_registry,
+            timeline_events=timeline_events,
+        )
+
+
+def persist_planner_body(repository: PlannerOutputRepository, body: Body) -> None:
+    """Decode, validate and persist a planner bundle from a raw request body.
+
+    ``body`` may be a ``memoryview`` over the request buffer. Decoding and
+    validation happen together in ``decode_planner_bundle``; nothing is saved
+    unless the whole bundle is valid.
+
+    For repositories that set ``accepts_columns``, cards and events are moved
+    into column containers before the write, so the per-item dicts are freed
+    before the rows are inserted. The containers are built from the fully
+    decoded dicts, so this does not lower the peak memory of an ingest; use
+    ``persist_planner_stream`` when that matters.
+    """
+    with _PERSIST_SECONDS.time(stage="decode"):
+        bundle = decode_planner_bundle(body)
+
+    if _accepts_columns(repository):
+        with _PERSIST_SECONDS.time(stage="columns"):
+            action_cards = ActionCardColumns(bundle.pop("action_cards"))
+            timeline_events = TimelineEventColumns(bundle.pop("timeline_events"))
+        with _PERSIST_SECONDS.time(stage="save"):
+            repository.save_planner_outputs(
+                thread_pass=bundle["thread_pass"],
+                action_cards=action_cards,
+                skill_registry=bundle["skill_registry"],
+                timeline_events=timeline_events,
+            )
+        return
+
+    with _PERSIST_SECONDS.time(stage="save"):
+        repository.save_planner_outputs(
+            thread_pass=bundle["thread_pass"],
+            action_cards=bundle["action_cards"],
+            skill_registry=bundle["skill_registry"],
+            timeline_events=bundle["timeline_events"],
+        )
+
+
+def persist_planner_stream(
+    repository: StreamingPlannerOutputRepository,
+    stream: ByteStream,
+    *,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> None:
+    """Validate a planner bundle from a byte stream and persist it incrementally.
+
+    Items are handed to the writer in chunks as soon as they validate, so peak
+    memory does not grow with the size of the pass. If any item is invalid or
+    the stream is malformed the writer is rolled back, keeping the guarantee
+    that nothing is persisted for an invalid bundle.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    writer = repository.open_planner_outputs()
+    action_cards: list[dict[str, Any]] = []
+    timeline_events: list[dict[str, Any]] = []
+    try:
+        for section, item in iter_planner_bundle(stream):
+            if section == "action_cards":
+                action_cards.append(item)
+                if len(action_cards) >= chunk_size:
+                    writer.write_action_cards(action_cards)
+                    action_cards = []
+            elif section == "timeline_events":
+                timeline_events.append(item)
+                if len(timeline_events) >= chunk_size:
+                    writer.write_timeline_events(timeline_events)
+                    timeline_events = []
+            elif section == "thread_pass":
+                writer.write_thread_pass(item)
+            else:
+                writer.write_skill_registry(item)
+
+        if action_cards:
+            writer.write_action_cards(action_cards)
+        if timeline_events:
+            writer.write_timeline_events(timeline_events)
+    except BaseException:
+        writer.rollback()
+        raise
+    writer.commit()
+
+
+_PipelineStep = tuple[Callable[[], list[ValidationIssue]], Callable[[], Awaitable[None]]]
+
+
+def _pipeline_steps(
+    writer: AsyncPlannerOutputWriter,
+    *,
+    thread_pass: dict[str, Any],
+    action_cards: list[dict[str, Any]],
+    skill_registry: dict[str, Any],
+    timeline_events: list[dict[str, Any]],
+    chunk_size: int,
+) -> list[_PipelineStep]:
+    async def write_header() -> None:
+        await writer.write_thread_pass(thread_pass)
+        await writer.write_skill_registry(skill_registry)
+
+    steps: list[_PipelineStep] = [
+        (
+            partial(
+                check_planner_bundle,
+                thread_pass=thread_pass,
+                action_cards=[],
+                skill_registry=skill_registry,
+                timeline_events=[],
+                references=False,
+            ),
+            write_header,
+        )
+    ]
+    for start in range(0, len(action_cards), chunk_size):
+        cards = action_cards[start : start + chunk_size]
+        steps.append(
+            (
+                partial(
+                    collect_violations, "action_card", cards, artifact="action_cards", start=start
+                ),
+                partial(writer.write_action_cards, cards),
+            )
+        )
+    for start in range(0, len(timeline_events), chunk_size):
+        events = timeline_events[start : start + chunk_size]
+        steps.append(
+            (
+                partial(
+                    collect_violations,
+                    "timeline_event",
+                    events,
+                    artifact="timeline_events",
+                    start=start,
+                ),
+                partial(writer.write_timeline_events, events),
+            )
+        )
+    steps.append(
+        (
+            partial(
+                check_references,
+                thread_pass=thread_pass,
+                action_cards=action_cards,
+                skill_registry=skill_registry,
+                timeline_events=timeline_events,
+            ),
+            _write_nothing,
+        )
     )
+    return steps
+
+
+async def _write_nothing() -> None:
+    return None
+
+
+async def persist_planner_outputs_async(
+    repository: AsyncPlannerOutputRepository,
+    *,
+    thread_pass: dict[str, Any],
+    action_cards: list[dict[str, Any]],
+    skill_registry: dict[str, Any],
+    timeline_events: list[dict[str, Any]],
+    executor: Executor | None = None,
+    chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+) -> None:
+    """Validate and persist planner artifacts without blocking the event loop.
+
+    Validation of chunk N+1 runs on ``executor`` (the loop's default thread
+    pool when omitted) while chunk N is being written; cross-artifact
+    references are checked last. Writes stop at the first violation,
+    validation continues so every issue is reported, and the writer is rolled
+    back, so an invalid bundle leaves nothing persisted.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
 
-    repository.save_planner_outputs(
+    loop = asyncio.get_running_loop()
+    writer = await repository.open_planner_outputs()
+    steps = _pipeline_steps(
+        writer,
         thread_pass=thread_pass,
         action_cards=action_cards,
         skill_registry=skill_registry,
         timeline_events=timeline_events,
+        chunk_size=chunk_size,
     )
+    issues: list[ValidationIssue] = []
+    pending = loop.run_in_executor(executor, steps[0][0])
+    try:
+        for index, (_, write) in enumerate(steps):
+            step_issues = await pending
+            if index + 1 < len(steps):
+                pending = loop.run_in_executor(executor, steps[index + 1][0])
+            issues += step_issues
+            if not issues:
+                await write()
+        if issues:
+            raise BundleValidationError(issues)
+    except BaseException:
+        if not pending.done():
+            pending.cancel()
+        await writer.rollback()
+        raise
+    await writer.commit()
@@ -0,0 +1,14 @@
+from apps.api.app.tasks.scheduler import TASK_JOB_KIND, TaskScheduler
+from apps.api.schemas import CreateTaskPayload
+
+
+def test_scheduler_dequeues_by_task_priority() -> None:
+    scheduler = TaskScheduler()
+    scheduler.schedule(CreateTaskPayload(task_name="bulk-export", priority=5))
+    scheduler.schedule(CreateTaskPayload(task_name="page-oncall", priority=1))
+
+    jobs = scheduler.queue.dequeue(limit=2)
+
+    assert [job.payload["task_name"] for job in jobs] == ["page-oncall", "bulk-export"]
+    assert {job.kind for job in jobs} == {TASK_JOB_KIND}
+    assert scheduler.metrics()[1].dequeued == 1
@@ -0,0 +1,151 @@
+"""Worker pool that drains a ``JobQueue`` with configurable concurrency.
+
+Process mode gives every worker its own interpreter (and its own queue built
+from ``queue_factory``), so CPU-bound handlers scale across cores; the backend
+must then be shared out-of-process, e.g. ``SqlQueueBackend``. Thread mode
+shares one queue object and works with ``InMemoryQueueBackend``.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+from collections.abc import Callable, Mapping
+from multiprocessing.synchronize import Event as ProcessEvent
+from typing import Any, Literal, Protocol
+
+from .queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[dict[str, Any]], None]
+
+
+class _StopSignal(Protocol):
+    def is_set(self) -> bool: ...
+
+
+def run_worker(
+    queue: JobQueue,
+    handlers: Mapping[str, Handler],
+    stop: _StopSignal,
+    *,
+    batch_size: int = 10,
+    idle_timeout: float = 0.5,
+) -> int:
+    """Process jobs until ``stop`` is set. Returns the number of completed jobs."""
+    completed = 0
+    while not stop.is_set():
+        for job in queue.dequeue(limit=batch_size, timeout=idle_timeout):
+            handler = handlers.get(job.kind)
+            if handler is None:
+                queue.backend.bury(job, f"no handler registered for {job.kind!r}")
+                continue
+            try:
+                handler(job.payload)
+            except Exception as exc:
+                logger.warning("job %s (%s) failed: %r", job.id, job.kind, exc)
+                queue.fail(job, repr(exc))
+            else:
+                if queue.complete(job):
+                    completed += 1
+    return completed
+
+
+def _process_main(
+    queue_factory: Callable[[], JobQueue],
+    handlers: Mapping[str, Handler],
+    stop: ProcessEvent,
+    batch_size: int,
+    idle_timeout: float,
+) -> None:
+    run_worker(
+        queue_factory(), handlers, stop, batch_size=batch_size, idle_timeout=idle_timeout
+    )
+
+
+class WorkerPool:
+    """Run ``concurrency`` workers against queues produced by ``queue_factory``.
+
+    ``queue_factory`` and ``handlers`` must be picklable in process mode.
+    """
+
+    def __init__(
+        self,
+        queue_factory: Callable[[], JobQueue],
+        handlers: Mapping[str, Handler],
+        *,
+        concurrency: int = 1,
+        batch_size: int = 10,
+        idle_timeout: float = 0.5,
+        mode: Literal["process", "thread"] = "process",
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        self._queue_factory = queue_factory
+        self._handlers = dict(handlers)
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._idle_timeout = idle_timeout
+        self._mode = mode
+        self._workers: list[multiprocessing.process.BaseProcess | threading.Thread] = []
+        self._stop: ProcessEvent | threading.Event | None = None
+
+    def start(self) -> None:
+        if self._workers:
+            raise RuntimeError("worker pool already started")
+        if self._mode == "process":
+            context = multiprocessing.get_context()
+            process_stop = context.Event()
+            self._stop = process_stop
+            for index in range(self._concurrency):
+                self._workers.append(
+                    context.Process(
+                        target=_process_main,
+                        args=(
+                            self._queue_factory,
+                            self._handlers,
+                            process_stop,
+                            self._batch_size,
+                            self._idle_timeout,
+                        ),
+                        name=f"{self._mode}-worker-{index}",
+                        daemon=True,
+                    )
+                )
+        else:
+            thread_stop = threading.Event()
+            self._stop = thread_stop
+            queue = self._queue_factory()
+            for index in range(self._concurrency):
+                self._workers.append(
+                    threading.Thread(
+                        target=run_worker,
+                        args=(queue, self._handlers, thread_stop),
+                        kwargs={
+                            "batch_size": self._batch_size,
+                            "idle_timeout": self._idle_timeout,
+                        },
+                        name=f"{self._mode}-worker-{index}",
+                        daemon=True,
+                    )
+                )
+        for worker in self._workers:
+            worker.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Signal workers to finish their current batch and wait for them."""
+        if self._stop is not None:
+            self._stop.set()
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+        self._stop = None
+
+    def __enter__(self) -> WorkerPool:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
@@ -0,0 +1,115 @@
+"""Multi-level priority queue backend with aging and queue metrics.
+
+Each priority value has its own FIFO level. A job's effective priority improves
+by one level per ``aging_interval`` seconds of waiting, so sustained urgent
+traffic cannot starve low-priority work indefinitely. Picking the next job only
+compares the heads of the levels, so dequeue cost is O(number of levels).
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict, deque
+from dataclasses import dataclass
+
+from .queue import InMemoryQueueBackend, Job
+
+DEFAULT_AGING_INTERVAL = 5.0
+WAIT_SAMPLE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class PriorityStats:
+    depth: int
+    dequeued: int
+    mean_wait: float
+    max_wait: float
+    p99_wait: float
+
+
+class _WaitStats:
+    __slots__ = ("count", "total", "maximum", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.samples: deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+    def record(self, wait: float) -> None:
+        self.count += 1
+        self.total += wait
+        self.maximum = max(self.maximum, wait)
+        self.samples.append(wait)
+
+    def p99(self) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+class PriorityQueueBackend(InMemoryQueueBackend):
+    """In-memory backend that schedules by priority level with aging."""
+
+    def __init__(self, *, aging_interval: float = DEFAULT_AGING_INTERVAL) -> None:
+        if aging_interval <= 0:
+            raise ValueError("aging_interval must be positive")
+        super().__init__()
+        self._aging_interval = aging_interval
+        self._levels: dict[int, deque[tuple[float, str]]] = defaultdict(deque)
+        self._delayed: list[tuple[float, int, str]] = []
+        self._depth: dict[int, int] = defaultdict(int)
+        self._waits: dict[int, _WaitStats] = defaultdict(_WaitStats)
+
+    def _push(self, job: Job, available_at: float) -> None:
+        self._seq += 1
+        heapq.heappush(self._delayed, (available_at, self._seq, job.id))
+        self._depth[job.priority] += 1
+
+    def _promote(self, now: float) -> None:
+        while self._delayed and self._delayed[0][0] <= now:
+            available_at, _, job_id = heapq.heappop(self._delayed)
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._levels[job.priority].append((available_at, job_id))
+
+    def _pop_ready(self, now: float) -> Job | None:
+        self._promote(now)
+        best: tuple[float, int, float] | None = None
+        for priority, level in self._levels.items():
+            while level and (level[0][1] not in self._jobs or level[0][1] in self._in_flight):
+                level.popleft()
+            if not level:
+                continue
+            ready_at = level[0][0]
+            candidate = (priority - (now - ready_at) / self._aging_interval, priority, ready_at)
+            if best is None or candidate < best:
+                best = candidate
+        if best is None:
+            return None
+
+        priority = best[1]
+        ready_at, job_id = self._levels[priority].popleft()
+        self._depth[priority] -= 1
+        self._waits[priority].record(max(now - ready_at, 0.0))
+        return self._jobs[job_id]
+
+    def metrics(self) -> dict[int, PriorityStats]:
+        """Per-priority queue depth and wait-time statistics."""
+        with self._lock:
+            priorities = sorted(set(self._depth) | set(self._waits))
+            return {
+                priority: PriorityStats(
+                    depth=self._depth[priority],
+                    dequeued=self._waits[priority].count,
+                    mean_wait=(
+                        self._waits[priority].total / self._waits[priority].count
+                        if self._waits[priority].count
+                        else 0.0
+                    ),
+                    max_wait=self._waits[priority].maximum,
+                    p99_wait=self._waits[priority].p99(),
+                )
+                for priority in priorities
+            }
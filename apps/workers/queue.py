@@ -1,2 +1,230 @@
+"""Job queue primitives shared by the API (producers) and worker processes.
+
+A ``QueueBackend`` stores jobs; ``JobQueue`` layers retry/backoff and
+visibility-timeout policy on top of it. Reserved jobs stay invisible to other
+consumers until they are completed, failed, or their visibility timeout
+expires, after which they are delivered again.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field, replace
+from typing import Any, Protocol
+
+DEFAULT_VISIBILITY_TIMEOUT = 30.0
+
+
 def worker_name() -> str:
     return "default-worker"
+
+
+@dataclass(frozen=True)
+class Job:
+    """A unit of work. Lower ``priority`` values are dequeued first."""
+
+    kind: str
+    payload: dict[str, Any]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    priority: int = 0
+    attempts: int = 0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff: ``base_delay * 2 ** (attempts - 1)`` capped at ``max_delay``."""
+
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 60.0
+
+    def delay(self, attempts: int) -> float:
+        return float(min(self.max_delay, self.base_delay * 2 ** max(attempts - 1, 0)))
+
+
+class QueueBackend(Protocol):
+    def put(self, job: Job, *, available_at: float) -> None: ...
+
+    def put_many(self, jobs: list[Job], *, available_at: float) -> None: ...
+
+    def reserve(self, limit: int, *, now: float, visibility_timeout: float) -> list[Job]:
+        """Claim up to ``limit`` visible jobs, incrementing their ``attempts``."""
+        ...
+
+    def ack(self, job: Job) -> bool:
+        """Remove a reserved job. Returns False if the reservation was lost."""
+        ...
+
+    def release(self, job: Job, *, available_at: float) -> bool:
+        """Return a reserved job to the queue for another attempt."""
+        ...
+
+    def bury(self, job: Job, error: str) -> bool:
+        """Move a reserved job to the dead-letter set."""
+        ...
+
+    def pending_count(self) -> int: ...
+
+
+class InMemoryQueueBackend:
+    """Thread-safe in-process backend, suitable for tests and thread-based pools."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ready: list[tuple[int, float, int, str]] = []
+        self._reserved: list[tuple[float, str, int]] = []
+        self._jobs: dict[str, Job] = {}
+        self._in_flight: dict[str, float] = {}
+        self._seq = 0
+        self.dead: dict[str, tuple[Job, str]] = {}
+
+    def _push(self, job: Job, available_at: float) -> None:
+        """Make ``job`` eligible from ``available_at``. Called with the lock held."""
+        self._seq += 1
+        heapq.heappush(self._ready, (job.priority, available_at, self._seq, job.id))
+
+    def put(self, job: Job, *, available_at: float) -> None:
+        self.put_many([job], available_at=available_at)
+
+    def put_many(self, jobs: list[Job], *, available_at: float) -> None:
+        with self._lock:
+            for job in jobs:
+                self._jobs[job.id] = job
+                self._push(job, available_at)
+
+    def _expire_reservations(self, now: float) -> None:
+        while self._reserved and self._reserved[0][0] <= now:
+            deadline, job_id, attempts = heapq.heappop(self._reserved)
+            job = self._jobs.get(job_id)
+            if job is None or job.attempts != attempts or self._in_flight.get(job_id) != deadline:
+                continue
+            del self._in_flight[job_id]
+            self._push(job, now)
+
+    def _pop_ready(self, now: float) -> Job | None:
+        """Remove and return the next visible job, or None. Called with the lock held."""
+        deferred: list[tuple[int, float, int, str]] = []
+        try:
+            while self._ready:
+                entry = heapq.heappop(self._ready)
+                job = self._jobs.get(entry[3])
+                if job is None or job.id in self._in_flight:
+                    continue
+                if entry[1] > now:
+                    deferred.append(entry)
+                    continue
+                return job
+            return None
+        finally:
+            for entry in deferred:
+                heapq.heappush(self._ready, entry)
+
+    def reserve(self, limit: int, *, now: float, visibility_timeout: float) -> list[Job]:
+        with self._lock:
+            self._expire_reservations(now)
+            claimed: list[Job] = []
+            while len(claimed) < limit:
+                job = self._pop_ready(now)
+                if job is None:
+                    break
+                job = replace(job, attempts=job.attempts + 1)
+                deadline = now + visibility_timeout
+                self._jobs[job.id] = job
+                self._in_flight[job.id] = deadline
+                heapq.heappush(self._reserved, (deadline, job.id, job.attempts))
+                claimed.append(job)
+            return claimed
+
+    def _owns(self, job: Job) -> bool:
+        current = self._jobs.get(job.id)
+        if current is None or job.id not in self._in_flight:
+            return False
+        return current.attempts == job.attempts
+
+    def ack(self, job: Job) -> bool:
+        with self._lock:
+            if not self._owns(job):
+                return False
+            del self._jobs[job.id]
+            del self._in_flight[job.id]
+            return True
+
+    def release(self, job: Job, *, available_at: float) -> bool:
+        with self._lock:
+            if not self._owns(job):
+                return False
+            del self._in_flight[job.id]
+            self._push(job, available_at)
+            return True
+
+    def bury(self, job: Job, error: str) -> bool:
+        with self._lock:
+            if not self._owns(job):
+                return False
+            del self._jobs[job.id]
+            del self._in_flight[job.id]
+            self.dead[job.id] = (job, error)
+            return True
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+
+class JobQueue:
+    """Producer/consumer facade applying visibility timeouts and retry backoff."""
+
+    def __init__(
+        self,
+        backend: QueueBackend,
+        *,
+        retry: RetryPolicy | None = None,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.backend = backend
+        self.retry = retry or RetryPolicy()
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+
+    def enqueue(
+        self, kind: str, payload: dict[str, Any], *, priority: int = 0, delay: float = 0.0
+    ) -> Job:
+        job = Job(kind=kind, payload=payload, priority=priority)
+        self.backend.put(job, available_at=time.time() + delay)
+        return job
+
+    def enqueue_many(
+        self, kind: str, payloads: list[dict[str, Any]], *, priority: int = 0
+    ) -> list[Job]:
+        jobs = [Job(kind=kind, payload=payload, priority=priority) for payload in payloads]
+        self.backend.put_many(jobs, available_at=time.time())
+        return jobs
+
+    def dequeue(self, *, limit: int = 1, timeout: float = 0.0) -> list[Job]:
+        """Reserve up to ``limit`` jobs, polling for at most ``timeout`` seconds."""
+        deadline = time.monotonic() + timeout
+        while True:
+            jobs = self.backend.reserve(
+                limit, now=time.time(), visibility_timeout=self.visibility_timeout
+            )
+            if jobs or time.monotonic() >= deadline:
+                return jobs
+            time.sleep(min(self.poll_interval, max(deadline - time.monotonic(), 0.0)))
+
+    def complete(self, job: Job) -> bool:
+        return self.backend.ack(job)
+
+    def fail(self, job: Job, error: str) -> bool:
+        """Schedule a retry with backoff, or dead-letter the job. Returns True if retried."""
+        if job.attempts >= self.retry.max_attempts:
+            self.backend.bury(job, error)
+            return False
+        available_at = time.time() + self.retry.delay(job.attempts)
+        return self.backend.release(job, available_at=available_at)
+
+    def pending_count(self) -> int:
+        return self.backend.pending_count()
@@ -0,0 +1,74 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from apps.workers.priority import PriorityQueueBackend
+from apps.workers.queue import Job
+
+
+def test_urgent_jobs_jump_ahead_of_bulk_work() -> None:
+    backend = PriorityQueueBackend(aging_interval=60.0)
+    backend.put_many([Job("bulk", {"n": n}, priority=5) for n in range(3)], available_at=0.0)
+    backend.put(Job("urgent", {}, priority=1), available_at=1.0)
+
+    jobs = backend.reserve(2, now=1.0, visibility_timeout=30.0)
+
+    assert [job.kind for job in jobs] == ["urgent", "bulk"]
+
+
+def test_aging_prevents_starvation() -> None:
+    backend = PriorityQueueBackend(aging_interval=1.0)
+    backend.put(Job("old-low", {}, priority=5), available_at=0.0)
+    backend.put(Job("new-high", {}, priority=1), available_at=4.5)
+
+    [job] = backend.reserve(1, now=5.0, visibility_timeout=30.0)
+
+    assert job.kind == "old-low"
+
+
+def test_metrics_report_depth_and_wait_per_priority() -> None:
+    backend = PriorityQueueBackend()
+    backend.put(Job("a", {}, priority=1), available_at=0.0)
+    backend.put(Job("b", {}, priority=3), available_at=0.0)
+    backend.put(Job("c", {}, priority=3), available_at=0.0)
+
+    backend.reserve(1, now=2.0, visibility_timeout=30.0)
+    metrics = backend.metrics()
+
+    assert metrics[1].depth == 0 and metrics[1].dequeued == 1
+    assert metrics[1].max_wait == 2.0
+    assert metrics[3].depth == 2 and metrics[3].dequeued == 0
+
+
+def sql_backend(tmp_path: Path, **options: float) -> Any:
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    from apps.workers.sql_queue import SqlQueueBackend
+
+    backend = SqlQueueBackend(sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'q.db'}"), **options)
+    backend.create_schema()
+    return backend
+
+
+def test_sql_backend_ages_waiting_jobs(tmp_path: Path) -> None:
+    backend = sql_backend(tmp_path, aging_interval=1.0)
+    backend.put(Job("old-low", {}, priority=5), available_at=0.0)
+    backend.put(Job("new-high", {}, priority=1), available_at=4.5)
+
+    jobs = backend.reserve(2, now=5.0, visibility_timeout=30.0)
+
+    assert [job.kind for job in jobs] == ["old-low", "new-high"]
+
+
+def test_sql_backend_metrics_report_depth_and_wait_per_priority(tmp_path: Path) -> None:
+    backend = sql_backend(tmp_path)
+    backend.put(Job("a", {}, priority=1), available_at=0.0)
+    backend.put(Job("b", {}, priority=3), available_at=0.0)
+    backend.put(Job("c", {}, priority=3), available_at=0.0)
+
+    backend.reserve(1, now=2.0, visibility_timeout=30.0)
+    metrics = backend.metrics()
+
+    assert metrics[1].depth == 0 and metrics[1].dequeued == 1
+    assert metrics[1].max_wait == 2.0
+    assert metrics[3].depth == 2 and metrics[3].dequeued == 0
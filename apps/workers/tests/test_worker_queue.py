@@ -1,5 +1,96 @@
-from apps.workers.queue import worker_name
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from apps.workers.pool import WorkerPool
+from apps.workers.queue import InMemoryQueueBackend, JobQueue, RetryPolicy, worker_name
 
 
 def test_worker_name_is_not_empty() -> None:
     assert worker_name()
+
+
+def test_dequeue_orders_by_priority_and_batches() -> None:
+    queue = JobQueue(InMemoryQueueBackend())
+    queue.enqueue("a", {"n": 1}, priority=5)
+    queue.enqueue("a", {"n": 2}, priority=1)
+    queue.enqueue("a", {"n": 3}, priority=3)
+
+    jobs = queue.dequeue(limit=2)
+
+    assert [job.payload["n"] for job in jobs] == [2, 3]
+    assert all(job.attempts == 1 for job in jobs)
+
+
+def test_expired_visibility_timeout_redelivers_job() -> None:
+    queue = JobQueue(InMemoryQueueBackend(), visibility_timeout=0.01)
+    queue.enqueue("a", {})
+    [first] = queue.dequeue()
+
+    assert queue.dequeue() == []
+    time.sleep(0.02)
+    [second] = queue.dequeue()
+
+    assert second.id == first.id and second.attempts == 2
+    assert not queue.complete(first)
+    assert queue.complete(second)
+    assert queue.pending_count() == 0
+
+
+def test_failed_job_backs_off_then_dead_letters() -> None:
+    backend = InMemoryQueueBackend()
+    queue = JobQueue(backend, retry=RetryPolicy(max_attempts=2, base_delay=0.01))
+    queue.enqueue("a", {})
+
+    [job] = queue.dequeue()
+    assert queue.fail(job, "boom")
+    assert queue.dequeue() == []
+    [job] = queue.dequeue(timeout=0.5)
+    assert not queue.fail(job, "boom again")
+
+    assert backend.dead[job.id][1] == "boom again"
+    assert queue.pending_count() == 0
+
+
+def test_sql_backend_claims_each_job_once(tmp_path: Path) -> None:
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    from apps.workers.sql_queue import SqlQueueBackend
+
+    backend = SqlQueueBackend(sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'q.db'}"))
+    backend.create_schema()
+    queue = JobQueue(backend)
+    queue.enqueue_many("a", [{"n": n} for n in range(5)])
+    queue.enqueue("a", {"n": 99}, priority=-1)
+
+    first = queue.dequeue(limit=3)
+    second = queue.dequeue(limit=10)
+
+    assert first[0].payload == {"n": 99}
+    assert {job.id for job in first}.isdisjoint({job.id for job in second})
+    assert len(first) + len(second) == 6
+    assert all(queue.complete(job) for job in first + second)
+    assert queue.pending_count() == 0
+
+
+def test_thread_pool_drains_queue() -> None:
+    queue = JobQueue(InMemoryQueueBackend(), retry=RetryPolicy(base_delay=0.0))
+    seen: list[int] = []
+    attempts: dict[int, int] = {}
+
+    def handler(payload: dict[str, Any]) -> None:
+        number = payload["n"]
+        attempts[number] = attempts.get(number, 0) + 1
+        if number == 3 and attempts[number] == 1:
+            raise RuntimeError("transient")
+        seen.append(number)
+
+    queue.enqueue_many("work", [{"n": n} for n in range(10)])
+    with WorkerPool(lambda: queue, {"work": handler}, concurrency=3, mode="thread"):
+        deadline = time.monotonic() + 5
+        while queue.pending_count() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert sorted(seen) == list(range(10))
+    assert attempts[3] == 2
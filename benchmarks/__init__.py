@@ -0,0 +1 @@
+"""Micro-benchmarks for hot paths. Run modules with ``python -m benchmarks.<name>``."""
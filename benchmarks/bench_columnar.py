@@ -0,0 +1,84 @@
+"""Compare memory and bulk-insert cost of dict payloads and column containers.
+
+Usage: ``python -m benchmarks.bench_columnar [--items N]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import create_engine
+
+from apps.api.app.db.models import Base
+from apps.api.app.threads.repository import SqlAlchemyPlannerOutputRepository
+from benchmarks.generators import planner_bundle
+from packages.schemas.columnar import ActionCardColumns, TimelineEventColumns
+
+
+def retained_bytes(build: Callable[[], Any]) -> tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def save_seconds(bundle: dict[str, Any]) -> float:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    started = time.perf_counter()
+    SqlAlchemyPlannerOutputRepository(engine).save_planner_outputs(**bundle)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    args = parser.parse_args()
+
+    bundle = planner_bundle(args.items)
+    for section, columns_type in (
+        ("action_cards", ActionCardColumns),
+        ("timeline_events", TimelineEventColumns),
+    ):
+        raw = json.dumps(bundle[section]).encode()
+        payloads, dict_bytes = retained_bytes(lambda raw=raw: json.loads(raw))
+        del payloads
+        columns, column_bytes = retained_bytes(
+            lambda raw=raw, columns_type=columns_type: columns_type(json.loads(raw))
+        )
+        bundle[f"{section}_columns"] = columns
+        print(
+            f"{section:<16} dicts={dict_bytes / args.items:6.0f}B/item "
+            f"columns={column_bytes / args.items:6.0f}B/item "
+            f"ratio={dict_bytes / column_bytes:4.1f}x"
+        )
+
+    header = {"thread_pass": bundle["thread_pass"], "skill_registry": bundle["skill_registry"]}
+    dict_s = save_seconds(
+        {
+            **header,
+            "action_cards": bundle["action_cards"],
+            "timeline_events": bundle["timeline_events"],
+        }
+    )
+    column_s = save_seconds(
+        {
+            **header,
+            "action_cards": bundle["action_cards_columns"],
+            "timeline_events": bundle["timeline_events_columns"],
+        }
+    )
+    print(f"sqlite save      dicts={dict_s:6.2f}s columns={column_s:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Compare the MSAL cache store against a naive load/decrypt/re-encrypt per request.
+
+Uses a fake MSAL client whose silent token acquisition refreshes a token on a
+small fraction of calls, and an SQLite database.
+
+Usage: ``python -m benchmarks.bench_msal_cache_store [--requests N] [--users U]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+from sqlalchemy import Engine, create_engine, insert, select, update
+
+from apps.api.app.auth.msal_cache_store import MsalTokenCacheStore
+from apps.api.app.auth.msal_store import decrypt_blob, encrypt_blob
+from apps.api.app.db.models import Base, MsalCache
+
+
+class FakeTokenCache:
+    def __init__(self) -> None:
+        self.tokens: dict[str, str] = {}
+        self.has_state_changed = False
+
+    def serialize(self) -> str:
+        self.has_state_changed = False
+        return json.dumps(self.tokens)
+
+    def deserialize(self, state: str | None) -> None:
+        self.tokens = json.loads(state) if state else {}
+        self.has_state_changed = False
+
+
+class FakeMsalClient:
+    """Mimics ``acquire_token_silent``: usually a cache hit, sometimes a refresh."""
+
+    def __init__(self, refresh_ratio: float, seed: int = 7) -> None:
+        self._refresh_ratio = refresh_ratio
+        self._random = random.Random(seed)
+
+    def acquire_token_silent(self, cache: FakeTokenCache) -> str:
+        if "graph" not in cache.tokens or self._random.random() < self._refresh_ratio:
+            cache.tokens["graph"] = f"token-{self._random.random()}"
+            cache.tokens.update({f"account-{i}": "x" * 200 for i in range(20)})
+            cache.has_state_changed = True
+        return cache.tokens["graph"]
+
+
+def _engine(directory: str, name: str) -> Engine:
+    engine = create_engine(f"sqlite:///{Path(directory) / name}.db")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def naive(engine: Engine, client: FakeMsalClient, keys: list[str]) -> None:
+    for key in keys:
+        with engine.begin() as connection:
+            blob = connection.execute(
+                select(MsalCache.encrypted_blob).where(MsalCache.cache_key == key)
+            ).scalar()
+            cache = FakeTokenCache()
+            cache.deserialize(decrypt_blob(blob).decode("utf-8") if blob else None)
+            client.acquire_token_silent(cache)
+            new_blob = encrypt_blob(cache.serialize().encode("utf-8"))
+            if blob is None:
+                connection.execute(
+                    insert(MsalCache).values(user_id=key, cache_key=key, encrypted_blob=new_blob)
+                )
+            else:
+                connection.execute(
+                    update(MsalCache)
+                    .where(MsalCache.cache_key == key)
+                    .values(encrypted_blob=new_blob)
+                )
+
+
+def with_store(engine: Engine, client: FakeMsalClient, keys: list[str]) -> MsalTokenCacheStore:
+    store = MsalTokenCacheStore(engine, cache_factory=FakeTokenCache)
+    for key in keys:
+        cache = store.load(key, key)
+        client.acquire_token_silent(cache)  # type: ignore[arg-type]
+        store.save(key)
+    store.close()
+    return store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--refresh-ratio", type=float, default=0.02)
+    args = parser.parse_args()
+    os.environ.setdefault("APP_MASTER_KEY", Fernet.generate_key().decode("utf-8"))
+
+    rng = random.Random(1)
+    keys = [f"user-{rng.randrange(args.users)}" for _ in range(args.requests)]
+    with tempfile.TemporaryDirectory() as directory:
+        engine = _engine(directory, "naive")
+        started = time.perf_counter()
+        naive(engine, FakeMsalClient(args.refresh_ratio), keys)
+        naive_s = time.perf_counter() - started
+
+        engine = _engine(directory, "store")
+        started = time.perf_counter()
+        store = with_store(engine, FakeMsalClient(args.refresh_ratio), keys)
+        store_s = time.perf_counter() - started
+
+    stats = store.stats
+    print(
+        f"requests={args.requests} naive={naive_s / args.requests * 1e6:8.1f}us/req "
+        f"store={store_s / args.requests * 1e6:8.1f}us/req speedup={naive_s / store_s:5.1f}x "
+        f"(hits={stats.hits} misses={stats.misses} writes={stats.writes} "
+        f"coalesced={stats.coalesced})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Compare bulk planner persistence against per-row ORM inserts on SQLite.
+
+Usage: ``python -m benchmarks.bench_planner_repository [--events N] [--chunk-size C]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session
+
+from apps.api.app.db.models import Base, PlannerActionCard, PlannerTimelineEvent
+from apps.api.app.threads.repository import (
+    SqlAlchemyPlannerOutputRepository,
+    action_card_row,
+    timeline_event_row,
+)
+from benchmarks.bench_schema_validation import action_card, timeline_event
+
+
+def bundle(events: int) -> dict[str, Any]:
+    cards = [action_card(index) for index in range(events // 4)]
+    timeline = [timeline_event(index) for index in range(events)]
+    return {
+        "thread_pass": {
+            "thread_id": "t_bench",
+            "pass_id": "p_bench",
+            "pass_index": 0,
+            "created_at": "2025-01-01T00:00:00Z",
+            "planner_summary": "bench",
+            "action_card_ids": [card["card_id"] for card in cards],
+            "timeline_event_ids": [event["event_id"] for event in timeline],
+            "skill_registry_id": "sr_bench",
+        },
+        "action_cards": cards,
+        "skill_registry": {
+            "registry_id": "sr_bench",
+            "generated_at": "2025-01-01T00:00:00Z",
+            "skills": [],
+        },
+        "timeline_events": timeline,
+    }
+
+
+def _engine(directory: str, name: str) -> Engine:
+    engine = create_engine(f"sqlite:///{Path(directory) / name}.db")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def save_per_row_orm(engine: Engine, data: dict[str, Any]) -> None:
+    """Naive baseline: one ORM object and flush per card and event."""
+    pass_id = data["thread_pass"]["pass_id"]
+    with Session(engine) as session, session.begin():
+        for card in data["action_cards"]:
+            session.add(PlannerActionCard(**action_card_row(pass_id, card)))
+            session.flush()
+        for event in data["timeline_events"]:
+            session.add(PlannerTimelineEvent(**timeline_event_row(pass_id, event)))
+            session.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+    data = bundle(args.events)
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = _engine(directory, "orm")
+        started = time.perf_counter()
+        save_per_row_orm(engine, data)
+        orm_s = time.perf_counter() - started
+
+        engine = _engine(directory, "bulk")
+        repository = SqlAlchemyPlannerOutputRepository(engine, chunk_size=args.chunk_size)
+        started = time.perf_counter()
+        repository.save_planner_outputs(**data)
+        bulk_s = time.perf_counter() - started
+
+    rows = len(data["action_cards"]) + len(data["timeline_events"])
+    print(
+        f"rows={rows} per_row_orm={orm_s * 1e3:8.1f}ms "
+        f"bulk_chunked={bulk_s * 1e3:8.1f}ms speedup={orm_s / bulk_s:4.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Compare ``PolicyEngine`` with ``is_action_allowed`` over a hand-expanded table.
+
+Usage: ``PYTHONPATH=.:packages/policy python -m benchmarks.bench_policy_engine [--checks N]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from policy import PolicyEngine, is_action_allowed
+
+NAMESPACES = [f"ns{index}" for index in range(50)]
+VERBS = [f"verb{index}" for index in range(20)]
+
+
+def tables() -> tuple[dict[str, set[str]], PolicyEngine]:
+    """The same policy as wildcard grants with inheritance and as expanded sets."""
+    grants: dict[str, set[str]] = {}
+    inherits: dict[str, list[str]] = {}
+    for index, namespace in enumerate(NAMESPACES[:40]):
+        role = f"role{index}"
+        grants[role] = {f"{namespace}.*", f"{NAMESPACES[index + 1]}.verb0"}
+        if index:
+            inherits[role] = [f"role{index - 1}"]
+    grants["admin"] = {"*"}
+
+    everything = {f"{namespace}.{verb}" for namespace in NAMESPACES for verb in VERBS}
+    expanded: dict[str, set[str]] = {"admin": everything}
+    for index, namespace in enumerate(NAMESPACES[:40]):
+        own = {f"{namespace}.{verb}" for verb in VERBS} | {f"{NAMESPACES[index + 1]}.verb0"}
+        expanded[f"role{index}"] = own | expanded.get(f"role{index - 1}", set())
+    return expanded, PolicyEngine(grants, inherits=inherits)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checks", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=8)
+    args = parser.parse_args()
+
+    expanded, engine = tables()
+    rng = random.Random(3)
+    roles = [*expanded, "guest", "unknown"]
+    queries = [
+        (rng.choice(roles), f"{rng.choice(NAMESPACES)}.{rng.choice(VERBS)}")
+        for _ in range(args.checks)
+    ]
+    for role, action in queries[:1000]:
+        assert engine.is_allowed(role, action) == is_action_allowed(role, action, expanded)
+
+    started = time.perf_counter()
+    for role, action in queries:
+        is_action_allowed(role, action, expanded)
+    gate_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for role, action in queries:
+        engine.is_allowed(role, action)
+    engine_s = time.perf_counter() - started
+
+    batches = [
+        (queries[start][0], [action for _, action in queries[start : start + args.batch]])
+        for start in range(0, len(queries), args.batch)
+    ]
+    started = time.perf_counter()
+    for role, actions in batches:
+        engine.check_many(role, actions)
+    many_s = time.perf_counter() - started
+
+    per_check = 1e9 / args.checks
+    print(f"is_action_allowed   {gate_s * per_check:7.1f} ns/check")
+    print(f"PolicyEngine        {engine_s * per_check:7.1f} ns/check")
+    print(f"check_many (x{args.batch:<3})  {many_s * per_check:7.1f} ns/check")
+
+
+if __name__ == "__main__":
+    main()
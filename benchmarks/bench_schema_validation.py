@@ -0,0 +1,67 @@
+"""Compare per-payload validation cost of compiled validators and the reference walk.
+
+Usage: ``python -m benchmarks.bench_schema_validation [--payloads N] [--repeat R]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Any
+
+from packages.schemas.validator import _compiled_validator, _load_schema, _run, _validate
+
+
+def action_card(index: int) -> dict[str, Any]:
+    return {
+        "card_id": f"ac_{index}",
+        "title": f"Card {index}",
+        "kind": "task",
+        "status": "in_progress",
+        "priority": index % 6,
+        "created_at": "2025-01-01T00:00:00Z",
+        "owner": "planner",
+        "metadata": {"source": "bench", "confidence": 0.5},
+    }
+
+
+def timeline_event(index: int) -> dict[str, Any]:
+    return {
+        "event_id": f"e_{index}",
+        "event_type": "planner_passed",
+        "occurred_at": "2025-01-01T00:00:00+00:00",
+        "message": f"event {index}",
+        "details": {"pass_index": index, "latency_ms": 12},
+    }
+
+
+def _per_payload_us(func: Any, payloads: list[dict[str, Any]], repeat: int) -> float:
+    def run() -> None:
+        for payload in payloads:
+            func(payload)
+
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    return best / len(payloads) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payloads", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for schema_name, factory in (("action_card", action_card), ("timeline_event", timeline_event)):
+        payloads = [factory(index) for index in range(args.payloads)]
+        schema = _load_schema(schema_name)
+        compiled = _compiled_validator(schema_name)
+
+        interpreted_us = _per_payload_us(lambda p: _validate(schema, p), payloads, args.repeat)
+        compiled_us = _per_payload_us(lambda p: _run(compiled, p), payloads, args.repeat)
+        print(
+            f"{schema_name:<16} interpreted={interpreted_us:7.2f}us "
+            f"compiled={compiled_us:7.2f}us speedup={interpreted_us / compiled_us:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
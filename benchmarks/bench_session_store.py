@@ -0,0 +1,91 @@
+"""Load test concurrent ``SessionStore.validate`` calls against each backend.
+
+The ``signed-token`` row validates stateless ``SessionTokenCodec`` tokens
+instead, for comparison with the server-side lookups.
+
+Usage: ``python -m benchmarks.bench_session_store [--sessions N] [--lookups N] [--threads 1 4 8]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine
+
+from apps.api.app.auth.session_store import (
+    InMemorySessionBackend,
+    SessionBackend,
+    SessionStore,
+    ShardedSessionBackend,
+    SqlSessionBackend,
+)
+from apps.api.app.auth.session_tokens import SessionTokenCodec
+from apps.api.app.db.models import Base
+
+
+def backends(directory: str) -> dict[str, SessionBackend]:
+    engine = create_engine(f"sqlite:///{Path(directory) / 'sessions.db'}")
+    Base.metadata.create_all(engine)
+    return {
+        "memory": InMemorySessionBackend(),
+        "sharded-memory-x8": ShardedSessionBackend(
+            [InMemorySessionBackend() for _ in range(8)]
+        ),
+        "sqlite": SqlSessionBackend(engine),
+    }
+
+
+def run(
+    validate: Callable[[str], Any], session_ids: list[str], lookups: int, threads: int
+) -> float:
+    per_thread = lookups // threads
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(per_thread):
+            validate(rng.choice(session_ids))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(worker, range(threads)))
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=40_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        targets: dict[str, tuple[Callable[[str], Any], list[str]]] = {}
+        for name, backend in backends(directory).items():
+            store = SessionStore(backend)
+            sessions = [store.create(roles=["viewer"]).session_id for _ in range(args.sessions)]
+            targets[name] = (store.validate, sessions)
+        codec = SessionTokenCodec(b"bench-signing-key".ljust(32, b"."))
+        targets["signed-token"] = (
+            codec.verify,
+            [codec.issue()[0] for _ in range(args.sessions)],
+        )
+        for name, (validate, sessions) in targets.items():
+            for threads in args.threads:
+                elapsed = run(validate, sessions, args.lookups, threads)
+                lookups = args.lookups // threads * threads
+                print(
+                    f"{name:<18} threads={threads:<2} "
+                    f"{lookups / elapsed:10.0f} validations/s "
+                    f"{elapsed / lookups * 1e6:8.2f} us/validation"
+                )
+
+
+if __name__ == "__main__":
+    main()
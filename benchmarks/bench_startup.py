@@ -0,0 +1,86 @@
+"""Cold-start import cost of the API and worker entry modules.
+
+Each module is imported in a fresh interpreter under ``-X importtime``; its
+cost is the cumulative time of the module and its parent packages, taken as
+the best of ``--repeat`` runs. With ``--check`` the process exits non-zero
+when a module exceeds its budget or has loaded a dependency it is meant to
+import only on first use.
+
+Usage: ``python -m benchmarks.bench_startup [--repeat N] [--check]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import subprocess
+import sys
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Budget:
+    module: str
+    milliseconds: float
+    deferred: tuple[str, ...] = ()
+
+
+# Roughly three times the cost measured on a developer machine, so that only a
+# new eager import of something heavy trips them on a slower CI runner.
+BUDGETS = (
+    Budget("packages.schemas", 40, ("msgspec", "sqlalchemy", "cryptography")),
+    Budget("packages.instrumentation", 60),
+    Budget("apps.workers.queue", 100, ("sqlalchemy",)),
+    Budget("apps.api.app.auth.msal_store", 100, ("cryptography", "sqlalchemy")),
+    Budget("apps.api.app.threads.service", 500, ("msgspec", "sqlalchemy")),
+    Budget("apps.api.app.auth.routes", 1500, ("sqlalchemy", "cryptography", "msgspec")),
+)
+
+
+def import_cost(module: str, deferred: tuple[str, ...]) -> tuple[float, list[str]]:
+    """Milliseconds to import ``module`` in a new interpreter, and deferred modules it loaded."""
+    code = f"import sys, {module}; print(sorted(set({deferred!r}) & sys.modules.keys()))"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    microseconds = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level entries only: everything the module pulls in is nested
+        # under it or under one of its parent packages.
+        if name.startswith("  "):
+            continue
+        name = name.strip()
+        if module == name or module.startswith(f"{name}."):
+            microseconds += int(cumulative)
+    return microseconds / 1000, ast.literal_eval(completed.stdout)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check", action="store_true", help="fail on exceeded budgets")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for budget in BUDGETS:
+        runs = [import_cost(budget.module, budget.deferred) for _ in range(args.repeat)]
+        milliseconds = min(cost for cost, _ in runs)
+        loaded = runs[0][1]
+        print(f"{budget.module:<32} {milliseconds:8.1f} ms  (budget {budget.milliseconds:.0f} ms)")
+        if milliseconds > budget.milliseconds:
+            print(f"OVER BUDGET {budget.module}: {milliseconds:.1f} ms")
+            failed = True
+        if loaded:
+            print(f"EAGER IMPORT {budget.module}: loads {', '.join(loaded)}")
+            failed = True
+    return 1 if args.check and failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
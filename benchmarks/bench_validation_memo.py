@@ -0,0 +1,91 @@
+"""Compare planner-bundle validation with and without a ``ValidationMemo``.
+
+Each simulated planner pass resends the previous pass's skill registry and
+action cards with only ``--changed`` percent of the cards edited, plus a few
+new timeline events, which is the traffic the memo is meant for.
+
+Usage: ``python -m benchmarks.bench_validation_memo [--cards N] [--passes P] [--changed PCT]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any
+
+from benchmarks.bench_schema_validation import action_card, timeline_event
+from packages.schemas.memo import ValidationMemo
+from packages.schemas.validator import check_planner_bundle
+
+
+def skill_registry(skills: int) -> dict[str, Any]:
+    return {
+        "registry_id": "sr_bench",
+        "generated_at": "2025-01-01T00:00:00Z",
+        "skills": [
+            {"name": f"skill-{index}", "version": "1.2.3", "enabled": True, "tags": ["bench"]}
+            for index in range(skills)
+        ],
+    }
+
+
+def planner_passes(cards: int, passes: int, changed: float) -> list[dict[str, Any]]:
+    current = [action_card(index) for index in range(cards)]
+    registry = skill_registry(50)
+    edits = max(1, int(cards * changed / 100))
+    bundles = []
+    for pass_index in range(passes):
+        for offset in range(edits):
+            index = (pass_index * edits + offset) % cards
+            current[index] = {**current[index], "title": f"Card {index} pass {pass_index}"}
+        events = [timeline_event(pass_index * 10 + index) for index in range(10)]
+        bundles.append(
+            {
+                "thread_pass": {
+                    "thread_id": "t_bench",
+                    "pass_id": f"p_{pass_index}",
+                    "pass_index": pass_index,
+                    "created_at": "2025-01-01T00:00:00Z",
+                    "planner_summary": "bench",
+                    "action_card_ids": [card["card_id"] for card in current],
+                    "timeline_event_ids": [event["event_id"] for event in events],
+                    "skill_registry_id": "sr_bench",
+                },
+                "action_cards": list(current),
+                "skill_registry": registry,
+                "timeline_events": events,
+            }
+        )
+    return bundles
+
+
+def _run(bundles: list[dict[str, Any]], memo: ValidationMemo | None) -> float:
+    started = time.perf_counter()
+    for bundle in bundles:
+        if check_planner_bundle(**bundle, memo=memo):
+            raise AssertionError("benchmark bundle should be valid")
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--passes", type=int, default=20)
+    parser.add_argument("--changed", type=float, default=5.0)
+    args = parser.parse_args()
+
+    bundles = planner_passes(args.cards, args.passes, args.changed)
+    memo = ValidationMemo()
+    plain = _run(bundles, None)
+    memoized = _run(bundles, memo)
+    stats = memo.stats()
+    per_pass = 1e3 / args.passes
+    print(f"without memo  {plain * per_pass:8.2f}ms/pass")
+    print(
+        f"with memo     {memoized * per_pass:8.2f}ms/pass speedup={plain / memoized:4.2f}x "
+        f"hits={stats.hits} misses={stats.misses} size={stats.size}"
+    )
+
+
+if __name__ == "__main__":
+    main()
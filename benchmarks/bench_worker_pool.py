@@ -0,0 +1,74 @@
+"""Measure worker pool throughput scaling with a CPU-bound handler on SQLite.
+
+Usage: ``python -m benchmarks.bench_worker_pool [--jobs N] [--work W] [--concurrency 1 2 4]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine
+
+from apps.workers.pool import WorkerPool
+from apps.workers.queue import JobQueue
+from apps.workers.sql_queue import SqlQueueBackend
+
+
+def burn(payload: dict[str, Any]) -> None:
+    total = 0
+    for value in range(payload["work"]):
+        total += value * value
+
+
+def sqlite_queue(path: str) -> JobQueue:
+    engine = create_engine(f"sqlite:///{path}", connect_args={"timeout": 30})
+    return JobQueue(SqlQueueBackend(engine), poll_interval=0.01)
+
+
+def run(path: str, jobs: int, work: int, concurrency: int, batch_size: int) -> float:
+    queue = sqlite_queue(path)
+    queue.enqueue_many("burn", [{"work": work} for _ in range(jobs)])
+
+    started = time.perf_counter()
+    with WorkerPool(
+        partial(sqlite_queue, path),
+        {"burn": burn},
+        concurrency=concurrency,
+        batch_size=batch_size,
+        idle_timeout=0.05,
+    ):
+        while queue.pending_count():
+            time.sleep(0.01)
+    return jobs / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--work", type=int, default=50000)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    print(f"cpus={os.cpu_count()} jobs={args.jobs} work={args.work}")
+    baseline: float | None = None
+    with tempfile.TemporaryDirectory() as directory:
+        for concurrency in args.concurrency:
+            path = str(Path(directory) / f"queue_{concurrency}.db")
+            SqlQueueBackend(create_engine(f"sqlite:///{path}")).create_schema()
+            throughput = run(path, args.jobs, args.work, concurrency, args.batch_size)
+            baseline = baseline or throughput
+            print(
+                f"concurrency={concurrency:<3} throughput={throughput:8.1f} jobs/s "
+                f"scaling={throughput / baseline:4.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
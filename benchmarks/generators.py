@@ -0,0 +1,102 @@
+"""Deterministic synthetic inputs shared by the benchmark suite."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from apps.api.app.threads.repository import (
+    action_card_rows,
+    skill_registry_row,
+    thread_pass_row,
+    timeline_event_rows,
+)
+from benchmarks.bench_schema_validation import action_card, timeline_event
+from packages.schemas.columnar import ActionCardColumns, TimelineEventColumns
+
+BUNDLE_SIZES = (1, 1_000, 100_000)
+BLOB_SIZES = (1024, 64 * 1024, 1024 * 1024)
+
+
+def planner_bundle(cards: int, events: int | None = None) -> dict[str, Any]:
+    """A valid bundle with ``cards`` action cards and ``events`` timeline events."""
+    events = cards if events is None else events
+    action_cards = [action_card(index) for index in range(cards)]
+    timeline = [timeline_event(index) for index in range(events)]
+    for index, event in enumerate(timeline):
+        if cards and index % 4 == 0:
+            event["action_card_id"] = action_cards[index % cards]["card_id"]
+    return {
+        "thread_pass": {
+            "thread_id": "t_bench",
+            "pass_id": f"p_{cards}_{events}",
+            "pass_index": 0,
+            "created_at": "2025-01-01T00:00:00Z",
+            "planner_summary": "synthetic planner pass",
+            "action_card_ids": [card["card_id"] for card in action_cards],
+            "timeline_event_ids": [event["event_id"] for event in timeline],
+            "skill_registry_id": "sr_bench",
+        },
+        "action_cards": action_cards,
+        "skill_registry": {
+            "registry_id": "sr_bench",
+            "generated_at": "2025-01-01T00:00:00Z",
+            "skills": [
+                {"name": f"skill-{index}", "version": "1.0.0", "enabled": index % 3 != 0}
+                for index in range(25)
+            ],
+        },
+        "timeline_events": timeline,
+    }
+
+
+def blob(size: int, *, seed: int = 7) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def permission_table(
+    roles: int, actions_per_role: int, *, namespaces: int = 200, verbs: int = 50, seed: int = 11
+) -> dict[str, set[str]]:
+    """Expanded role -> action sets as ``is_action_allowed`` expects them."""
+    rng = random.Random(seed)
+    catalogue = [f"ns{n}.verb{v}" for n in range(namespaces) for v in range(verbs)]
+    return {f"role{index}": set(rng.sample(catalogue, actions_per_role)) for index in range(roles)}
+
+
+def permission_queries(
+    table: dict[str, set[str]],
+    count: int,
+    *,
+    namespaces: int = 200,
+    verbs: int = 50,
+    seed: int = 13,
+) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    roles = [*table, "guest"]
+    return [
+        (rng.choice(roles), f"ns{rng.randrange(namespaces)}.verb{rng.randrange(verbs)}")
+        for _ in range(count)
+    ]
+
+
+class InMemoryPlannerOutputRepository:
+    """Keeps the rows the SQL repository would insert, without a database."""
+
+    accepts_columns = True
+
+    def __init__(self) -> None:
+        self.rows: list[dict[str, Any]] = []
+
+    def save_planner_outputs(
+        self,
+        *,
+        thread_pass: dict[str, Any],
+        action_cards: list[dict[str, Any]] | ActionCardColumns,
+        skill_registry: dict[str, Any],
+        timeline_events: list[dict[str, Any]] | TimelineEventColumns,
+    ) -> None:
+        pass_id = thread_pass["pass_id"]
+        rows = [thread_pass_row(thread_pass), skill_registry_row(pass_id, skill_registry)]
+        rows += action_card_rows(pass_id, action_cards)
+        rows += timeline_event_rows(pass_id, timeline_events)
+        self.rows = rows
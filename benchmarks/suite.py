@@ -0,0 +1,298 @@
+"""Benchmark the hot paths and compare them with a stored baseline.
+
+Each case is timed as the best of ``--repeat`` rounds, each round running the
+operation until it has taken at least ``--min-time`` seconds. Timings are also
+divided by the time of a fixed pure-Python calibration loop, measured in the
+same process before and after the cases, so a baseline recorded on one machine
+is comparable on another; regressions are judged on these normalised costs.
+
+Results go to ``--output`` as tab-separated ``case``, ``seconds_per_op``,
+``normalized`` and ``ops`` columns, one case per line after a ``#`` header.
+With ``--check`` the process exits non-zero when a gated case is more than
+``--tolerance`` slower than the baseline; ``--update-baseline`` rewrites it.
+
+Only pure-Python cases are gated. The calibration loop is pure Python, so it
+does not cancel out machine differences for cases that mostly time C code
+(msgspec decoding, Fernet), and those drift well past any useful tolerance
+between runners; their slowdowns are reported as advisory only.
+
+Usage: ``python -m benchmarks.suite [--quick] [--check] [--update-baseline] [--filter TEXT]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from benchmarks.generators import (
+    BLOB_SIZES,
+    BUNDLE_SIZES,
+    InMemoryPlannerOutputRepository,
+    blob,
+    permission_queries,
+    permission_table,
+    planner_bundle,
+)
+
+DEFAULT_OUTPUT = Path("bench_output.txt")
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+# Unchanged trees have measured up to 2.0x baseline on gated cases on a shared
+# single-CPU runner, so only a slowdown clearly beyond that noise fails.
+DEFAULT_TOLERANCE = 1.5
+QUICK_MAX_SIZE = 1_000
+POLICY_CHECKS = 10_000
+
+
+@dataclass(frozen=True)
+class Case:
+    """``setup`` builds the inputs and returns the operation to time.
+
+    ``gated`` cases fail ``--check``; the others are dominated by C code the
+    calibration loop does not track, so their slowdowns are only reported.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    ops: int = 1
+    size: int = 1
+    gated: bool = True
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    seconds_per_op: float
+    normalized: float
+    ops: int
+    gated: bool = True
+
+
+def _bundle_cases() -> Iterator[Case]:
+    from apps.api.app.threads.service import persist_planner_outputs
+    from packages.schemas import decode_planner_bundle, validate_planner_bundle
+
+    for size in BUNDLE_SIZES:
+
+        def validate(size: int = size) -> Callable[[], object]:
+            bundle = planner_bundle(size)
+            return lambda: validate_planner_bundle(**bundle)
+
+        def persist(size: int = size) -> Callable[[], object]:
+            bundle = planner_bundle(size)
+            repository = InMemoryPlannerOutputRepository()
+            return lambda: persist_planner_outputs(repository, **bundle)
+
+        def decode(size: int = size) -> Callable[[], object]:
+            body = memoryview(json.dumps(planner_bundle(size)).encode())
+            return lambda: decode_planner_bundle(body)
+
+        yield Case(f"validate_planner_bundle[{size}]", validate, size=size)
+        yield Case(f"decode_planner_bundle[{size}]", decode, size=size, gated=False)
+        yield Case(f"persist_planner_outputs[memory,{size}]", persist, size=size)
+
+
+def _crypto_cases() -> Iterator[Case]:
+    from cryptography.fernet import Fernet
+
+    from apps.api.app.auth.msal_store import decrypt_blob, encrypt_blob
+
+    os.environ.setdefault("APP_MASTER_KEY", Fernet.generate_key().decode())
+    for size in BLOB_SIZES:
+        label = f"{size // 1024}KiB"
+
+        def encrypt(size: int = size) -> Callable[[], object]:
+            payload = blob(size)
+            return lambda: encrypt_blob(payload)
+
+        def decrypt(size: int = size) -> Callable[[], object]:
+            token = encrypt_blob(blob(size))
+            return lambda: decrypt_blob(token)
+
+        yield Case(f"encrypt_blob[{label}]", encrypt, gated=False)
+        yield Case(f"decrypt_blob[{label}]", decrypt, gated=False)
+
+
+def _policy_cases() -> Iterator[Case]:
+    from packages.policy.policy import PolicyEngine, is_action_allowed
+
+    def gate() -> Callable[[], object]:
+        table = permission_table(1_000, 500)
+        queries = permission_queries(table, POLICY_CHECKS)
+
+        def run() -> None:
+            for role, action in queries:
+                is_action_allowed(role, action, table)
+
+        return run
+
+    def engine() -> Callable[[], object]:
+        table = permission_table(1_000, 500)
+        queries = permission_queries(table, POLICY_CHECKS)
+        compiled = PolicyEngine(table)
+
+        def run() -> None:
+            for role, action in queries:
+                compiled.is_allowed(role, action)
+
+        return run
+
+    yield Case("is_action_allowed[1000x500]", gate, ops=POLICY_CHECKS)
+    yield Case("PolicyEngine.is_allowed[1000x500]", engine, ops=POLICY_CHECKS)
+
+
+def _auth_cases() -> Iterator[Case]:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from apps.api.app.auth.routes import router
+    from apps.api.app.auth.session_store import SessionStore
+    from apps.api.app.auth.session_tokens import SessionTokenCodec
+
+    def client(state: str) -> Callable[[], object]:
+        app = FastAPI()
+        app.include_router(router)
+        if state == "store":
+            app.state.session_store = SessionStore()
+        else:
+            app.state.session_tokens = SessionTokenCodec(b"k" * 32)
+        http = TestClient(app, base_url="https://testserver")
+
+        def run() -> None:
+            csrf_token = http.post("/auth/login").json()["csrf_token"]
+            response = http.post("/auth/logout", headers={"X-CSRF-Token": csrf_token})
+            if response.status_code != 200:
+                raise RuntimeError(f"logout failed with {response.status_code}")
+
+        return run
+
+    for state in ("store", "signed"):
+        yield Case(f"auth.login_logout[{state}]", lambda state=state: client(state))
+
+
+def cases() -> list[Case]:
+    return [*_bundle_cases(), *_crypto_cases(), *_policy_cases(), *_auth_cases()]
+
+
+def _calibrate() -> None:
+    table: dict[int, int] = {}
+    for index in range(20_000):
+        table[index % 512] = table.get(index % 512, 0) + index * 3
+    "".join(str(value) for value in table.values())
+
+
+def measure(operation: Callable[[], object], *, repeat: int, min_time: float) -> float:
+    """Best seconds per call over ``repeat`` rounds of at least ``min_time`` each."""
+    operation()
+    best = float("inf")
+    for _ in range(repeat):
+        calls = 0
+        started = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time or calls == 0:
+            operation()
+            calls += 1
+            elapsed = time.perf_counter() - started
+        best = min(best, elapsed / calls)
+    return best
+
+
+def run_cases(selected: list[Case], *, repeat: int, min_time: float) -> tuple[float, list[Result]]:
+    calibration = measure(_calibrate, repeat=repeat, min_time=min_time)
+    timings = []
+    for case in selected:
+        per_op = measure(case.setup(), repeat=repeat, min_time=min_time) / case.ops
+        timings.append((case, per_op))
+        print(f"{case.name:<40} {per_op * 1e6:12.2f}us", flush=True)
+    calibration = min(calibration, measure(_calibrate, repeat=repeat, min_time=min_time))
+    results = [
+        Result(case.name, per_op, per_op / calibration, case.ops, case.gated)
+        for case, per_op in timings
+    ]
+    return calibration, results
+
+
+def write_output(path: Path, calibration: float, results: list[Result]) -> None:
+    lines = [
+        f"# python={platform.python_version()} calibration_seconds={calibration:.6e}",
+        "# case\tseconds_per_op\tnormalized\tops",
+    ]
+    lines += [
+        f"{result.name}\t{result.seconds_per_op:.6e}\t{result.normalized:.6e}\t{result.ops}"
+        for result in results
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    return {name: float(value) for name, value in data["normalized"].items()}
+
+
+def write_baseline(path: Path, results: list[Result], previous: dict[str, float]) -> None:
+    normalized = {**previous, **{result.name: result.normalized for result in results}}
+    document = {
+        "normalized": {name: float(f"{normalized[name]:.6g}") for name in sorted(normalized)}
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def regressions(
+    results: list[Result], baseline: dict[str, float], tolerance: float
+) -> list[tuple[Result, float]]:
+    """Cases slower than ``baseline * (1 + tolerance)``, with their slowdown ratio."""
+    slower = []
+    for result in results:
+        expected = baseline.get(result.name)
+        if expected is None:
+            print(f"{result.name}: no baseline")
+            continue
+        ratio = result.normalized / expected
+        if ratio > 1 + tolerance:
+            slower.append((result, ratio))
+    return slower
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--filter", default="", help="only run cases whose name contains TEXT")
+    parser.add_argument("--quick", action="store_true", help=f"skip sizes above {QUICK_MAX_SIZE}")
+    parser.add_argument("--check", action="store_true", help="fail on regressions")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    selected = [
+        case
+        for case in cases()
+        if args.filter in case.name and not (args.quick and case.size > QUICK_MAX_SIZE)
+    ]
+    calibration, results = run_cases(selected, repeat=args.repeat, min_time=args.min_time)
+    write_output(args.output, calibration, results)
+
+    baseline = load_baseline(args.baseline) if args.baseline.exists() else {}
+    if args.update_baseline:
+        write_baseline(args.baseline, results, baseline)
+        return 0
+    if not args.check:
+        return 0
+    slower = regressions(results, baseline, args.tolerance)
+    for result, ratio in slower:
+        label = "REGRESSION" if result.gated else "SLOWER (advisory)"
+        print(f"{label} {result.name}: {ratio:.2f}x baseline (tolerance {args.tolerance:.0%})")
+    return 1 if any(result.gated for result, _ in slower) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""Lightweight timers, counters, histograms and per-request traces."""
+
+from .metrics import (
+    REGISTRY,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    counter,
+    disable,
+    enable,
+    histogram,
+    prometheus_text,
+)
+from .tracing import Span, Trace, TraceMiddleware, current_trace, span, trace
+
+__all__ = [
+    "REGISTRY",
+    "Counter",
+    "Histogram",
+    "MetricsRegistry",
+    "Span",
+    "Trace",
+    "TraceMiddleware",
+    "counter",
+    "current_trace",
+    "disable",
+    "enable",
+    "histogram",
+    "prometheus_text",
+    "span",
+    "trace",
+]
@@ -0,0 +1,268 @@
+"""Counters and histograms with a Prometheus text snapshot.
+
+Metrics are declared once at import time next to the code they measure and
+updated in place. Recording is off unless ``APP_INSTRUMENTATION`` is set to a
+true value or ``enable()`` is called; while it is off ``Counter.inc`` and
+``Histogram.observe`` return after one attribute check and ``Histogram.time``
+hands back a shared no-op context manager, unless a trace is active, in which
+case it still records a span.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from typing import TypeVar
+
+from .tracing import Span, Trace, _current
+
+LabelSet = tuple[tuple[str, str], ...]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.00001,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+)
+
+_NO_TIMER: AbstractContextManager[None] = nullcontext()
+_M = TypeVar("_M", "Counter", "Histogram")
+
+
+def _env_enabled() -> bool:
+    return os.getenv("APP_INSTRUMENTATION", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelSet, extra: str = "") -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Named metrics plus the switch that turns recording on and off."""
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._register(name, Counter, lambda: Counter(self, name, help))
+
+    def histogram(
+        self, name: str, help: str, *, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(name, Histogram, lambda: Histogram(self, name, help, buckets))
+
+    def _register(self, name: str, kind: type[_M], factory: Callable[[], _M]) -> _M:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                created = factory()
+                self._metrics[name] = created
+                return created
+            if not isinstance(metric, kind):
+                raise ValueError(f"metric {name!r} is already registered as another type")
+            return metric
+
+    def get(self, name: str) -> Counter | Histogram | None:
+        return self._metrics.get(name)
+
+    def reset(self) -> None:
+        """Zero every metric, keeping the declarations."""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def prometheus_text(self) -> str:
+        """Snapshot of every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            self._metrics[name].render(lines)
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class Counter:
+    """Monotonic count per label set."""
+
+    def __init__(self, registry: MetricsRegistry, name: str, help: str) -> None:
+        self._registry = registry
+        self.name = name
+        self.help = help
+        self._values: dict[LabelSet, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._registry.enabled
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if not self._registry.enabled:
+            return
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(tuple(sorted(labels.items())), 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self, lines: list[str]) -> None:
+        lines.append(f"# HELP {self.name} {self.help}")
+        lines.append(f"# TYPE {self.name} counter")
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+
+
+class _Series:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram:
+    """Bucketed distribution (typically durations in seconds) per label set."""
+
+    def __init__(
+        self, registry: MetricsRegistry, name: str, help: str, buckets: Sequence[float]
+    ) -> None:
+        self._registry = registry
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelSet, _Series] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._registry.enabled
+
+    def observe(self, value: float, **labels: str) -> None:
+        if not self._registry.enabled:
+            return
+        self._observe(value, tuple(sorted(labels.items())))
+
+    def _observe(self, value: float, key: LabelSet) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self.buckets) + 1)
+            series.buckets[index] += 1
+            series.count += 1
+            series.sum += value
+
+    def time(self, **labels: str) -> AbstractContextManager[None]:
+        """Context manager observing the block's wall time and tracing it as a span."""
+        active = _current.get()
+        if not self._registry.enabled and active is None:
+            return _NO_TIMER
+        return _Timer(self, tuple(sorted(labels.items())), active)
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(tuple(sorted(labels.items())))
+        return 0 if series is None else series.count
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self, lines: list[str]) -> None:
+        lines.append(f"# HELP {self.name} {self.help}")
+        lines.append(f"# TYPE {self.name} histogram")
+        with self._lock:
+            snapshot = [
+                (labels, list(series.buckets), series.count, series.sum)
+                for labels, series in sorted(self._series.items())
+            ]
+        for labels, buckets, count, total in snapshot:
+            cumulative = 0
+            for bound, observed in zip((*self.buckets, math.inf), buckets, strict=True):
+                cumulative += observed
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_trace", "_start")
+
+    def __init__(self, histogram: Histogram, labels: LabelSet, active: Trace | None) -> None:
+        self._histogram = histogram
+        self._labels = labels
+        self._trace = active
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        if self._trace is not None:
+            self._trace._depth += 1
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        duration = time.perf_counter() - self._start
+        histogram = self._histogram
+        if histogram._registry.enabled:
+            histogram._observe(duration, self._labels)
+        active = self._trace
+        if active is not None:
+            active._depth -= 1
+            active.spans.append(
+                Span(histogram.name, self._start, duration, active._depth, self._labels)
+            )
+
+
+REGISTRY = MetricsRegistry(enabled=_env_enabled())
+
+
+def counter(name: str, help: str) -> Counter:
+    """Declare (or fetch) a counter on the process-wide registry."""
+    return REGISTRY.counter(name, help)
+
+
+def histogram(name: str, help: str, *, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    """Declare (or fetch) a histogram on the process-wide registry."""
+    return REGISTRY.histogram(name, help, buckets=buckets)
+
+
+def enable() -> None:
+    REGISTRY.enabled = True
+
+
+def disable() -> None:
+    REGISTRY.enabled = False
+
+
+def prometheus_text() -> str:
+    return REGISTRY.prometheus_text()
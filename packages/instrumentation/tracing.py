@@ -0,0 +1,145 @@
+"""Opt-in per-request traces made of nested timed spans.
+
+A trace is started explicitly (``with trace("POST /threads"):`` or by
+``TraceMiddleware``) and lives in a ``ContextVar``, so spans opened anywhere
+below it - including in ``asyncio`` tasks started from it - are collected
+without passing anything around. When no trace is active ``span`` returns a
+shared no-op context manager.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable, Iterator, MutableMapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Span:
+    name: str
+    start: float
+    duration: float
+    depth: int
+    attributes: tuple[tuple[str, str], ...] = ()
+
+
+@dataclass
+class Trace:
+    """Spans recorded while the trace was active, in the order they finished."""
+
+    name: str
+    start: float = field(default_factory=time.perf_counter)
+    duration: float = 0.0
+    spans: list[Span] = field(default_factory=list)
+    _depth: int = 0
+
+    def totals(self) -> dict[str, float]:
+        """Total seconds per span name, summed over repeated spans."""
+        totals: dict[str, float] = {}
+        for recorded in self.spans:
+            totals[recorded.name] = totals.get(recorded.name, 0.0) + recorded.duration
+        return totals
+
+
+_current: ContextVar[Trace | None] = ContextVar("instrumentation_trace", default=None)
+_NO_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+def current_trace() -> Trace | None:
+    return _current.get()
+
+
+@contextmanager
+def trace(name: str) -> Iterator[Trace]:
+    """Collect spans opened in this context until the block exits."""
+    active = Trace(name)
+    token = _current.set(active)
+    try:
+        yield active
+    finally:
+        active.duration = time.perf_counter() - active.start
+        _current.reset(token)
+
+
+class _SpanTimer:
+    __slots__ = ("_trace", "_name", "_attributes", "_start")
+
+    def __init__(self, active: Trace, name: str, attributes: tuple[tuple[str, str], ...]) -> None:
+        self._trace = active
+        self._name = name
+        self._attributes = attributes
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._trace._depth += 1
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        duration = time.perf_counter() - self._start
+        active = self._trace
+        active._depth -= 1
+        active.spans.append(
+            Span(self._name, self._start, duration, active._depth, self._attributes)
+        )
+
+
+def span(name: str, **attributes: str) -> AbstractContextManager[None]:
+    """Time a block as a span of the active trace; a no-op without one."""
+    active = _current.get()
+    if active is None:
+        return _NO_SPAN
+    return _SpanTimer(active, name, tuple(sorted(attributes.items())))
+
+
+_Scope = MutableMapping[str, Any]
+_Receive = Callable[[], Awaitable[_Scope]]
+_Send = Callable[[_Scope], Awaitable[None]]
+_App = Callable[[_Scope, _Receive, _Send], Awaitable[None]]
+
+
+class TraceMiddleware:
+    """ASGI middleware tracing each HTTP request.
+
+    Finished traces are passed to ``sink``. With ``server_timing`` the spans
+    finished before the response starts are summarised in a ``Server-Timing``
+    header, which browsers show next to the request.
+    """
+
+    def __init__(
+        self,
+        app: _App,
+        *,
+        sink: Callable[[Trace], None] | None = None,
+        server_timing: bool = False,
+    ) -> None:
+        self.app = app
+        self._sink = sink
+        self._server_timing = server_timing
+
+    async def __call__(self, scope: _Scope, receive: _Receive, send: _Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with trace(f"{scope['method']} {scope['path']}") as active:
+
+            async def send_with_timing(message: _Scope) -> None:
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", ()))
+                    headers.append((b"server-timing", _server_timing(active).encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing if self._server_timing else send)
+        if self._sink is not None:
+            self._sink(active)
+
+
+def _server_timing(active: Trace) -> str:
+    return ", ".join(
+        f"{name.replace(' ', '_')};dur={seconds * 1000:.3f}"
+        for name, seconds in active.totals().items()
+    )
@@ -1,3 +1,4 @@
+from .engine import PolicyEngine
 from .gate import is_action_allowed
 
-__all__ = ["is_action_allowed"]
+__all__ = ["PolicyEngine", "is_action_allowed"]
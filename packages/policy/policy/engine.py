@@ -0,0 +1,89 @@
+"""Precompiled permission checks.
+
+``PolicyEngine`` compiles a role -> actions table once. Each role gets a
+``frozenset`` of the exact actions it may perform, inheritance already
+applied, and, only if it holds any wildcards (``threads.*``, ``*``), a short
+tuple of their prefixes. A granted exact action costs what ``is_action_allowed``
+costs: a dict lookup and a set membership test. Anything else adds one dict
+lookup and, for roles with wildcards, one ``str.startswith`` over that role's
+own prefixes. Nothing is cached per action, so the cost does not depend on
+how many distinct actions are checked, and unknown roles cost no allocation.
+"""
+
+from collections.abc import Iterable, Mapping
+
+WILDCARD = "*"
+
+
+def _is_pattern(action: str) -> bool:
+    return action == WILDCARD or action.endswith("." + WILDCARD)
+
+
+_NO_ACTIONS: frozenset[str] = frozenset()
+
+
+class PolicyEngine:
+    """Role/action permission table compiled to per-role grants.
+
+    ``permissions`` maps a role to the actions it is granted directly; an
+    action ending in ``.*`` grants every action under that prefix and ``*``
+    grants everything. ``inherits`` maps a role to the roles whose grants it
+    also receives, transitively. Unknown roles are denied everything.
+    """
+
+    def __init__(
+        self,
+        permissions: Mapping[str, Iterable[str]],
+        *,
+        inherits: Mapping[str, Iterable[str]] | None = None,
+    ) -> None:
+        direct = {role: frozenset(actions) for role, actions in permissions.items()}
+        parents = {role: tuple(names) for role, names in (inherits or {}).items()}
+        resolved: dict[str, frozenset[str]] = {}
+        self._actions: dict[str, frozenset[str]] = {}
+        self._prefixes: dict[str, tuple[str, ...]] = {}
+        for role in sorted(direct.keys() | parents.keys()):
+            granted = self._resolve(role, direct, parents, resolved, ())
+            patterns = {action for action in granted if _is_pattern(action)}
+            self._actions[role] = granted - patterns
+            if patterns:
+                # "*" becomes the empty prefix, which every action starts with.
+                self._prefixes[role] = tuple(sorted(pattern[:-1] for pattern in patterns))
+
+    def _resolve(
+        self,
+        role: str,
+        direct: Mapping[str, frozenset[str]],
+        parents: Mapping[str, tuple[str, ...]],
+        resolved: dict[str, frozenset[str]],
+        chain: tuple[str, ...],
+    ) -> frozenset[str]:
+        if role in resolved:
+            return resolved[role]
+        if role in chain:
+            raise ValueError(f"role inheritance cycle: {' -> '.join((*chain, role))}")
+        granted = direct.get(role, frozenset())
+        for parent in parents.get(role, ()):
+            granted |= self._resolve(parent, direct, parents, resolved, (*chain, role))
+        resolved[role] = granted
+        return granted
+
+    @property
+    def roles(self) -> frozenset[str]:
+        return frozenset(self._actions)
+
+    def is_allowed(self, role: str, action: str) -> bool:
+        if action in self._actions.get(role, _NO_ACTIONS):
+            return True
+        if not self._prefixes:
+            return False
+        prefixes = self._prefixes.get(role)
+        return prefixes is not None and action.startswith(prefixes)
+
+    def check_many(self, role: str, actions: Iterable[str]) -> list[bool]:
+        """Evaluate several actions for one role with a single role lookup."""
+        exact = self._actions.get(role, _NO_ACTIONS)
+        prefixes = self._prefixes.get(role)
+        if prefixes is None:
+            return [action in exact for action in actions]
+        return [action in exact or action.startswith(prefixes) for action in actions]
@@ -1,6 +1,8 @@
 from collections.abc import Mapping
 
+_NO_ACTIONS: frozenset[str] = frozenset()
+
 
 def is_action_allowed(role: str, action: str, permissions: Mapping[str, set[str]]) -> bool:
-    allowed_actions = permissions.get(role, set())
+    allowed_actions = permissions.get(role, _NO_ACTIONS)
     return action in allowed_actions
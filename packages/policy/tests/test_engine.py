@@ -0,0 +1,49 @@
+import pytest
+from policy.engine import PolicyEngine
+from policy.gate import is_action_allowed
+
+
+def test_engine_matches_gate_for_exact_actions() -> None:
+    permissions = {"admin": {"read", "write"}, "viewer": {"read"}}
+    engine = PolicyEngine(permissions)
+
+    for role in ("admin", "viewer", "guest"):
+        for action in ("read", "write", "delete"):
+            assert engine.is_allowed(role, action) == is_action_allowed(
+                role, action, permissions
+            )
+
+
+def test_wildcards_and_inheritance() -> None:
+    engine = PolicyEngine(
+        {
+            "viewer": {"threads.read"},
+            "editor": {"threads.*"},
+            "root": {"*"},
+        },
+        inherits={"editor": ["viewer"], "admin": ["editor"]},
+    )
+
+    assert engine.is_allowed("editor", "threads.comment.create")
+    assert not engine.is_allowed("editor", "threadsx.read")
+    assert not engine.is_allowed("viewer", "threads.write")
+    assert engine.is_allowed("admin", "threads.write")
+    assert engine.is_allowed("root", "anything.at.all")
+    assert engine.check_many("admin", ["threads.read", "tasks.create"]) == [True, False]
+    assert engine.check_many("guest", ["threads.read"]) == [False]
+
+
+def test_inheritance_cycle_is_rejected() -> None:
+    with pytest.raises(ValueError, match="cycle"):
+        PolicyEngine({"a": {"x"}}, inherits={"a": ["b"], "b": ["a"]})
+
+
+def test_many_distinct_actions_need_no_per_action_state() -> None:
+    engine = PolicyEngine({"editor": {"threads.*", "tasks.read"}, "root": {"*"}})
+    actions = [f"threads.item{index}.read" for index in range(10_000)]
+
+    assert engine.check_many("editor", actions) == [True] * len(actions)
+    assert all(engine.is_allowed("root", action) for action in actions)
+    assert engine.is_allowed("editor", "tasks.read")
+    assert not engine.is_allowed("editor", "tasks.write")
+    assert engine.check_many("guest", actions[:2]) == [False, False]
@@ -1,5 +1,89 @@
-"""Schema package for planner payload validation."""
+"""Schema package for planner payload validation.
 
-from .validator import SchemaValidationError, validate_payload, validate_planner_bundle
+Names are imported from their submodules on first access (PEP 562), so
+``import packages.schemas`` is cheap and a process only loads the parts it
+uses; ``msgspec`` is not imported until a bundle is first decoded.
+"""
 
-__all__ = ["SchemaValidationError", "validate_payload", "validate_planner_bundle"]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .columnar import ActionCard, ActionCardColumns, TimelineEvent, TimelineEventColumns
+    from .formats import register_format
+    from .ingest import decode_planner_bundle
+    from .integrity import ReferenceIndex, check_references
+    from .memo import ValidationMemo, ValidationMemoStats
+    from .registry import SchemaRegistry, default_registry
+    from .streaming import iter_planner_bundle
+    from .validator import (
+        BundleValidationError,
+        SchemaValidationError,
+        ValidationIssue,
+        check_planner_bundle,
+        collect_violations,
+        validate_payload,
+        validate_planner_bundle,
+    )
+
+# Exported name -> submodule defining it.
+_EXPORTS = {
+    "ActionCard": "columnar",
+    "ActionCardColumns": "columnar",
+    "BundleValidationError": "validator",
+    "ReferenceIndex": "integrity",
+    "SchemaRegistry": "registry",
+    "SchemaValidationError": "validator",
+    "TimelineEvent": "columnar",
+    "TimelineEventColumns": "columnar",
+    "ValidationIssue": "validator",
+    "ValidationMemo": "memo",
+    "ValidationMemoStats": "memo",
+    "check_planner_bundle": "validator",
+    "check_references": "integrity",
+    "collect_violations": "validator",
+    "decode_planner_bundle": "ingest",
+    "default_registry": "registry",
+    "iter_planner_bundle": "streaming",
+    "register_format": "formats",
+    "validate_payload": "validator",
+    "validate_planner_bundle": "validator",
+}
+
+__all__ = [
+    "ActionCard",
+    "ActionCardColumns",
+    "BundleValidationError",
+    "ReferenceIndex",
+    "SchemaRegistry",
+    "SchemaValidationError",
+    "TimelineEvent",
+    "TimelineEventColumns",
+    "ValidationIssue",
+    "ValidationMemo",
+    "ValidationMemoStats",
+    "check_planner_bundle",
+    "check_references",
+    "collect_violations",
+    "decode_planner_bundle",
+    "default_registry",
+    "iter_planner_bundle",
+    "register_format",
+    "validate_payload",
+    "validate_planner_bundle",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
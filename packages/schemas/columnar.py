@@ -0,0 +1,303 @@
+"""Compact column storage for validated action cards and timeline events.
+
+A pass with 100k timeline events held as one dict per event spends most of its
+memory on per-object overhead: a hash table per event, another per ``details``
+object and a ~50 byte header on every short string. ``ActionCardColumns`` and
+``TimelineEventColumns`` store each property as one column instead. Strings
+are packed as UTF-8 into a single buffer with an offset per item, enumerated
+properties (``kind``, ``status``, ``event_type``) become two-byte codes into a
+table of interned values, integers go into an ``array`` and object properties
+(``metadata``, ``details``) are kept as compact JSON text, the form the
+repository stores them in.
+
+Iteration yields slotted records with the objects decoded; the repository
+reads the stored columns directly when inserting, so nothing is turned back
+into dicts on the write path. Only validated payloads belong here: required
+properties are read without checks, and a property the container has no
+column for raises ``ValueError`` rather than being dropped.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, ClassVar, Generic, Protocol, TypeVar
+
+_TEXT = "text"
+_OPTIONAL_TEXT = "optional_text"
+_CATEGORY = "category"
+_INTEGER = "integer"
+_JSON = "json"
+
+
+class ActionCard:
+    __slots__ = (
+        "card_id",
+        "title",
+        "kind",
+        "status",
+        "priority",
+        "created_at",
+        "owner",
+        "metadata",
+    )
+
+    def __init__(
+        self,
+        card_id: str,
+        title: str,
+        kind: str,
+        status: str,
+        priority: int,
+        created_at: str,
+        owner: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        self.card_id = card_id
+        self.title = title
+        self.kind = kind
+        self.status = status
+        self.priority = priority
+        self.created_at = created_at
+        self.owner = owner
+        self.metadata = metadata
+
+    def to_payload(self) -> dict[str, Any]:
+        return _payload(self, ActionCardColumns.FIELDS)
+
+
+class TimelineEvent:
+    __slots__ = (
+        "event_id",
+        "event_type",
+        "occurred_at",
+        "message",
+        "actor",
+        "action_card_id",
+        "details",
+    )
+
+    def __init__(
+        self,
+        event_id: str,
+        event_type: str,
+        occurred_at: str,
+        message: str,
+        actor: str | None = None,
+        action_card_id: str | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        self.event_id = event_id
+        self.event_type = event_type
+        self.occurred_at = occurred_at
+        self.message = message
+        self.actor = actor
+        self.action_card_id = action_card_id
+        self.details = details
+
+    def to_payload(self) -> dict[str, Any]:
+        return _payload(self, TimelineEventColumns.FIELDS)
+
+
+def _payload(record: Any, fields: tuple[tuple[str, str], ...]) -> dict[str, Any]:
+    payload = {}
+    for key, kind in fields:
+        value = getattr(record, key)
+        if value is not None or kind not in (_OPTIONAL_TEXT, _JSON):
+            payload[key] = value
+    return payload
+
+
+# Same output as ``json.dumps(value, separators=(",", ":"))``, without
+# building a new encoder per call.
+_dump_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _load_json(text: str | None) -> Any:
+    return None if text is None else json.loads(text)
+
+
+class _Column(Protocol):
+    def append(self, value: Any, /) -> None: ...
+
+    def __getitem__(self, index: int, /) -> Any: ...
+
+    def __iter__(self) -> Iterator[Any]: ...
+
+
+class _TextColumn:
+    """Strings packed into one UTF-8 buffer; ``None`` is kept only if ``optional``."""
+
+    __slots__ = ("_data", "_ends", "_present")
+
+    def __init__(self, *, optional: bool) -> None:
+        self._data = bytearray()
+        self._ends = array("Q")
+        self._present = bytearray() if optional else None
+
+    def append(self, value: str | None) -> None:
+        data = self._data
+        if self._present is not None:
+            self._present.append(value is not None)
+        if value is not None:
+            data += value.encode()
+        self._ends.append(len(data))
+
+    def __getitem__(self, index: int) -> str | None:
+        if self._present is not None and not self._present[index]:
+            return None
+        start = self._ends[index - 1] if index else 0
+        return self._data[start : self._ends[index]].decode()
+
+    def __iter__(self) -> Iterator[str | None]:
+        data = self._data
+        # ASCII text has byte offsets equal to character offsets, so it can be
+        # decoded once and sliced instead of decoding every item.
+        text = data.decode() if data.isascii() else None
+        present = self._present
+        start = 0
+        for index, end in enumerate(self._ends):
+            if present is not None and not present[index]:
+                yield None
+            elif text is not None:
+                yield text[start:end]
+            else:
+                yield data[start:end].decode()
+            start = end
+
+
+class _CategoryColumn:
+    """Two-byte codes into a table of interned values."""
+
+    __slots__ = ("_codes", "_lookup", "_values")
+
+    def __init__(self) -> None:
+        self._codes = array("H")
+        self._lookup: dict[str, int] = {}
+        self._values: list[str] = []
+
+    def append(self, value: str) -> None:
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self._values)
+            self._values.append(sys.intern(value))
+        self._codes.append(code)
+
+    def __getitem__(self, index: int) -> str:
+        return self._values[self._codes[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self._values.__getitem__, self._codes)
+
+
+def _new_column(kind: str) -> _Column:
+    if kind == _CATEGORY:
+        return _CategoryColumn()
+    if kind == _INTEGER:
+        return array("q")
+    return _TextColumn(optional=kind != _TEXT)
+
+
+_R = TypeVar("_R", ActionCard, TimelineEvent)
+
+
+class _Columns(Generic[_R]):
+    # (payload key, storage kind) in record constructor order.
+    FIELDS: ClassVar[tuple[tuple[str, str], ...]]
+    ARTIFACT: ClassVar[str]
+    RECORD: ClassVar[type[Any]]
+
+    __slots__ = ("_columns", "_keys", "_length")
+
+    def __init__(self, payloads: Iterable[Mapping[str, Any]] = ()) -> None:
+        self._columns = {key: _new_column(kind) for key, kind in self.FIELDS}
+        self._keys = frozenset(self._columns)
+        self._length = 0
+        self.extend(payloads)
+
+    def append(self, payload: Mapping[str, Any]) -> None:
+        if not self._keys.issuperset(payload):
+            unknown = sorted(set(payload) - self._keys)[0]
+            raise ValueError(f"{self.ARTIFACT} property {unknown!r} has no column")
+        columns = self._columns
+        for key, kind in self.FIELDS:
+            if kind == _OPTIONAL_TEXT:
+                columns[key].append(payload.get(key))
+            elif kind == _JSON:
+                value = payload.get(key)
+                columns[key].append(None if value is None else _dump_json(value))
+            else:
+                columns[key].append(payload[key])
+        self._length += 1
+
+    def extend(self, payloads: Iterable[Mapping[str, Any]]) -> None:
+        for payload in payloads:
+            self.append(payload)
+
+    def values(self, key: str) -> Iterator[Any]:
+        """Iterate one property across all items as stored; objects stay JSON text."""
+        return iter(self._columns[key])
+
+    def iter_columns(self, *keys: str) -> Iterator[tuple[Any, ...]]:
+        """Iterate tuples of the given properties as stored, one tuple per item."""
+        return zip(*(self._columns[key] for key in keys), strict=True)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[_R]:
+        record = self.RECORD
+        columns = [
+            map(_load_json, self._columns[key]) if kind == _JSON else iter(self._columns[key])
+            for key, kind in self.FIELDS
+        ]
+        for values in zip(*columns, strict=True):
+            yield record(*values)
+
+    def __getitem__(self, index: int) -> _R:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"{self.ARTIFACT} index out of range")
+        values = []
+        for key, kind in self.FIELDS:
+            value = self._columns[key][index]
+            values.append(_load_json(value) if kind == _JSON else value)
+        return self.RECORD(*values)  # type: ignore[no-any-return]
+
+    def to_payloads(self) -> list[dict[str, Any]]:
+        """The items as the dicts they were built from, e.g. to validate or serialise."""
+        return [record.to_payload() for record in self]
+
+
+class ActionCardColumns(_Columns[ActionCard]):
+    FIELDS = (
+        ("card_id", _TEXT),
+        ("title", _TEXT),
+        ("kind", _CATEGORY),
+        ("status", _CATEGORY),
+        ("priority", _INTEGER),
+        ("created_at", _TEXT),
+        ("owner", _OPTIONAL_TEXT),
+        ("metadata", _JSON),
+    )
+    ARTIFACT = "action_card"
+    RECORD = ActionCard
+    __slots__ = ()
+
+
+class TimelineEventColumns(_Columns[TimelineEvent]):
+    FIELDS = (
+        ("event_id", _TEXT),
+        ("event_type", _CATEGORY),
+        ("occurred_at", _TEXT),
+        ("message", _TEXT),
+        ("actor", _OPTIONAL_TEXT),
+        ("action_card_id", _OPTIONAL_TEXT),
+        ("details", _JSON),
+    )
+    ARTIFACT = "timeline_event"
+    RECORD = TimelineEvent
+    __slots__ = ()
@@ -0,0 +1,112 @@
+"""String ``format`` checks used by compiled schemas.
+
+Each format is a precompiled ``re`` pattern (plus a leap-year check for
+``02-29`` dates) rather than a parse, so a check never builds intermediate
+strings or ``datetime`` objects. Results are memoised per format in a bounded
+dict because bundles repeat the same timestamps and versions many times.
+
+Built in: ``date-time``, ``uuid``, ``uri``, ``email`` and ``semver``.
+``date-time`` is the part of RFC 3339 that ``datetime.fromisoformat`` parses,
+since that is how the repository stores it: an upper-case ``T`` and ``Z``, no
+leap second, no year 0000, at most six fractional digits and an explicit
+offset.
+Call ``register_format`` before schemas using a custom format are compiled;
+formats unknown at compile time are not checked, as JSON Schema specifies.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Callable
+
+FormatChecker = Callable[[str], bool]
+
+MAX_MEMOIZED_VALUES = 4096
+
+_DATE_TIME = re.compile(
+    r"(?P<year>(?!0000)[0-9]{4})-"
+    r"(?:(?:0[1-9]|1[0-2])-(?:0[1-9]|1[0-9]|2[0-8])"
+    r"|(?:0[13-9]|1[0-2])-(?:29|30)"
+    r"|(?:0[13578]|1[02])-31"
+    r"|(?P<leap>02-29))"
+    r"T(?:[01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](?:\.[0-9]{1,6})?"
+    r"(?:Z|[+-](?:[01][0-9]|2[0-3]):[0-5][0-9])"
+)
+_UUID = re.compile(r"[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{12}")
+_URI = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*:(?:[^\x00-\x20\x7f<>\"{}|\\^`%]|%[0-9A-Fa-f]{2})*")
+_EMAIL = re.compile(
+    r"[A-Za-z0-9.!#$%&'*+/=?^_`{|}~\-]+@"
+    r"[A-Za-z0-9](?:[A-Za-z0-9\-]{0,61}[A-Za-z0-9])?"
+    r"(?:\.[A-Za-z0-9](?:[A-Za-z0-9\-]{0,61}[A-Za-z0-9])?)+"
+)
+_SEMVER = re.compile(
+    r"(?:0|[1-9][0-9]*)\.(?:0|[1-9][0-9]*)\.(?:0|[1-9][0-9]*)"
+    r"(?:-(?:0|[1-9][0-9]*|[0-9]*[A-Za-z\-][0-9A-Za-z\-]*)"
+    r"(?:\.(?:0|[1-9][0-9]*|[0-9]*[A-Za-z\-][0-9A-Za-z\-]*))*)?"
+    r"(?:\+[0-9A-Za-z\-]+(?:\.[0-9A-Za-z\-]+)*)?"
+)
+
+
+def is_date_time(value: str) -> bool:
+    match = _DATE_TIME.fullmatch(value)
+    if match is None:
+        return False
+    if match.start("leap") < 0:
+        return True
+    year = int(match.group("year"))
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _pattern_checker(pattern: re.Pattern[str]) -> FormatChecker:
+    fullmatch = pattern.fullmatch
+
+    def check(value: str) -> bool:
+        return fullmatch(value) is not None
+
+    return check
+
+
+def _memoize(checker: FormatChecker) -> FormatChecker:
+    results: dict[str, bool] = {}
+
+    def check(value: str) -> bool:
+        result = results.get(value)
+        if result is None:
+            result = checker(value)
+            if len(results) >= MAX_MEMOIZED_VALUES:
+                results.clear()
+            results[value] = result
+        return result
+
+    return check
+
+
+_formats: dict[str, FormatChecker] = {}
+_formats_lock = threading.Lock()
+
+
+def register_format(name: str, checker: FormatChecker, *, memoize: bool = True) -> None:
+    """Register (or replace) the checker for ``{"format": name}`` strings.
+
+    ``checker`` must be a pure function of its argument when ``memoize`` is
+    true, since each result is remembered for later calls with the same value.
+    """
+    with _formats_lock:
+        _formats[name] = _memoize(checker) if memoize else checker
+
+
+def format_checker(name: str) -> FormatChecker | None:
+    """The registered checker for ``name``, or None if the format is unknown."""
+    return _formats.get(name)
+
+
+def formats() -> list[str]:
+    return sorted(_formats)
+
+
+register_format("date-time", is_date_time)
+register_format("uuid", _pattern_checker(_UUID))
+register_format("uri", _pattern_checker(_URI))
+register_format("email", _pattern_checker(_EMAIL))
+register_format("semver", _pattern_checker(_SEMVER))
@@ -0,0 +1,274 @@
+"""Decode planner bundles from request bodies with validation folded into parsing.
+
+``decode_planner_bundle`` takes the raw body (``bytes``, ``bytearray`` or a
+``memoryview`` over the request buffer) and returns the four validated
+sections as plain dicts and lists, exactly what ``validate_planner_bundle``
+accepts. With ``msgspec`` installed the body is decoded straight into
+``msgspec.Struct`` types generated from the registry's current schemas, so
+types, enums, bounds, required and unknown properties are checked by the
+decoder in the same pass that builds the objects; only the checks the structs
+cannot express (string formats, for instance) run afterwards, field by field.
+
+The struct types follow the keywords the compiled validator understands and
+nothing more, so a body the decoder accepts is one the validator accepts.
+Whenever the decoder rejects a body it is decoded again generically and run
+through ``check_planner_bundle``, so errors are reported exactly as on the
+plain path. Without ``msgspec`` that plain path is all there is: ``orjson``
+(or the standard library) decoding followed by the validator walk.
+
+``msgspec`` itself is imported when the first bundle is decoded, not when this
+module is, so processes that never ingest a bundle do not pay for it.
+"""
+
+from __future__ import annotations
+
+import json
+import keyword
+import threading
+from collections.abc import Callable
+from importlib.util import find_spec
+from typing import Annotated, Any, Literal
+
+from .integrity import check_references
+from .registry import default_registry
+from .streaming import BUNDLE_SECTIONS
+from .validator import (
+    BundleValidationError,
+    SchemaValidationError,
+    ValidationIssue,
+    Validator,
+    _compile,
+    _Failure,
+    check_planner_bundle,
+)
+
+Body = bytes | bytearray | memoryview
+
+_loads: Callable[[Body], Any]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+
+    def _loads(body: Body) -> Any:
+        return json.loads(bytes(body) if isinstance(body, memoryview) else body)
+
+    _DecodeError: type[Exception] = json.JSONDecodeError
+else:
+    _loads = orjson.loads
+    _DecodeError = orjson.JSONDecodeError
+
+
+def _bundle_schema(schemas: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    properties: dict[str, Any] = {}
+    for section, (schema_name, is_array) in BUNDLE_SECTIONS.items():
+        schema = schemas[schema_name]
+        properties[section] = {"type": "array", "items": schema} if is_array else schema
+    return {
+        "type": "object",
+        "additionalProperties": False,
+        "required": list(BUNDLE_SECTIONS),
+        "properties": properties,
+    }
+
+
+class _StructBuilder:
+    """Translate a schema into a ``msgspec`` type the decoder enforces.
+
+    ``annotation`` returns the type and whether decoding into it performs every
+    check the compiled validator would. Inexact parts decode as ``Any`` and the
+    enclosing struct validates them in ``__post_init__``.
+    """
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._structs = 0
+
+    def annotation(self, schema: dict[str, Any]) -> tuple[Any, bool]:
+        expected_type = schema.get("type")
+        if "enum" in schema:
+            members = schema["enum"]
+            if (
+                expected_type == "string"
+                and members
+                and all(isinstance(member, str) for member in members)
+                and "minLength" not in schema
+                and "format" not in schema
+            ):
+                return Literal[tuple(members)], True
+            return Any, False
+        if expected_type == "string":
+            if "format" in schema:
+                return Any, False
+            min_length = schema.get("minLength")
+            if min_length is None:
+                return str, True
+            if not isinstance(min_length, int) or isinstance(min_length, bool):
+                return Any, False
+            return Annotated[str, self._msgspec.Meta(min_length=min_length)], True
+        if expected_type == "integer":
+            bounds = {"ge": schema.get("minimum"), "le": schema.get("maximum")}
+            bounds = {key: value for key, value in bounds.items() if value is not None}
+            if not bounds:
+                return int, True
+            if not all(type(value) is int for value in bounds.values()):
+                return Any, False
+            return Annotated[int, self._msgspec.Meta(**bounds)], True
+        if expected_type == "number":
+            if "minimum" in schema or "maximum" in schema:
+                return Any, False
+            return int | float, True
+        if expected_type == "boolean":
+            return bool, True
+        if expected_type == "array":
+            items = schema.get("items")
+            if items is None:
+                return list[Any], True
+            item_type, exact = self.annotation(items)
+            return (list[item_type], True) if exact else (Any, False)  # type: ignore[valid-type]
+        if expected_type == "object":
+            return self.struct(schema)
+        return Any, True
+
+    def struct(self, schema: dict[str, Any]) -> tuple[Any, bool]:
+        properties: dict[str, Any] = schema.get("properties", {})
+        required = schema.get("required", [])
+        if (
+            schema.get("additionalProperties", True) is not False
+            or not set(required) <= properties.keys()
+            or not all(_is_field_name(key) for key in properties)
+        ):
+            return Any, False
+
+        fields: list[tuple[str, Any] | tuple[str, Any, Any]] = []
+        post_checks: list[tuple[str, Validator]] = []
+        for key, property_schema in properties.items():
+            field_type, exact = self.annotation(property_schema)
+            if not exact:
+                post_checks.append((key, _compile(property_schema)))
+            if key in required:
+                fields.append((key, field_type))
+            else:
+                fields.append((key, field_type, self._msgspec.UNSET))
+
+        namespace: dict[str, Any] = {}
+        if post_checks:
+            namespace["__post_init__"] = _post_init(tuple(post_checks), self._msgspec.UNSET)
+        self._structs += 1
+        struct_type = self._msgspec.defstruct(
+            f"_PlannerStruct{self._structs}",
+            fields,
+            namespace=namespace,
+            kw_only=True,
+            forbid_unknown_fields=True,
+        )
+        return struct_type, True
+
+
+def _is_field_name(key: Any) -> bool:
+    return (
+        isinstance(key, str)
+        and key.isidentifier()
+        and not keyword.iskeyword(key)
+        and not key.startswith("_")
+    )
+
+
+def _post_init(checks: tuple[tuple[str, Validator], ...], unset: Any) -> Callable[[Any], None]:
+    def __post_init__(self: Any) -> None:
+        for key, check in checks:
+            value = getattr(self, key)
+            if value is unset:
+                continue
+            try:
+                check(value)
+            except _Failure as failure:
+                raise ValueError(f"{key}: {failure.message}") from None
+
+    return __post_init__
+
+
+class _TypedDecoder:
+    """A ``msgspec`` decoder for the bundle, rebuilt when a schema is reloaded."""
+
+    def __init__(self) -> None:
+        self._schemas: tuple[dict[str, Any], ...] = ()
+        self._decoder: Any = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        registry = default_registry()
+        names = [schema_name for schema_name, _ in BUNDLE_SECTIONS.values()]
+        schemas = tuple(registry.schema(name) for name in names)
+        cached_schemas, decoder = self._schemas, self._decoder
+        if decoder is not None and all(
+            new is old for new, old in zip(schemas, cached_schemas, strict=True)
+        ):
+            return decoder
+        with self._lock:
+            import msgspec
+
+            bundle_type, exact = _StructBuilder().struct(
+                _bundle_schema(dict(zip(names, schemas, strict=True)))
+            )
+            decoder = msgspec.json.Decoder(bundle_type) if exact else None
+            self._schemas, self._decoder = schemas, decoder
+        return decoder
+
+
+_typed_decoder = _TypedDecoder() if find_spec("msgspec") is not None else None
+
+
+def decode_planner_bundle(body: Body) -> dict[str, Any]:
+    """Decode and validate a JSON planner bundle, returning its four sections.
+
+    Raises ``BundleValidationError`` listing every violation, including
+    dangling cross-artifact references, and ``SchemaValidationError`` when the
+    body is not a JSON object.
+    """
+    decoder = _typed_decoder.get() if _typed_decoder is not None else None
+    if decoder is not None:
+        import msgspec
+
+        try:
+            bundle = msgspec.to_builtins(decoder.decode(body))
+        except msgspec.ValidationError:
+            pass
+        except msgspec.DecodeError as exc:
+            raise SchemaValidationError(f"malformed planner bundle: {exc}") from None
+        else:
+            issues = check_references(**bundle)
+            if issues:
+                raise BundleValidationError(issues)
+            return bundle  # type: ignore[no-any-return]
+    return _decode_checked(body)
+
+
+def _decode_checked(body: Body) -> dict[str, Any]:
+    try:
+        document = _loads(body)
+    except _DecodeError as exc:
+        raise SchemaValidationError(f"malformed planner bundle: {exc}") from None
+    if not isinstance(document, dict):
+        raise SchemaValidationError("malformed planner bundle: expected object")
+
+    issues = [
+        ValidationIssue(section, None, "<root>", "unknown section")
+        for section in document
+        if section not in BUNDLE_SECTIONS
+    ]
+    missing = [section for section in BUNDLE_SECTIONS if section not in document]
+    issues += [
+        ValidationIssue(section, None, "<root>", "missing required section") for section in missing
+    ]
+    if not missing:
+        sections = {section: document[section] for section in BUNDLE_SECTIONS}
+        for section, (_, is_array) in BUNDLE_SECTIONS.items():
+            if is_array and not isinstance(sections[section], list):
+                issues.append(ValidationIssue(section, None, "<root>", "expected array"))
+                sections[section] = []
+        issues += check_planner_bundle(**sections)
+    if issues:
+        raise BundleValidationError(issues)
+    return document
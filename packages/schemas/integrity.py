@@ -0,0 +1,143 @@
+"""Cross-artifact referential integrity of planner bundles.
+
+Schema validation looks at one artifact at a time. ``ReferenceIndex`` checks
+the joins between them: card and event ids are unique, every id listed by the
+thread pass and every ``action_card_id`` of a timeline event names an item of
+the bundle, and the thread pass points at the bundled skill registry. Ids are
+indexed in dicts as items arrive, so the whole check is linear in the size of
+the bundle and can run while a bundle is streamed, holding only the ids.
+
+Items that are not shaped as their schema requires are skipped here; the
+schema stage already reports them.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .validator import ValidationIssue
+
+
+def _id(item: Any, key: str) -> str | None:
+    if isinstance(item, dict):
+        value = item.get(key)
+        if isinstance(value, str):
+            return value
+    return None
+
+
+class ReferenceIndex:
+    """Ids seen in one bundle so far and the references waiting to be resolved."""
+
+    def __init__(self) -> None:
+        self._cards: dict[str, int] = {}
+        self._events: dict[str, int] = {}
+        self._card_references: list[tuple[int, str]] = []
+        self._thread_pass: Any = None
+        self._registry_id: str | None = None
+        self._issues: list[ValidationIssue] = []
+
+    def add_action_card(self, index: int, card: Any) -> None:
+        card_id = _id(card, "card_id")
+        if card_id is None:
+            return
+        first = self._cards.setdefault(card_id, index)
+        if first != index:
+            self._issues.append(
+                ValidationIssue(
+                    "action_cards",
+                    index,
+                    "<root>.card_id",
+                    f"duplicate card_id {card_id!r} (first at index {first})",
+                )
+            )
+
+    def add_timeline_event(self, index: int, event: Any) -> None:
+        event_id = _id(event, "event_id")
+        if event_id is not None:
+            first = self._events.setdefault(event_id, index)
+            if first != index:
+                self._issues.append(
+                    ValidationIssue(
+                        "timeline_events",
+                        index,
+                        "<root>.event_id",
+                        f"duplicate event_id {event_id!r} (first at index {first})",
+                    )
+                )
+        card_id = _id(event, "action_card_id")
+        if card_id is not None:
+            self._card_references.append((index, card_id))
+
+    def set_thread_pass(self, thread_pass: Any) -> None:
+        self._thread_pass = thread_pass
+
+    def set_skill_registry(self, skill_registry: Any) -> None:
+        self._registry_id = _id(skill_registry, "registry_id")
+
+    def issues(self) -> list[ValidationIssue]:
+        """Every duplicate id and dangling reference, once all items have been added."""
+        issues = list(self._issues)
+        thread_pass = self._thread_pass
+        if isinstance(thread_pass, dict):
+            for key, known, label in (
+                ("action_card_ids", self._cards, "action card"),
+                ("timeline_event_ids", self._events, "timeline event"),
+            ):
+                ids = thread_pass.get(key)
+                if not isinstance(ids, list):
+                    continue
+                for position, item_id in enumerate(ids):
+                    if isinstance(item_id, str) and item_id not in known:
+                        issues.append(
+                            ValidationIssue(
+                                "thread_pass",
+                                None,
+                                f"<root>.{key}[{position}]",
+                                f"unknown {label} {item_id!r}",
+                            )
+                        )
+            registry_id = _id(thread_pass, "skill_registry_id")
+            if (
+                registry_id is not None
+                and self._registry_id is not None
+                and registry_id != self._registry_id
+            ):
+                issues.append(
+                    ValidationIssue(
+                        "thread_pass",
+                        None,
+                        "<root>.skill_registry_id",
+                        f"{registry_id!r} does not match skill_registry.registry_id "
+                        f"{self._registry_id!r}",
+                    )
+                )
+        for index, card_id in self._card_references:
+            if card_id not in self._cards:
+                issues.append(
+                    ValidationIssue(
+                        "timeline_events",
+                        index,
+                        "<root>.action_card_id",
+                        f"unknown action card {card_id!r}",
+                    )
+                )
+        return issues
+
+
+def check_references(
+    *,
+    thread_pass: dict[str, Any],
+    action_cards: list[dict[str, Any]],
+    skill_registry: dict[str, Any],
+    timeline_events: list[dict[str, Any]],
+) -> list[ValidationIssue]:
+    """Return every duplicate id and dangling reference in a planner bundle."""
+    index = ReferenceIndex()
+    for position, card in enumerate(action_cards):
+        index.add_action_card(position, card)
+    for position, event in enumerate(timeline_events):
+        index.add_timeline_event(position, event)
+    index.set_thread_pass(thread_pass)
+    index.set_skill_registry(skill_registry)
+    return index.issues()
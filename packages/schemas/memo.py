@@ -0,0 +1,248 @@
+"""Remember payloads that already passed validation.
+
+Planner clients resend the same ``skill_registry`` and mostly unchanged action
+cards on every pass. ``ValidationMemo`` hashes a canonical JSON encoding of
+each payload (sorted keys, keyed by schema name and resolved version), keeps a
+bounded LRU of digests known to be valid, and skips the validator on a hit.
+Invalid payloads are never remembered, so every call still reports their
+violations, and the memo is dropped whenever the registry reloads a schema it
+has seen.
+
+The encoding uses ``orjson`` when it is installed; the standard library
+encoder costs about as much as validating a small payload, so without
+``orjson`` the memo only pays off for large artifacts. ``orjson`` writes NaN
+and infinities as ``null``, so any encoding containing ``null`` is redone with
+the standard encoder to keep those apart from ``None``. Payloads are expected
+to be JSON-decoded data: other objects are either uncacheable or, for types
+``orjson`` serialises natively (``UUID``, ``Enum``), hashed by their JSON value.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .registry import SchemaRegistry, default_registry
+from .validator import (
+    DEFAULT_CHUNK_SIZE,
+    ValidationIssue,
+    Validator,
+    _Failure,
+    _run,
+    collect_violations,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+DEFAULT_MEMO_ENTRIES = 65_536
+
+_json_encode = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+
+
+def _encode_stdlib(payload: Any) -> bytes:
+    return _json_encode(payload).encode("ascii")
+
+
+_encode: Callable[[Any], bytes]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    _encode = _encode_stdlib
+else:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+    def _encode_orjson(payload: Any) -> bytes:
+        encoded: bytes = orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        if b"null" in encoded:
+            return _encode_stdlib(payload)
+        return encoded
+
+    _encode = _encode_orjson
+
+
+@dataclass(frozen=True)
+class ValidationMemoStats:
+    hits: int
+    misses: int
+    uncacheable: int
+    evictions: int
+    size: int
+
+
+@dataclass(frozen=True)
+class _Resolved:
+    version: int
+    hasher: Any
+    check: Validator
+
+
+class ValidationMemo:
+    """Bounded LRU of ``(schema, version, payload)`` digests that validated cleanly."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MEMO_ENTRIES,
+        registry: SchemaRegistry | None = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._registry = registry
+        self._valid: OrderedDict[bytes, None] = OrderedDict()
+        self._schemas: dict[tuple[str, int], _Resolved] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self.evictions = 0
+
+    def _resolve(self, schema_name: str, version: int | None) -> _Resolved:
+        registry = self._registry or default_registry()
+        if version is None:
+            version = registry.default_version(schema_name)
+        check = registry.validator(schema_name, version)
+        entry = (schema_name, version)
+        resolved = self._schemas.get(entry)
+        if resolved is None or resolved.check is not check:
+            hasher = hashlib.blake2b(f"{schema_name}.v{version}\x00".encode(), digest_size=16)
+            resolved = _Resolved(version, hasher, check)
+            with self._lock:
+                if entry in self._schemas:
+                    self._valid.clear()
+                self._schemas[entry] = resolved
+        return resolved
+
+    def _digests(self, resolved: _Resolved, payloads: Sequence[Any]) -> list[bytes | None]:
+        digests: list[bytes | None] = []
+        copy = resolved.hasher.copy
+        for payload in payloads:
+            try:
+                encoded = _encode(payload)
+            except (TypeError, ValueError):
+                self.uncacheable += 1
+                digests.append(None)
+                continue
+            digest = copy()
+            digest.update(encoded)
+            digests.append(digest.digest())
+        return digests
+
+    def _known(self, digests: Sequence[bytes | None]) -> list[bool]:
+        known = []
+        with self._lock:
+            valid = self._valid
+            for digest in digests:
+                hit = digest is not None and digest in valid
+                if hit:
+                    valid.move_to_end(digest)  # type: ignore[arg-type]
+                known.append(hit)
+            hits = sum(known)
+            self.hits += hits
+            self.misses += len(known) - hits
+        return known
+
+    def _remember(self, digests: Sequence[bytes | None]) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            valid = self._valid
+            for digest in digests:
+                if digest is not None:
+                    valid[digest] = None
+            while len(valid) > self._max_entries:
+                valid.popitem(last=False)
+                self.evictions += 1
+
+    def validate(self, schema_name: str, payload: Any, *, version: int | None = None) -> None:
+        """Memoised ``validate_payload``: raise ``SchemaValidationError`` on violations."""
+        resolved = self._resolve(schema_name, version)
+        digests = self._digests(resolved, (payload,))
+        if self._known(digests)[0]:
+            return
+        _run(resolved.check, payload)
+        self._remember(digests)
+
+    def check(
+        self, schema_name: str, payload: Any, *, version: int | None = None
+    ) -> list[ValidationIssue]:
+        """Issues for a single (non-array) artifact, reported with ``index=None``."""
+        resolved = self._resolve(schema_name, version)
+        digests = self._digests(resolved, (payload,))
+        if self._known(digests)[0]:
+            return []
+        try:
+            resolved.check(payload)
+        except _Failure as failure:
+            return [ValidationIssue(schema_name, None, failure.path(), failure.message)]
+        self._remember(digests)
+        return []
+
+    def collect(
+        self,
+        schema_name: str,
+        payloads: Sequence[Any],
+        *,
+        artifact: str | None = None,
+        start: int = 0,
+        executor: Executor | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        version: int | None = None,
+    ) -> list[ValidationIssue]:
+        """Memoised ``collect_violations``; only unseen payloads reach the validator."""
+        resolved = self._resolve(schema_name, version)
+        label = artifact or schema_name
+        digests = self._digests(resolved, payloads)
+        positions = [index for index, hit in enumerate(self._known(digests)) if not hit]
+        if not positions:
+            return []
+        pending = [payloads[index] for index in positions]
+
+        failures: dict[int, tuple[str, str]] = {}
+        if executor is not None and self._registry is None:
+            for issue in collect_violations(
+                schema_name,
+                pending,
+                artifact=label,
+                executor=executor,
+                chunk_size=chunk_size,
+                version=resolved.version,
+            ):
+                if issue.index is not None:
+                    failures[issue.index] = (issue.path, issue.message)
+        else:
+            for offset, payload in enumerate(pending):
+                try:
+                    resolved.check(payload)
+                except _Failure as failure:
+                    failures[offset] = (failure.path(), failure.message)
+
+        self._remember(
+            [digests[index] for offset, index in enumerate(positions) if offset not in failures]
+        )
+        return [
+            ValidationIssue(label, start + positions[offset], path, message)
+            for offset, (path, message) in failures.items()
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._valid.clear()
+
+    def stats(self) -> ValidationMemoStats:
+        with self._lock:
+            return ValidationMemoStats(
+                self.hits, self.misses, self.uncacheable, self.evictions, len(self._valid)
+            )
+
+    def __len__(self) -> int:
+        return len(self._valid)
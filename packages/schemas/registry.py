@@ -0,0 +1,212 @@
+"""Versioned schema registry with hot reload.
+
+``SchemaRegistry`` discovers every ``{name}.v{N}.json`` file in a directory,
+parses and compiles each one up front, and serves validators by name and
+version. ``refresh`` re-reads
+only files whose mtime or size changed and publishes the result by replacing
+one immutable mapping, so validation never waits on a reload and never sees a
+half-updated registry. ``watch`` runs ``refresh`` from a polling thread; the
+standard library has no portable inotify binding, and polling a handful of
+files once a second is cheap.
+
+A file that fails to parse keeps serving its previous compiled version.
+
+Callers that pass no version get the name's default version: the one pinned
+through ``default_versions``, otherwise the highest version present when the
+name was first loaded. A version added later by hot reload is served only when
+asked for explicitly until ``set_default_version`` promotes it, so dropping a
+``.v2.json`` file in never changes validation for existing v1 clients.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .validator import Validator, _compile, _run
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_DIRECTORY = Path(__file__).resolve().parent
+DEFAULT_POLL_INTERVAL = 1.0
+
+_SCHEMA_FILE = re.compile(r"^(?P<name>[A-Za-z0-9_]+)\.v(?P<version>[1-9][0-9]*)\.json$")
+
+
+@dataclass(frozen=True)
+class SchemaEntry:
+    name: str
+    version: int
+    path: Path
+    stamp: tuple[int, int]
+    schema: dict[str, Any]
+    validator: Validator
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    entries: Mapping[tuple[str, int], SchemaEntry]
+    latest: Mapping[str, int]
+    defaults: Mapping[str, int]
+
+
+def _stamp(stat: os.stat_result) -> tuple[int, int]:
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SchemaRegistry:
+    """Compiled schemas keyed by ``(name, version)``, swapped atomically on reload."""
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] = SCHEMA_DIRECTORY,
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        default_versions: Mapping[str, int] | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self._poll_interval = poll_interval
+        self._pinned = dict(default_versions or {})
+        self._snapshot = _Snapshot({}, {}, {})
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: threading.Thread | None = None
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """Re-scan the directory; returns True if anything was added, changed or removed."""
+        with self._reload_lock:
+            current = self._snapshot.entries
+            entries: dict[tuple[str, int], SchemaEntry] = {}
+            for path in sorted(self.directory.glob("*.v*.json")):
+                match = _SCHEMA_FILE.match(path.name)
+                if match is None:
+                    continue
+                key = (match.group("name"), int(match.group("version")))
+                try:
+                    stamp = _stamp(path.stat())
+                except FileNotFoundError:
+                    continue
+                previous = current.get(key)
+                if previous is not None and previous.stamp == stamp:
+                    entries[key] = previous
+                    continue
+                try:
+                    schema = json.loads(path.read_text(encoding="utf-8"))
+                    check = _compile(schema)
+                    entries[key] = SchemaEntry(key[0], key[1], path, stamp, schema, check)
+                except (OSError, ValueError, TypeError, KeyError):
+                    logger.exception("failed to load schema %s", path)
+                    if previous is not None:
+                        entries[key] = previous
+
+            if entries == dict(current):
+                return False
+            latest: dict[str, int] = {}
+            for name, version in entries:
+                latest[name] = max(version, latest.get(name, 0))
+            self._snapshot = _Snapshot(entries, latest, self._defaults(entries, latest))
+            return True
+
+    def _defaults(
+        self, entries: Mapping[tuple[str, int], SchemaEntry], latest: Mapping[str, int]
+    ) -> dict[str, int]:
+        previous = self._snapshot.defaults
+        defaults: dict[str, int] = {}
+        for name, highest in latest.items():
+            pinned = self._pinned.get(name, previous.get(name))
+            defaults[name] = pinned if pinned is not None and (name, pinned) in entries else highest
+        return defaults
+
+    def _entry(self, name: str, version: int | None) -> SchemaEntry:
+        snapshot = self._snapshot
+        if version is None:
+            version = snapshot.defaults.get(name)
+        entry = snapshot.entries.get((name, version)) if version is not None else None
+        if entry is None:
+            label = name if version is None else f"{name}.v{version}"
+            raise FileNotFoundError(f"Schema not found in {self.directory}: {label}")
+        return entry
+
+    def names(self) -> list[str]:
+        return sorted(self._snapshot.latest)
+
+    def versions(self, name: str) -> list[int]:
+        entries = self._snapshot.entries
+        return sorted(version for entry_name, version in entries if entry_name == name)
+
+    def latest_version(self, name: str) -> int:
+        latest = self._snapshot.latest.get(name)
+        if latest is None:
+            raise FileNotFoundError(f"Schema not found in {self.directory}: {name}")
+        return latest
+
+    def default_version(self, name: str) -> int:
+        """The version used when a caller does not ask for one."""
+        return self._entry(name, None).version
+
+    def set_default_version(self, name: str, version: int) -> None:
+        """Make ``version`` the default for ``name``, e.g. to promote a new version."""
+        with self._reload_lock:
+            snapshot = self._snapshot
+            if (name, version) not in snapshot.entries:
+                raise FileNotFoundError(f"Schema not found in {self.directory}: {name}.v{version}")
+            self._pinned[name] = version
+            defaults = {**snapshot.defaults, name: version}
+            self._snapshot = _Snapshot(snapshot.entries, snapshot.latest, defaults)
+
+    def schema(self, name: str, version: int | None = None) -> dict[str, Any]:
+        return self._entry(name, version).schema
+
+    def validator(self, name: str, version: int | None = None) -> Validator:
+        """Compiled validator raising the internal failure signal; see ``validate``."""
+        return self._entry(name, version).validator
+
+    def validate(self, name: str, payload: Any, *, version: int | None = None) -> None:
+        """Raise ``SchemaValidationError`` if ``payload`` violates the schema."""
+        _run(self._entry(name, version).validator, payload)
+
+    def watch(self) -> None:
+        """Start polling the directory for changes every ``poll_interval`` seconds."""
+        if self._watcher is not None:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._poll, name="schema-watcher", daemon=True)
+        self._watcher.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self._poll_interval):
+            try:
+                if self.refresh():
+                    logger.info("reloaded schemas from %s", self.directory)
+            except Exception:
+                logger.exception("schema reload failed")
+
+
+_default_registry: SchemaRegistry | None = None
+_default_lock = threading.Lock()
+
+
+def default_registry() -> SchemaRegistry:
+    """Process-wide registry over the bundled schemas, built on first use."""
+    global _default_registry
+    registry = _default_registry
+    if registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = SchemaRegistry()
+            registry = _default_registry
+    return registry
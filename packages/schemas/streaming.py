@@ -0,0 +1,228 @@
+"""Incremental validation of planner bundles read from a byte stream.
+
+The bundle is a JSON object with ``thread_pass``, ``skill_registry``,
+``action_cards`` and ``timeline_events`` members. Array members are decoded
+one element at a time, so only the current element and the read buffer are
+held in memory regardless of how many items the bundle contains.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import Callable, Iterator
+from typing import Any, Protocol
+
+from .integrity import ReferenceIndex
+from .validator import (
+    BundleValidationError,
+    SchemaValidationError,
+    ValidationIssue,
+    Validator,
+    _compiled_validator,
+    _Failure,
+)
+
+DEFAULT_READ_SIZE = 64 * 1024
+DEFAULT_MAX_ITEM_SIZE = 16 * 1024 * 1024
+
+# Top-level member -> (schema name, whether the member is an array of items).
+BUNDLE_SECTIONS: dict[str, tuple[str, bool]] = {
+    "thread_pass": ("thread_pass", False),
+    "skill_registry": ("skill_registry", False),
+    "action_cards": ("action_card", True),
+    "timeline_events": ("timeline_event", True),
+}
+
+_WHITESPACE = " \t\n\r"
+
+
+class ByteStream(Protocol):
+    def read(self, size: int = -1, /) -> bytes: ...
+
+
+class _JsonStreamReader:
+    """Minimal pull parser over a byte stream built on ``JSONDecoder.raw_decode``."""
+
+    def __init__(self, stream: ByteStream, read_size: int, max_item_size: int) -> None:
+        self._stream = stream
+        self._read_size = read_size
+        self._max_item_size = max_item_size
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._consumed = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        if self._pos:
+            self._consumed += self._pos
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        chunk = self._stream.read(self._read_size)
+        if not chunk:
+            self._eof = True
+            self._buffer += self._utf8.decode(b"", final=True)
+            return False
+        self._buffer += self._utf8.decode(chunk)
+        return True
+
+    def error(self, message: str) -> SchemaValidationError:
+        return SchemaValidationError(
+            f"malformed planner bundle at offset {self._consumed + self._pos}: {message}"
+        )
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at EOF)."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"expected {char!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if len(self._buffer) - self._pos > self._max_item_size:
+                    raise self.error("item exceeds maximum size") from None
+                if not self._fill():
+                    raise self.error(exc.msg) from None
+                continue
+            # A number or literal touching the end of the buffer may continue
+            # in the next chunk, so only accept it once more input is visible.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def end_of_input(self) -> bool:
+        return self.peek() == ""
+
+
+def iter_planner_bundle(
+    stream: ByteStream,
+    *,
+    read_size: int = DEFAULT_READ_SIZE,
+    max_item_size: int = DEFAULT_MAX_ITEM_SIZE,
+) -> Iterator[tuple[str, Any]]:
+    """Yield ``(section, item)`` pairs for valid bundle items as they are decoded.
+
+    Array members yield one pair per element, object members one pair each.
+    Once a violation is found no further items are yielded, but the rest of the
+    stream is still validated; ``BundleValidationError`` listing every issue is
+    raised after the input is exhausted. Cross-artifact references are checked
+    once the whole bundle has been read, so a dangling reference also raises
+    after the last item. Malformed JSON raises ``SchemaValidationError``
+    immediately.
+    """
+    reader = _JsonStreamReader(stream, read_size, max_item_size)
+    issues: list[ValidationIssue] = []
+    seen: set[str] = set()
+    references = ReferenceIndex()
+
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        while True:
+            section = reader.value()
+            if not isinstance(section, str):
+                raise reader.error("expected member name")
+            reader.expect(":")
+            if section in seen:
+                issues.append(ValidationIssue(section, None, "<root>", "duplicate section"))
+            seen.add(section)
+
+            spec = BUNDLE_SECTIONS.get(section)
+            if spec is None:
+                reader.value()
+                issues.append(ValidationIssue(section, None, "<root>", "unknown section"))
+            elif spec[1]:
+                check = _compiled_validator(spec[0])
+                add = (
+                    references.add_action_card
+                    if section == "action_cards"
+                    else references.add_timeline_event
+                )
+                for item in _iter_array(reader, section, check, issues, add):
+                    if not issues:
+                        yield section, item
+            else:
+                item = reader.value()
+                if section == "thread_pass":
+                    references.set_thread_pass(item)
+                else:
+                    references.set_skill_registry(item)
+                if _check(_compiled_validator(spec[0]), section, None, item, issues) and not issues:
+                    yield section, item
+
+            if reader.peek() == ",":
+                reader.expect(",")
+                continue
+            reader.expect("}")
+            break
+
+    if not reader.end_of_input():
+        raise reader.error("unexpected data after bundle")
+    for section in BUNDLE_SECTIONS:
+        if section not in seen:
+            issues.append(ValidationIssue(section, None, "<root>", "missing required section"))
+    issues += references.issues()
+    if issues:
+        raise BundleValidationError(issues)
+
+
+def _iter_array(
+    reader: _JsonStreamReader,
+    section: str,
+    check: Validator,
+    issues: list[ValidationIssue],
+    index_item: Callable[[int, Any], None],
+) -> Iterator[Any]:
+    if reader.peek() != "[":
+        reader.value()
+        issues.append(ValidationIssue(section, None, "<root>", "expected array"))
+        return
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+    index = 0
+    while True:
+        item = reader.value()
+        index_item(index, item)
+        if _check(check, section, index, item, issues):
+            yield item
+        index += 1
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("]")
+        return
+
+
+def _check(
+    check: Validator, section: str, index: int | None, item: Any, issues: list[ValidationIssue]
+) -> bool:
+    try:
+        check(item)
+    except _Failure as failure:
+        issues.append(ValidationIssue(section, index, failure.path(), failure.message))
+        return False
+    return True
@@ -1,34 +1,95 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime
-from functools import lru_cache
-from pathlib import Path
-from typing import Any
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from packages.instrumentation import counter, histogram
+
+from .formats import format_checker
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .memo import ValidationMemo
+    from .registry import SchemaRegistry
+
+Validator = Callable[[Any], None]
+
+DEFAULT_CHUNK_SIZE = 2000
+
+_VALIDATION_SECONDS = histogram(
+    "schema_validation_seconds", "Wall time of schema validation calls, by schema."
+)
+_VALIDATED_PAYLOADS = counter(
+    "schema_validated_payloads_total", "Payloads checked against a schema, by schema."
+)
+_VIOLATIONS = counter(
+    "schema_violations_total",
+    "Schema violations by schema and field path, with array indexes folded to [].",
+)
+_BUNDLE_SECONDS = histogram(
+    "planner_bundle_validation_seconds", "Wall time of check_planner_bundle, by stage."
+)
+_ARRAY_INDEX = re.compile(r"\[\d+\]")
 
 
 class SchemaValidationError(ValueError):
     """Raised when a payload does not satisfy a schema."""
 
 
-def _schema_path(schema_name: str) -> Path:
-    return Path(__file__).resolve().parent / f"{schema_name}.v1.json"
+@dataclass(frozen=True)
+class ValidationIssue:
+    """A single schema violation located inside a planner bundle."""
 
+    artifact: str
+    index: int | None
+    path: str
+    message: str
 
-@lru_cache(maxsize=8)
-def _load_schema(schema_name: str) -> dict[str, Any]:
-    schema_file = _schema_path(schema_name)
-    if not schema_file.exists():
-        raise FileNotFoundError(f"Schema file not found: {schema_file}")
-    return json.loads(schema_file.read_text(encoding="utf-8"))
+    def __str__(self) -> str:
+        location = self.artifact if self.index is None else f"{self.artifact}[{self.index}]"
+        return f"{location}: validation failed at {self.path}: {self.message}"
 
 
-def _is_date_time(value: str) -> bool:
-    try:
-        datetime.fromisoformat(value.replace("Z", "+00:00"))
-        return True
-    except ValueError:
-        return False
+class BundleValidationError(SchemaValidationError):
+    """Raised with every violation found in a bundle instead of only the first."""
+
+    def __init__(self, issues: Sequence[ValidationIssue]) -> None:
+        self.issues = tuple(issues)
+        summary = str(self.issues[0])
+        if len(self.issues) > 1:
+            summary = f"{summary} (and {len(self.issues) - 1} more violations)"
+        super().__init__(summary)
+
+
+class _Failure(Exception):
+    """Internal failure signal raised by compiled validators.
+
+    Path segments are appended while the exception unwinds through container
+    validators, so no path string is built unless validation actually fails.
+    """
+
+    __slots__ = ("message", "segments")
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+        self.segments: list[str] = []
+
+    def path(self) -> str:
+        return "<root>" + "".join(reversed(self.segments))
+
+
+def _registry() -> SchemaRegistry:
+    from .registry import default_registry
+
+    return default_registry()
+
+
+def _load_schema(schema_name: str, version: int | None = None) -> dict[str, Any]:
+    return _registry().schema(schema_name, version)
 
 
 def _validate_type(expected: str, value: Any) -> bool:
@@ -55,6 +116,11 @@ def _raise(path: str, message: str) -> None:
 
 
 def _validate(schema: dict[str, Any], value: Any, path: str = "<root>") -> None:
+    """Reference interpreter that walks the schema dict for every value.
+
+    Production code uses the compiled validators below; this walk is kept as the
+    behavioural reference for equivalence tests and benchmarks.
+    """
     expected_type = schema.get("type")
     if expected_type and not _validate_type(expected_type, value):
         _raise(path, f"expected {expected_type}")
@@ -91,8 +157,10 @@ def _validate(schema: dict[str, Any], value: Any, path: str = "<root>") -> None:
         if min_length is not None and len(value) < min_length:
             _raise(path, f"string shorter than {min_length}")
 
-        if schema.get("format") == "date-time" and not _is_date_time(value):
-            _raise(path, "invalid date-time format")
+        format_name = schema.get("format")
+        check_format = format_checker(format_name) if format_name is not None else None
+        if check_format is not None and not check_format(value):
+            _raise(path, f"invalid {format_name} format")
 
     if expected_type in {"integer", "number"}:
         minimum = schema.get("minimum")
@@ -103,17 +171,367 @@ def _validate(schema: dict[str, Any], value: Any, path: str = "<root>") -> None:
             _raise(path, f"value greater than maximum {maximum}")
 
 
-def validate_payload(schema_name: str, payload: dict[str, Any]) -> None:
-    schema = _load_schema(schema_name)
-    _validate(schema, payload)
+def _enum_members(values: list[Any]) -> frozenset[Any] | tuple[Any, ...]:
+    try:
+        return frozenset(values)
+    except TypeError:
+        return tuple(values)
+
+
+def _in_enum(members: frozenset[Any] | tuple[Any, ...], value: Any) -> bool:
+    try:
+        return value in members
+    except TypeError:
+        # Unhashable values cannot be frozenset members but may still compare equal.
+        return any(value == member for member in members)
+
+
+def _compile_object(schema: dict[str, Any]) -> Validator:
+    properties = tuple(
+        (key, f".{key}", _compile(prop_schema))
+        for key, prop_schema in schema.get("properties", {}).items()
+    )
+    required = tuple(schema.get("required", []))
+    required_keys = frozenset(required)
+    allowed_keys = (
+        frozenset(key for key, _, _ in properties)
+        if schema.get("additionalProperties", True) is False
+        else None
+    )
+
+    def validate_object(value: Any) -> None:
+        if not isinstance(value, dict):
+            raise _Failure("expected object")
+        keys = value.keys()
+        if not required_keys <= keys:
+            missing = next(key for key in required if key not in value)
+            raise _Failure(f"missing required property '{missing}'")
+        if allowed_keys is not None and not keys <= allowed_keys:
+            unknown = next(key for key in value if key not in allowed_keys)
+            raise _Failure(f"unknown property '{unknown}'")
+        for key, segment, check in properties:
+            if key in value:
+                try:
+                    check(value[key])
+                except _Failure as failure:
+                    failure.segments.append(segment)
+                    raise
+
+    return validate_object
+
+
+def _compile_array(schema: dict[str, Any]) -> Validator:
+    item_schema = schema.get("items")
+    check = _compile(item_schema) if item_schema is not None else None
+
+    def validate_array(value: Any) -> None:
+        if not isinstance(value, list):
+            raise _Failure("expected array")
+        if check is None:
+            return
+        for index, item in enumerate(value):
+            try:
+                check(item)
+            except _Failure as failure:
+                failure.segments.append(f"[{index}]")
+                raise
+
+    return validate_array
+
+
+def _compile_string(schema: dict[str, Any]) -> Validator:
+    members = _enum_members(schema["enum"]) if "enum" in schema else None
+    min_length = schema.get("minLength")
+    format_name = schema.get("format")
+    check_format = format_checker(format_name) if format_name is not None else None
+    format_message = f"invalid {format_name} format"
+
+    def validate_string(value: Any) -> None:
+        if not isinstance(value, str):
+            raise _Failure("expected string")
+        if members is not None and value not in members:
+            raise _Failure(f"value {value!r} is not in enum")
+        if min_length is not None and len(value) < min_length:
+            raise _Failure(f"string shorter than {min_length}")
+        if check_format is not None and not check_format(value):
+            raise _Failure(format_message)
+
+    return validate_string
+
+
+def _compile_numeric(schema: dict[str, Any]) -> Validator:
+    expected_type = schema["type"]
+    accepted: type | tuple[type, ...] = int if expected_type == "integer" else (int, float)
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+    type_message = f"expected {expected_type}"
+    minimum_message = f"value less than minimum {minimum}"
+    maximum_message = f"value greater than maximum {maximum}"
+
+    def validate_numeric(value: Any) -> None:
+        if not isinstance(value, accepted) or isinstance(value, bool):
+            raise _Failure(type_message)
+        if minimum is not None and value < minimum:
+            raise _Failure(minimum_message)
+        if maximum is not None and value > maximum:
+            raise _Failure(maximum_message)
+
+    return validate_numeric
+
+
+def _validate_boolean(value: Any) -> None:
+    if not isinstance(value, bool):
+        raise _Failure("expected boolean")
+
+
+def _compile(schema: dict[str, Any]) -> Validator:
+    """Compile a schema into a closure that raises ``_Failure`` on violations.
+
+    Checks run in the same order as ``_validate`` so both report the same
+    first violation for any payload.
+    """
+    expected_type = schema.get("type")
+    check: Validator | None
+    if expected_type == "string":
+        return _compile_string(schema)
+    if expected_type == "object":
+        check = _compile_object(schema)
+    elif expected_type == "array":
+        check = _compile_array(schema)
+    elif expected_type in {"integer", "number"}:
+        check = _compile_numeric(schema)
+    elif expected_type == "boolean":
+        check = _validate_boolean
+    else:
+        check = None
+
+    if "enum" in schema:
+        return _compile_enum(schema, expected_type, check)
+    if check is None:
+        return _accept_any
+    return check
+
+
+def _compile_enum(schema: dict[str, Any], expected_type: Any, check: Validator | None) -> Validator:
+    members = _enum_members(schema["enum"])
+
+    def validate_enum(value: Any) -> None:
+        if expected_type and not _validate_type(expected_type, value):
+            raise _Failure(f"expected {expected_type}")
+        if not _in_enum(members, value):
+            raise _Failure(f"value {value!r} is not in enum")
+        if check is not None:
+            check(value)
+
+    return validate_enum
+
+
+def _accept_any(value: Any) -> None:
+    return None
+
+
+def _compiled_validator(schema_name: str, version: int | None = None) -> Validator:
+    return _registry().validator(schema_name, version)
+
+
+def compile_schema(schema: dict[str, Any]) -> Callable[[Any], None]:
+    """Compile a schema dict into a reusable validator.
+
+    The returned callable raises ``SchemaValidationError`` for invalid values.
+    """
+    check = _compile(schema)
+
+    def validate(value: Any) -> None:
+        _run(check, value)
+
+    return validate
+
+
+def _run(check: Validator, value: Any, schema_name: str | None = None) -> None:
+    try:
+        check(value)
+    except _Failure as failure:
+        path = failure.path()
+        if schema_name is not None:
+            _count_violation(schema_name, path)
+        raise SchemaValidationError(f"validation failed at {path}: {failure.message}") from None
+
+
+def _count_violation(schema_name: str, path: str) -> None:
+    if _VIOLATIONS.enabled:
+        _VIOLATIONS.inc(schema=schema_name, path=_ARRAY_INDEX.sub("[]", path))
+
+
+def validate_payload(
+    schema_name: str, payload: dict[str, Any], *, version: int | None = None
+) -> None:
+    """Validate against ``version`` of the schema, or its default version if None."""
+    check = _compiled_validator(schema_name, version)
+    if _VALIDATED_PAYLOADS.enabled:
+        _VALIDATED_PAYLOADS.inc(schema=schema_name)
+    with _VALIDATION_SECONDS.time(schema=schema_name):
+        _run(check, payload, schema_name)
+
+
+def _collect_chunk(
+    schema_name: str,
+    artifact: str,
+    start: int,
+    payloads: Sequence[Any],
+    version: int | None = None,
+) -> list[ValidationIssue]:
+    check = _compiled_validator(schema_name, version)
+    issues: list[ValidationIssue] = []
+    for offset, payload in enumerate(payloads):
+        try:
+            check(payload)
+        except _Failure as failure:
+            issue = ValidationIssue(artifact, start + offset, failure.path(), failure.message)
+            issues.append(issue)
+    return issues
+
+
+def _collect_single(schema_name: str, payload: Any) -> list[ValidationIssue]:
+    check = _compiled_validator(schema_name)
+    if _VALIDATED_PAYLOADS.enabled:
+        _VALIDATED_PAYLOADS.inc(schema=schema_name)
+    with _VALIDATION_SECONDS.time(schema=schema_name):
+        try:
+            check(payload)
+        except _Failure as failure:
+            _count_violation(schema_name, failure.path())
+            return [ValidationIssue(schema_name, None, failure.path(), failure.message)]
+    return []
+
+
+def collect_violations(
+    schema_name: str,
+    payloads: Sequence[Any],
+    *,
+    artifact: str | None = None,
+    start: int = 0,
+    executor: Executor | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    version: int | None = None,
+) -> list[ValidationIssue]:
+    """Validate every payload and return one issue per invalid item, ordered by index.
+
+    Each invalid item reports its first violation; ``start`` is the index of
+    ``payloads[0]`` within its artifact when validating a slice. When
+    ``executor`` is given (typically a ``ProcessPoolExecutor``) and there is
+    more than one chunk, the chunks are validated concurrently on it.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    _VALIDATED_PAYLOADS.inc(len(payloads), schema=schema_name)
+    with _VALIDATION_SECONDS.time(schema=schema_name):
+        issues = _collect_violations(
+            schema_name, payloads, artifact or schema_name, start, executor, chunk_size, version
+        )
+    for issue in issues:
+        _count_violation(schema_name, issue.path)
+    return issues
+
+
+def _collect_violations(
+    schema_name: str,
+    payloads: Sequence[Any],
+    label: str,
+    start: int,
+    executor: Executor | None,
+    chunk_size: int,
+    version: int | None,
+) -> list[ValidationIssue]:
+    if executor is None or len(payloads) <= chunk_size:
+        return _collect_chunk(schema_name, label, start, payloads, version)
+
+    futures = [
+        executor.submit(
+            _collect_chunk,
+            schema_name,
+            label,
+            start + offset,
+            payloads[offset : offset + chunk_size],
+            version,
+        )
+        for offset in range(0, len(payloads), chunk_size)
+    ]
+    issues: list[ValidationIssue] = []
+    for future in futures:
+        issues.extend(future.result())
+    return issues
+
+
+def check_planner_bundle(
+    *,
+    thread_pass: dict[str, Any],
+    action_cards: list[dict[str, Any]],
+    skill_registry: dict[str, Any],
+    timeline_events: list[dict[str, Any]],
+    executor: Executor | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    memo: ValidationMemo | None = None,
+    references: bool = True,
+) -> list[ValidationIssue]:
+    """Return every violation in a planner bundle without raising.
 
+    Schema violations come first, then duplicate ids and dangling references
+    between the artifacts unless ``references`` is False. With ``memo``,
+    payloads already known to be valid are not validated again.
+    """
+    from .integrity import check_references
 
-def validate_planner_bundle(*, thread_pass: dict[str, Any], action_cards: list[dict[str, Any]], skill_registry: dict[str, Any], timeline_events: list[dict[str, Any]]) -> None:
-    validate_payload("thread_pass", thread_pass)
-    validate_payload("skill_registry", skill_registry)
+    if memo is None:
+        single, collect = _collect_single, collect_violations
+    else:
+        single, collect = memo.check, memo.collect
+    with _BUNDLE_SECONDS.time(stage="schema"):
+        issues = single("thread_pass", thread_pass)
+        issues += single("skill_registry", skill_registry)
+        issues += collect(
+            "action_card",
+            action_cards,
+            artifact="action_cards",
+            executor=executor,
+            chunk_size=chunk_size,
+        )
+        issues += collect(
+            "timeline_event",
+            timeline_events,
+            artifact="timeline_events",
+            executor=executor,
+            chunk_size=chunk_size,
+        )
+    if references:
+        with _BUNDLE_SECONDS.time(stage="references"):
+            issues += check_references(
+                thread_pass=thread_pass,
+                action_cards=action_cards,
+                skill_registry=skill_registry,
+                timeline_events=timeline_events,
+            )
+    return issues
 
-    for action_card in action_cards:
-        validate_payload("action_card", action_card)
 
-    for timeline_event in timeline_events:
-        validate_payload("timeline_event", timeline_event)
+def validate_planner_bundle(
+    *,
+    thread_pass: dict[str, Any],
+    action_cards: list[dict[str, Any]],
+    skill_registry: dict[str, Any],
+    timeline_events: list[dict[str, Any]],
+    executor: Executor | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    memo: ValidationMemo | None = None,
+) -> None:
+    """Validate a whole planner bundle, raising ``BundleValidationError`` with all issues."""
+    issues = check_planner_bundle(
+        thread_pass=thread_pass,
+        action_cards=action_cards,
+        skill_registry=skill_registry,
+        timeline_events=timeline_events,
+        executor=executor,
+        chunk_size=chunk_size,
+        memo=memo,
+    )
+    if issues:
+        raise BundleValidationError(issues)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from apps.api.app.auth.audit import AuditSink
+from apps.api.app.auth.audit_store import AuditLogStore
+from apps.api.app.auth.lifespan import auth_lifespan
+from apps.api.app.auth.routes import router
+from apps.api.app.db.models import Base
+
+
+def record(index: int = 0) -> dict[str, object]:
+    return {
+        "action": "auth.login",
+        "actor_id": f"u-{index}",
+        "method": "POST",
+        "path": "/auth/login",
+        "client_ip": "127.0.0.1",
+        "user_agent": "pytest",
+    }
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def stored(engine) -> list[dict[str, object]]:
+    return list(reversed(AuditLogStore(engine).query(limit=1000).rows))
+
+
+def audit_rows(engine) -> int:
+    return len(stored(engine))
+
+
+def test_flush_writes_buffered_records_in_batches(engine):
+    sink = AuditSink(engine, batch_size=4)
+    for index in range(10):
+        assert sink.submit(record(index))
+
+    assert audit_rows(engine) == 0
+    assert sink.flush() == 10
+    assert audit_rows(engine) == 10
+    assert sink.stats.batches == 3
+    assert [row["actor_id"] for row in stored(engine)] == [f"u-{index}" for index in range(10)]
+
+
+def test_writer_thread_flushes_on_interval_and_close_drains(engine):
+    with AuditSink(engine, batch_size=1000, flush_interval=0.02) as sink:
+        sink.submit(record())
+        deadline = time.monotonic() + 2.0
+        while audit_rows(engine) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert audit_rows(engine) == 1
+        for index in range(5):
+            sink.submit(record(index))
+
+    assert audit_rows(engine) == 6
+    assert sink.pending_count() == 0
+
+
+@pytest.mark.parametrize(
+    ("overflow", "kept"),
+    [("drop_newest", ["u-0", "u-1"]), ("drop_oldest", ["u-1", "u-2"]), ("block", ["u-0", "u-1"])],
+)
+def test_overflow_policies(engine, overflow, kept):
+    sink = AuditSink(engine, max_buffered=2, overflow=overflow, block_timeout=0.01)
+    results = [sink.submit(record(index)) for index in range(3)]
+
+    assert results[:2] == [True, True]
+    assert results[2] is (overflow == "drop_oldest")
+    assert sink.stats.dropped == 1
+    sink.flush()
+    assert [row["actor_id"] for row in stored(engine)] == kept
+
+
+def failing_inserts(monkeypatch, failures: int) -> list[int]:
+    """Make the next ``failures`` inserts raise; returns the sizes of all attempts."""
+    attempts: list[int] = []
+    insert = AuditLogStore.insert
+
+    def flaky(self, rows):
+        attempts.append(len(rows))
+        if len(attempts) <= failures:
+            raise RuntimeError("database is locked")
+        return insert(self, rows)
+
+    monkeypatch.setattr(AuditLogStore, "insert", flaky)
+    return attempts
+
+
+def test_failed_batches_are_retried_in_order(engine, monkeypatch):
+    attempts = failing_inserts(monkeypatch, failures=2)
+    sink = AuditSink(engine, batch_size=2, retry_delay=0)
+    for index in range(3):
+        sink.submit(record(index))
+
+    assert sink.flush() == 3
+    assert attempts == [2, 2, 2, 1]
+    assert sink.stats.retried == 4
+    assert sink.stats.failed == 0
+    assert [row["actor_id"] for row in stored(engine)] == ["u-0", "u-1", "u-2"]
+
+
+def test_batches_are_dropped_after_max_retries(engine, monkeypatch):
+    attempts = failing_inserts(monkeypatch, failures=3)
+    sink = AuditSink(engine, batch_size=2, max_retries=2, retry_delay=0)
+    for index in range(3):
+        sink.submit(record(index))
+
+    assert sink.flush() == 1
+    assert attempts == [2, 2, 2, 1]
+    assert sink.stats.failed == 2
+    assert [row["actor_id"] for row in stored(engine)] == ["u-2"]
+
+
+@pytest.mark.parametrize(
+    ("overflow", "kept"), [("drop_oldest", ["u-1", "u-2", "u-3"]), ("block", ["u-0", "u-1", "u-2"])]
+)
+def test_requeued_batches_respect_the_overflow_policy(engine, monkeypatch, overflow, kept):
+    sink = AuditSink(engine, max_buffered=3, batch_size=2, overflow=overflow, retry_delay=0)
+    sink.submit(record(0))
+    sink.submit(record(1))
+    insert = AuditLogStore.insert
+
+    def fail_while_buffer_fills(self, rows):
+        if sink.stats.retried == 0:
+            sink.submit(record(2))
+            sink.submit(record(3))
+            raise RuntimeError("database is locked")
+        return insert(self, rows)
+
+    monkeypatch.setattr(AuditLogStore, "insert", fail_while_buffer_fills)
+    sink.flush()
+
+    assert sink.stats.dropped == 1
+    assert [row["actor_id"] for row in stored(engine)] == kept
+
+
+def test_lifespan_flushes_the_sink_on_shutdown(engine):
+    app = FastAPI(lifespan=auth_lifespan)
+    sink = AuditSink(engine, batch_size=1000, flush_interval=60)
+    app.state.audit_sink = sink
+
+    with TestClient(app):
+        sink.submit(record())
+        assert audit_rows(engine) == 0
+
+    assert audit_rows(engine) == 1
+
+
+def test_logout_submits_audit_record_to_app_sink(engine):
+    app = FastAPI()
+    app.include_router(router)
+    sink = AuditSink(engine)
+    app.state.audit_sink = sink
+    client = TestClient(app)
+    client.cookies.set("csrf_token", "token")
+
+    response = client.post("/auth/logout", headers={"X-CSRF-Token": "token"})
+
+    assert response.status_code == 200
+    assert sink.pending_count() == 1
+    sink.close()
+    [row] = stored(engine)
+    assert row["action"] == "auth.logout"
+    assert row["path"] == "/auth/logout"
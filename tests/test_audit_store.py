@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+
+from apps.api.app.auth.audit_store import AuditCursor, AuditLogStore, run_audit_retention
+from apps.api.app.db.models import Base
+
+
+def row(actor_id: str, created_at: datetime, action: str = "auth.login") -> dict[str, object]:
+    return {
+        "action": action,
+        "actor_id": actor_id,
+        "method": "POST",
+        "path": "/auth/login",
+        "created_at": created_at,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(engine)
+    return AuditLogStore(engine)
+
+
+def test_insert_routes_rows_to_monthly_partitions(store):
+    store.insert(
+        [
+            row("u-1", datetime(2026, 8, 31, 23, 59, tzinfo=UTC)),
+            row("u-1", datetime(2026, 9, 1, tzinfo=UTC)),
+            row("u-2", datetime(2026, 10, 5, tzinfo=UTC)),
+        ]
+    )
+
+    assert list(store.partitions().values()) == [
+        "audit_log_p202608",
+        "audit_log_p202609",
+        "audit_log_p202610",
+    ]
+
+
+def test_keyset_pages_walk_partitions_newest_first(store):
+    start = datetime(2026, 7, 20, tzinfo=UTC)
+    store.insert(
+        [row("u-1" if index % 3 else "u-2", start + timedelta(days=index)) for index in range(90)]
+    )
+    expected = [start + timedelta(days=index) for index in reversed(range(90)) if index % 3]
+
+    seen: list[datetime] = []
+    cursor = None
+    while True:
+        page = store.query(actor_id="u-1", limit=7, after=cursor)
+        seen.extend(item["created_at"].replace(tzinfo=UTC) for item in page.rows)
+        if page.next_cursor is None:
+            break
+        cursor = AuditCursor.decode(page.next_cursor.encode())
+
+    assert seen == expected
+
+
+def test_query_filters_by_action_and_time_range(store):
+    store.insert(
+        [
+            row("u-1", datetime(2026, 9, 28, tzinfo=UTC), action="auth.logout"),
+            row("u-1", datetime(2026, 10, 2, tzinfo=UTC), action="auth.logout"),
+            row("u-1", datetime(2026, 10, 3, tzinfo=UTC), action="auth.login"),
+            row("u-1", datetime(2026, 10, 9, tzinfo=UTC), action="auth.logout"),
+        ]
+    )
+
+    page = store.query(
+        action="auth.logout",
+        since=datetime(2026, 9, 27, tzinfo=UTC),
+        until=datetime(2026, 10, 4, tzinfo=UTC),
+    )
+
+    assert [item["created_at"].day for item in page.rows] == [2, 28]
+    assert page.next_cursor is None
+
+
+def test_retention_drops_whole_expired_partitions_and_precreates_future(store, tmp_path):
+    store.insert([row("u-1", datetime(2026, month, 15, tzinfo=UTC)) for month in range(3, 11)])
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    dropped = run_audit_retention(
+        engine, retain_months=3, months_ahead=2, now=datetime(2026, 10, 18, tzinfo=UTC)
+    )
+
+    assert dropped == [f"audit_log_p2026{month:02d}" for month in range(3, 7)]
+    assert min(store.partitions()) == datetime(2026, 7, 1, tzinfo=UTC)
+    assert max(store.partitions()) == datetime(2026, 12, 1, tzinfo=UTC)
+    assert len(store.query().rows) == 4
@@ -1,12 +1,40 @@
 from __future__ import annotations
 
-from cryptography.fernet import Fernet
+import base64
+import json
+import os
+
+import pytest
+from cryptography.fernet import Fernet, InvalidToken
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, select
 
-from apps.api.app.auth.msal_store import decrypt_blob, encrypt_blob
+from apps.api.app.auth import msal_store
+from apps.api.app.auth.msal_migration import reencode_msal_cache
+from apps.api.app.auth.msal_store import (
+    DekCache,
+    decrypt_blob,
+    encrypt_blob,
+    is_legacy_envelope,
+    reencode_v1_envelope,
+)
 from apps.api.app.auth.routes import router
 from apps.api.app.auth.session import build_audit_record
+from apps.api.app.db.models import Base, MsalCache
+
+
+def legacy_v1_blob(payload: bytes) -> str:
+    dek_key = Fernet.generate_key()
+    master = Fernet(os.environ["APP_MASTER_KEY"].encode("utf-8"))
+    return json.dumps(
+        {
+            "v": 1,
+            "alg": "fernet-envelope",
+            "edk": base64.urlsafe_b64encode(master.encrypt(dek_key)).decode("ascii"),
+            "ct": base64.urlsafe_b64encode(Fernet(dek_key).encrypt(payload)).decode("ascii"),
+        }
+    )
 
 
 def test_msal_blob_roundtrip_encryption(monkeypatch):
@@ -19,6 +47,71 @@ def test_msal_blob_roundtrip_encryption(monkeypatch):
     assert decrypt_blob(encrypted) == payload
 
 
+def test_msal_decrypt_reuses_cached_dek_until_master_key_rotates(monkeypatch):
+    monkeypatch.setenv("APP_MASTER_KEY", Fernet.generate_key().decode("utf-8"))
+    msal_store.invalidate_key_caches()
+    encrypted = encrypt_blob(b"cached")
+
+    assert decrypt_blob(encrypted) == b"cached"
+    assert len(msal_store._dek_cache) == 1
+    assert decrypt_blob(encrypted) == b"cached"
+
+    monkeypatch.setenv("APP_MASTER_KEY", Fernet.generate_key().decode("utf-8"))
+    with pytest.raises(InvalidToken):
+        decrypt_blob(encrypted)
+
+
+def test_v2_envelope_is_smaller_and_v1_still_decrypts(monkeypatch):
+    monkeypatch.setenv("APP_MASTER_KEY", Fernet.generate_key().decode("utf-8"))
+    payload = b"x" * 4096
+    legacy = legacy_v1_blob(payload)
+
+    current = encrypt_blob(payload)
+
+    assert not is_legacy_envelope(current)
+    assert len(current) < len(legacy) * 0.8
+    assert decrypt_blob(legacy) == payload
+    assert decrypt_blob(reencode_v1_envelope(legacy)) == payload
+
+
+def test_reencode_migration_converts_legacy_rows(monkeypatch):
+    monkeypatch.setenv("APP_MASTER_KEY", Fernet.generate_key().decode("utf-8"))
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(MsalCache),
+            [
+                {
+                    "user_id": "u",
+                    "cache_key": f"k{index}",
+                    "encrypted_blob": legacy_v1_blob(b"t%d" % index).encode("utf-8"),
+                }
+                for index in range(5)
+            ]
+            + [{"user_id": "u", "cache_key": "k-new", "encrypted_blob": encrypt_blob(b"new")}],
+        )
+
+    assert reencode_msal_cache(engine, batch_size=2) == 5
+
+    with engine.connect() as connection:
+        blobs = connection.execute(select(MsalCache.encrypted_blob).order_by(MsalCache.id)).scalars()
+        assert [decrypt_blob(blob) for blob in blobs] == [b"t0", b"t1", b"t2", b"t3", b"t4", b"new"]
+
+
+def test_dek_cache_is_bounded_and_expires():
+    now = [0.0]
+    cache = DekCache(max_entries=2, ttl_seconds=10.0, clock=lambda: now[0])
+    fernets = [Fernet(Fernet.generate_key()) for _ in range(3)]
+    for index, fernet in enumerate(fernets):
+        cache.put(f"edk-{index}", fernet)
+
+    assert cache.get("edk-0") is None
+    assert cache.get("edk-2") is fernets[2]
+    now[0] = 11.0
+    assert cache.get("edk-2") is None
+
+
 def test_login_sets_secure_cookie_flags():
     app = FastAPI()
     app.include_router(router)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from apps.api.app.auth.authorization import (
+    Authorizer,
+    DecisionCache,
+    SessionDecisions,
+    SessionRoles,
+    get_session_decisions,
+    require_action,
+)
+from packages.policy.policy import PolicyEngine
+
+
+def make_authorizer(roles: dict[str, SessionRoles], **cache_options) -> Authorizer:
+    policy = PolicyEngine({"viewer": {"threads.read"}, "editor": {"threads.*"}})
+    return Authorizer(policy, roles.get, cache=DecisionCache(**cache_options))
+
+
+def test_repeated_checks_are_served_from_cache():
+    authorizer = make_authorizer({"s-1": SessionRoles(frozenset({"viewer"}))})
+
+    assert authorizer.is_allowed("s-1", "threads.read")
+    assert authorizer.is_allowed("s-1", "threads.read")
+    assert authorizer.check_many("s-1", ["threads.read", "threads.write"]) == [True, False]
+    assert not authorizer.is_allowed("missing", "threads.read")
+
+    stats = authorizer.cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
+
+
+def test_role_version_and_policy_version_invalidate_decisions():
+    roles = {"s-1": SessionRoles(frozenset({"viewer"}), version=1)}
+    authorizer = make_authorizer(roles)
+    assert not authorizer.is_allowed("s-1", "threads.write")
+
+    roles["s-1"] = SessionRoles(frozenset({"editor"}), version=2)
+    assert authorizer.is_allowed("s-1", "threads.write")
+
+    authorizer.replace_policy(PolicyEngine({"editor": {"threads.read"}}))
+    assert len(authorizer.cache) == 0
+    assert authorizer.cache.version == 1
+    assert not authorizer.is_allowed("s-1", "threads.write")
+
+
+def test_decisions_expire_after_ttl():
+    now = [0.0]
+    authorizer = make_authorizer(
+        {"s-1": SessionRoles(frozenset({"viewer"}))}, ttl_seconds=5, clock=lambda: now[0]
+    )
+    authorizer.is_allowed("s-1", "threads.read")
+    now[0] = 6.0
+    authorizer.is_allowed("s-1", "threads.read")
+
+    assert authorizer.cache.stats().hits == 0
+
+
+def test_dependencies_use_the_request_session():
+    app = FastAPI()
+    app.state.authorizer = make_authorizer({"s-1": SessionRoles(frozenset({"viewer"}))})
+
+    @app.get("/threads", dependencies=[Depends(require_action("threads.read"))])
+    def list_threads(decisions: SessionDecisions = Depends(get_session_decisions)):
+        return {"can_write": decisions.allowed("threads.write")}
+
+    client = TestClient(app)
+    assert client.get("/threads").status_code == 403
+    client.cookies.set("session_id", "s-1")
+    assert client.get("/threads").json() == {"can_write": False}
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import copy
+import json
+import unittest
+from typing import Any
+from unittest import mock
+
+from apps.api.app.threads.service import persist_planner_body
+from packages.schemas import ingest
+from packages.schemas.columnar import ActionCardColumns, TimelineEventColumns
+from packages.schemas.ingest import decode_planner_bundle
+from packages.schemas.validator import (
+    BundleValidationError,
+    SchemaValidationError,
+    check_planner_bundle,
+)
+from tests.test_bundle_integrity import bundle, card, event
+
+
+def encode(payload: Any) -> bytes:
+    return json.dumps(payload).encode()
+
+
+def issues_of(body: bytes) -> list[tuple[str, int | None, str, str]]:
+    try:
+        decode_planner_bundle(body)
+    except BundleValidationError as error:
+        return [(i.artifact, i.index, i.path, i.message) for i in error.issues]
+    return []
+
+
+class FakeRepository:
+    def __init__(self) -> None:
+        self.saved: dict[str, Any] | None = None
+
+    def save_planner_outputs(self, **sections: Any) -> None:
+        self.saved = sections
+
+
+class FakeColumnarRepository(FakeRepository):
+    accepts_columns = True
+
+
+class DecodePlannerBundleTests(unittest.TestCase):
+    def paths(self) -> list[Any]:
+        """Run a test body with the typed decoder and again on the plain path."""
+        return [
+            mock.patch.object(ingest, "_typed_decoder", ingest._typed_decoder),
+            mock.patch.object(ingest, "_typed_decoder", None),
+        ]
+
+    def test_packaged_schemas_compile_to_a_typed_decoder(self) -> None:
+        decoder = ingest._typed_decoder.get()
+
+        self.assertIsNotNone(decoder)
+        self.assertIs(ingest._typed_decoder.get(), decoder)
+
+    def test_valid_bundle_round_trips_from_a_memoryview(self) -> None:
+        payload = bundle(
+            [card("ac_1"), {**card("ac_2"), "owner": "planner", "metadata": {"confidence": 1}}],
+            [event("e_1", action_card_id="ac_2", details={"pass_index": 0})],
+        )
+        payload["skill_registry"]["skills"] = [
+            {"name": "search", "version": "1.2.0", "enabled": True, "tags": ["web"]}
+        ]
+        for patch in self.paths():
+            with self.subTest(patch=patch), patch:
+                decoded = decode_planner_bundle(memoryview(encode(payload)))
+                self.assertEqual(decoded, payload)
+                self.assertIs(type(decoded["action_cards"][1]["metadata"]["confidence"]), int)
+
+    def test_violations_match_the_validator(self) -> None:
+        payload = bundle([card("ac_1"), card("ac_2"), card("ac_3")], [event("e_1"), event("e_2")])
+        invalid = copy.deepcopy(payload)
+        invalid["action_cards"][0]["priority"] = True
+        invalid["action_cards"][1]["kind"] = "epic"
+        invalid["action_cards"][2]["metadata"] = {"confidence": 1.5}
+        invalid["timeline_events"][0]["occurred_at"] = "yesterday"
+        invalid["timeline_events"][1]["details"] = {"latency_ms": 1.0, "extra": 1}
+        invalid["thread_pass"]["pass_index"] = -1
+        del invalid["skill_registry"]["generated_at"]
+        expected = [
+            (i.artifact, i.index, i.path, i.message) for i in check_planner_bundle(**invalid)
+        ]
+
+        self.assertEqual(len(expected), 7)
+        for patch in self.paths():
+            with self.subTest(patch=patch), patch:
+                self.assertEqual(issues_of(encode(invalid)), expected)
+
+    def test_dangling_references_are_rejected(self) -> None:
+        payload = bundle([card("ac_1")], [event("e_1", action_card_id="ac_9")])
+        for patch in self.paths():
+            with self.subTest(patch=patch), patch:
+                self.assertEqual(
+                    issues_of(encode(payload)),
+                    [("timeline_events", 0, "<root>.action_card_id", "unknown action card 'ac_9'")],
+                )
+
+    def test_malformed_and_incomplete_bodies(self) -> None:
+        payload = bundle([], [])
+        del payload["action_cards"]
+        payload["notes"] = []
+        for patch in self.paths():
+            with self.subTest(patch=patch), patch:
+                for body in (b"{", b"[]"):
+                    with self.assertRaisesRegex(SchemaValidationError, "malformed planner bundle"):
+                        decode_planner_bundle(body)
+                self.assertEqual(
+                    issues_of(encode(payload)),
+                    [
+                        ("notes", None, "<root>", "unknown section"),
+                        ("action_cards", None, "<root>", "missing required section"),
+                    ],
+                )
+                self.assertEqual(
+                    issues_of(
+                        encode(bundle([], [])).replace(b'"action_cards": []', b'"action_cards": {}')
+                    ),
+                    [("action_cards", None, "<root>", "expected array")],
+                )
+
+    def test_persist_planner_body_saves_only_valid_bundles(self) -> None:
+        payload = bundle([card("ac_1")], [event("e_1")])
+        repository = FakeRepository()
+
+        persist_planner_body(repository, memoryview(encode(payload)))
+        self.assertEqual(repository.saved, payload)
+
+        repository.saved = None
+        payload["action_cards"][0]["status"] = "unknown"
+        with self.assertRaises(BundleValidationError):
+            persist_planner_body(repository, encode(payload))
+        self.assertIsNone(repository.saved)
+
+    def test_persist_planner_body_passes_columns_only_to_repositories_that_accept_them(
+        self,
+    ) -> None:
+        payload = bundle([card("ac_1")], [event("e_1")])
+        repository = FakeColumnarRepository()
+
+        persist_planner_body(repository, encode(payload))
+        assert repository.saved is not None
+        saved = dict(repository.saved)
+        self.assertIsInstance(saved["action_cards"], ActionCardColumns)
+        self.assertIsInstance(saved["timeline_events"], TimelineEventColumns)
+        for section in ("action_cards", "timeline_events"):
+            saved[section] = saved[section].to_payloads()
+        self.assertEqual(saved, payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import io
+import json
+import unittest
+from typing import Any
+
+from packages.schemas.integrity import check_references
+from packages.schemas.streaming import iter_planner_bundle
+from packages.schemas.validator import BundleValidationError, check_planner_bundle
+
+
+def card(card_id: str) -> dict[str, Any]:
+    return {
+        "card_id": card_id,
+        "title": "Card",
+        "kind": "task",
+        "status": "todo",
+        "priority": 1,
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+
+def event(event_id: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "event_id": event_id,
+        "event_type": "planner_passed",
+        "occurred_at": "2025-01-01T00:00:00Z",
+        "message": "passed",
+        **extra,
+    }
+
+
+def bundle(
+    cards: list[dict[str, Any]],
+    events: list[dict[str, Any]],
+    *,
+    card_ids: list[str] | None = None,
+    event_ids: list[str] | None = None,
+    registry_id: str = "sr_1",
+) -> dict[str, Any]:
+    return {
+        "thread_pass": {
+            "thread_id": "t_1",
+            "pass_id": "p_1",
+            "pass_index": 0,
+            "created_at": "2025-01-01T00:00:00Z",
+            "planner_summary": "summary",
+            "action_card_ids": [c["card_id"] for c in cards] if card_ids is None else card_ids,
+            "timeline_event_ids": [e["event_id"] for e in events]
+            if event_ids is None
+            else event_ids,
+            "skill_registry_id": registry_id,
+        },
+        "action_cards": cards,
+        "skill_registry": {
+            "registry_id": "sr_1",
+            "generated_at": "2025-01-01T00:00:00Z",
+            "skills": [],
+        },
+        "timeline_events": events,
+    }
+
+
+class ReferenceIntegrityTests(unittest.TestCase):
+    def test_consistent_bundle_has_no_issues(self) -> None:
+        payload = bundle([card("ac_1"), card("ac_2")], [event("e_1", action_card_id="ac_2")])
+
+        self.assertEqual(check_references(**payload), [])
+        self.assertEqual(check_planner_bundle(**payload), [])
+
+    def test_every_duplicate_and_dangling_reference_is_reported(self) -> None:
+        payload = bundle(
+            [card("ac_1"), card("ac_1"), card("ac_2")],
+            [event("e_1"), event("e_1", action_card_id="ac_9")],
+            card_ids=["ac_1", "ac_3", "ac_4"],
+            event_ids=["e_1", "e_2"],
+            registry_id="sr_2",
+        )
+
+        issues = [
+            (issue.artifact, issue.index, issue.path, issue.message)
+            for issue in check_references(**payload)
+        ]
+
+        self.assertEqual(
+            issues,
+            [
+                (
+                    "action_cards",
+                    1,
+                    "<root>.card_id",
+                    "duplicate card_id 'ac_1' (first at index 0)",
+                ),
+                (
+                    "timeline_events",
+                    1,
+                    "<root>.event_id",
+                    "duplicate event_id 'e_1' (first at index 0)",
+                ),
+                ("thread_pass", None, "<root>.action_card_ids[1]", "unknown action card 'ac_3'"),
+                ("thread_pass", None, "<root>.action_card_ids[2]", "unknown action card 'ac_4'"),
+                (
+                    "thread_pass",
+                    None,
+                    "<root>.timeline_event_ids[1]",
+                    "unknown timeline event 'e_2'",
+                ),
+                (
+                    "thread_pass",
+                    None,
+                    "<root>.skill_registry_id",
+                    "'sr_2' does not match skill_registry.registry_id 'sr_1'",
+                ),
+                ("timeline_events", 1, "<root>.action_card_id", "unknown action card 'ac_9'"),
+            ],
+        )
+
+    def test_schema_issues_precede_reference_issues(self) -> None:
+        payload = bundle([card("ac_1"), {"title": "no id"}], [], card_ids=["ac_1", "ac_2"])
+
+        issues = check_planner_bundle(**payload)
+
+        self.assertEqual([issue.artifact for issue in issues], ["action_cards", "thread_pass"])
+        self.assertEqual(issues[1].message, "unknown action card 'ac_2'")
+
+    def test_streaming_reports_references_after_the_last_item(self) -> None:
+        payload = bundle([card("ac_1")], [event("e_1", action_card_id="ac_2")])
+        raw = json.dumps(
+            {key: payload[key] for key in ("timeline_events", "thread_pass", "action_cards")}
+            | {"skill_registry": payload["skill_registry"]}
+        ).encode()
+
+        with self.assertRaises(BundleValidationError) as caught:
+            list(iter_planner_bundle(io.BytesIO(raw), read_size=7))
+
+        self.assertEqual(
+            [(issue.artifact, issue.index, issue.path) for issue in caught.exception.issues],
+            [("timeline_events", 0, "<root>.action_card_id")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
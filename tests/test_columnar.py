@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import unittest
+
+from sqlalchemy import create_engine, select
+
+from apps.api.app.db.models import Base, PlannerActionCard, PlannerTimelineEvent
+from apps.api.app.threads.repository import SqlAlchemyPlannerOutputRepository
+from packages.schemas.columnar import (
+    ActionCard,
+    ActionCardColumns,
+    TimelineEvent,
+    TimelineEventColumns,
+)
+from tests.test_bundle_integrity import bundle, card, event
+
+
+def cards() -> list[dict[str, object]]:
+    return [
+        card("ac_1"),
+        {**card("ac_2"), "kind": "risk", "owner": "planner", "metadata": {"confidence": 0.5}},
+        {**card("ac_3"), "title": "Überprüfen ✓", "status": "done", "priority": 5},
+    ]
+
+
+def events() -> list[dict[str, object]]:
+    return [
+        event("e_1"),
+        event("e_2", actor="bot", action_card_id="ac_2", details={"pass_index": 1}),
+        {**event("e_3"), "event_type": "planner_failed", "message": "多字节"},
+    ]
+
+
+class ColumnarTests(unittest.TestCase):
+    def test_items_round_trip(self) -> None:
+        for columns_type, payloads in (
+            (ActionCardColumns, cards()),
+            (TimelineEventColumns, events()),
+        ):
+            with self.subTest(columns_type=columns_type.__name__):
+                columns = columns_type(payloads)
+
+                self.assertEqual(len(columns), 3)
+                self.assertEqual(columns.to_payloads(), payloads)
+                self.assertEqual(columns[-1].to_payload(), payloads[-1])
+                with self.assertRaises(IndexError):
+                    columns[3]
+
+    def test_records_and_stored_columns(self) -> None:
+        action_cards = ActionCardColumns(cards())
+        timeline_events = TimelineEventColumns(events())
+
+        record = action_cards[1]
+        self.assertIsInstance(record, ActionCard)
+        self.assertEqual((record.kind, record.owner), ("risk", "planner"))
+        self.assertEqual(record.metadata, {"confidence": 0.5})
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertIsInstance(next(iter(timeline_events)), TimelineEvent)
+        self.assertEqual(list(action_cards.values("priority")), [1, 1, 5])
+        self.assertEqual(
+            list(timeline_events.iter_columns("actor", "details")),
+            [(None, None), ("bot", '{"pass_index":1}'), (None, None)],
+        )
+
+    def test_unknown_property_is_rejected(self) -> None:
+        columns = TimelineEventColumns()
+
+        with self.assertRaisesRegex(ValueError, "'severity' has no column"):
+            columns.append({**event("e_1"), "severity": "high"})
+        self.assertEqual(len(columns), 0)
+
+    def test_repository_writes_the_same_rows_from_columns(self) -> None:
+        payload = bundle(cards(), events())
+        columnar = {
+            **payload,
+            "action_cards": ActionCardColumns(payload["action_cards"]),
+            "timeline_events": TimelineEventColumns(payload["timeline_events"]),
+        }
+        rows = []
+        for sections in (payload, columnar):
+            engine = create_engine("sqlite://")
+            Base.metadata.create_all(engine)
+            SqlAlchemyPlannerOutputRepository(engine, chunk_size=2).save_planner_outputs(
+                **sections  # type: ignore[arg-type]
+            )
+            with engine.connect() as connection:
+                rows.append(
+                    [
+                        connection.execute(select(model.__table__)).all()
+                        for model in (PlannerActionCard, PlannerTimelineEvent)
+                    ]
+                )
+
+        self.assertEqual(len(rows[0][1]), 3)
+        self.assertEqual(rows[0], rows[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
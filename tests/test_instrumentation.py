@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from packages.instrumentation import REGISTRY, MetricsRegistry, Trace, TraceMiddleware, span, trace
+from packages.schemas.validator import SchemaValidationError, validate_payload
+
+
+@pytest.fixture
+def metrics():
+    REGISTRY.reset()
+    REGISTRY.enabled = True
+    yield REGISTRY
+    REGISTRY.enabled = False
+    REGISTRY.reset()
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry()
+    hits = registry.counter("hits_total", "Hits.")
+    latency = registry.histogram("latency_seconds", "Latency.")
+
+    hits.inc(route="/")
+    latency.observe(0.5)
+    with latency.time():
+        pass
+
+    assert hits.value(route="/") == 0
+    assert latency.count() == 0
+
+
+def test_prometheus_text_snapshot():
+    registry = MetricsRegistry(enabled=True)
+    hits = registry.counter("hits_total", "Hits.")
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    hits.inc(route='/a"b')
+    hits.inc(2, route='/a"b')
+    latency.observe(0.1, op="read")
+    latency.observe(3.0, op="read")
+
+    assert registry.prometheus_text() == (
+        "# HELP hits_total Hits.\n"
+        "# TYPE hits_total counter\n"
+        'hits_total{route="/a\\"b"} 3.0\n'
+        "# HELP latency_seconds Latency.\n"
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{op="read",le="0.1"} 1\n'
+        'latency_seconds_bucket{op="read",le="1.0"} 1\n'
+        'latency_seconds_bucket{op="read",le="+Inf"} 2\n'
+        'latency_seconds_sum{op="read"} 3.1\n'
+        'latency_seconds_count{op="read"} 2\n'
+    )
+
+
+def test_redeclaring_a_metric_returns_it_unless_the_type_differs():
+    registry = MetricsRegistry()
+    assert registry.counter("x", "X.") is registry.counter("x", "X.")
+    with pytest.raises(ValueError):
+        registry.histogram("x", "X.")
+
+
+def test_validation_records_timings_and_folded_violation_paths(metrics):
+    registry = {
+        "registry_id": "sr_1",
+        "generated_at": "2025-01-01T00:00:00Z",
+        "skills": [{"name": "a", "version": "one", "enabled": True}],
+    }
+    with pytest.raises(SchemaValidationError):
+        validate_payload("skill_registry", registry)
+
+    assert metrics.get("schema_validation_seconds").count(schema="skill_registry") == 1
+    violations = metrics.get("schema_violations_total")
+    assert violations.value(schema="skill_registry", path="<root>.skills[].version") == 1
+    assert 'schema_validated_payloads_total{schema="skill_registry"} 1.0' in (
+        metrics.prometheus_text()
+    )
+
+
+def test_trace_collects_nested_spans_without_enabling_metrics():
+    with trace("request") as active:
+        with span("outer", kind="test"):
+            with span("inner"):
+                pass
+        with pytest.raises(SchemaValidationError):
+            validate_payload("skill_registry", {})
+
+    assert [(s.name, s.depth) for s in active.spans] == [
+        ("inner", 1),
+        ("outer", 0),
+        ("schema_validation_seconds", 0),
+    ]
+    assert active.spans[1].attributes == (("kind", "test"),)
+    assert REGISTRY.get("schema_validation_seconds").count(schema="skill_registry") == 0
+
+
+def test_trace_middleware_reports_server_timing():
+    traces: list[Trace] = []
+    app = FastAPI()
+
+    @app.get("/work")
+    def work() -> dict[str, bool]:
+        with span("work"):
+            return {"ok": True}
+
+    app.add_middleware(TraceMiddleware, sink=traces.append, server_timing=True)
+    response = TestClient(app).get("/work")
+
+    assert response.headers["server-timing"].startswith("work;dur=")
+    assert [t.name for t in traces] == ["GET /work"]
+    assert traces[0].duration > 0
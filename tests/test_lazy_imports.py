@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import unittest
+
+import packages.schemas
+
+
+def loaded_after_import(module: str, *candidates: str) -> list[str]:
+    """Which of ``candidates`` a fresh interpreter has loaded after importing ``module``."""
+    code = (
+        f"import sys, {module}; print(' '.join(sorted(set({candidates!r}) & sys.modules.keys())))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return completed.stdout.split()
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_heavy_dependencies_are_not_loaded_on_import(self) -> None:
+        for module, deferred in (
+            ("packages.schemas", ("msgspec", "packages.schemas.validator")),
+            ("packages.schemas.ingest", ("msgspec",)),
+            ("apps.api.app.auth.msal_store", ("cryptography",)),
+            ("apps.api.app.auth.routes", ("sqlalchemy", "apps.api.app.db.models")),
+        ):
+            with self.subTest(module=module):
+                self.assertEqual(loaded_after_import(module, *deferred), [])
+
+    def test_package_exports_resolve_on_first_access(self) -> None:
+        from packages.schemas.validator import validate_payload
+
+        self.assertIs(packages.schemas.validate_payload, validate_payload)
+        self.assertLessEqual(set(packages.schemas.__all__), set(dir(packages.schemas)))
+        with self.assertRaisesRegex(AttributeError, "no attribute 'missing'"):
+            packages.schemas.missing  # noqa: B018
+
+
+if __name__ == "__main__":
+    unittest.main()
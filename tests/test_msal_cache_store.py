@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+from cryptography.fernet import Fernet
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+
+from apps.api.app.auth.msal_cache_store import MsalTokenCacheStore
+from apps.api.app.db.models import Base
+
+
+class FakeTokenCache:
+    def __init__(self) -> None:
+        self.tokens: dict[str, str] = {}
+        self.has_state_changed = False
+
+    def add(self, scope: str, token: str) -> None:
+        self.tokens[scope] = token
+        self.has_state_changed = True
+
+    def serialize(self) -> str:
+        self.has_state_changed = False
+        return json.dumps(self.tokens)
+
+    def deserialize(self, state: str | None) -> None:
+        self.tokens = json.loads(state) if state else {}
+        self.has_state_changed = False
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setenv("APP_MASTER_KEY", Fernet.generate_key().decode("utf-8"))
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def make_store(engine, now, **kwargs) -> MsalTokenCacheStore:
+    return MsalTokenCacheStore(
+        engine, cache_factory=FakeTokenCache, clock=lambda: now[0], **kwargs
+    )
+
+
+def test_burst_of_changes_is_written_once_and_read_back(engine):
+    now = [0.0]
+    store = make_store(engine, now, coalesce_window=1.0)
+
+    cache = store.load("u1", "k1")
+    for index in range(5):
+        cache.add(f"scope{index}", f"token{index}")  # type: ignore[attr-defined]
+        store.save("k1")
+    now[0] = 2.0
+    assert store.flush(due_only=True) == 1
+
+    assert store.stats.writes == 1 and store.stats.coalesced == 4
+    fresh = make_store(engine, now).load("u1", "k1")
+    assert fresh.tokens["scope4"] == "token4"  # type: ignore[attr-defined]
+
+
+def test_unchanged_cache_is_served_from_lru_without_writes(engine):
+    now = [0.0]
+    store = make_store(engine, now, coalesce_window=0.0)
+    store.load("u1", "k1").add("s", "t")  # type: ignore[attr-defined]
+    store.save("k1")
+
+    for _ in range(3):
+        store.load("u1", "k1")
+        store.save("k1")
+
+    assert store.stats.misses == 1 and store.stats.hits == 3
+    assert store.stats.writes == 1
+
+
+def test_concurrent_writer_wins_and_entry_is_reloaded(engine):
+    now = [0.0]
+    process_a = make_store(engine, now, coalesce_window=0.0)
+    process_b = make_store(engine, now, coalesce_window=0.0)
+    process_a.load("u1", "k1").add("s", "t1")  # type: ignore[attr-defined]
+    process_a.save("k1")
+    process_b.load("u1", "k1").add("s", "from-b")  # type: ignore[attr-defined]
+    process_b.save("k1")
+
+    process_a.load("u1", "k1").add("s", "stale")  # type: ignore[attr-defined]
+    process_a.save("k1")
+
+    assert process_a.stats.conflicts == 1
+    assert process_a.load("u1", "k1").tokens["s"] == "from-b"  # type: ignore[attr-defined]
+
+
+class FlakyEngine:
+    """Delegates to ``engine`` but fails the first ``failures`` transactions."""
+
+    def __init__(self, engine, failures: int) -> None:
+        self.engine = engine
+        self.failures = failures
+
+    def connect(self):
+        return self.engine.connect()
+
+    def begin(self):
+        if self.failures:
+            self.failures -= 1
+            raise OperationalError("UPDATE msal_cache", {}, Exception("connection dropped"))
+        return self.engine.begin()
+
+
+def test_failed_write_keeps_changes_pending(engine):
+    now = [0.0]
+    store = make_store(FlakyEngine(engine, failures=1), now, coalesce_window=0.0)
+    store.load("u1", "k1").add("s", "t")  # type: ignore[attr-defined]
+
+    with pytest.raises(OperationalError):
+        store.save("k1")
+    assert store.flush() == 1
+
+    assert make_store(engine, now).load("u1", "k1").tokens == {"s": "t"}  # type: ignore[attr-defined]
+
+
+def test_miss_on_one_key_does_not_block_other_keys(engine, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'msal.db'}")
+    Base.metadata.create_all(engine)
+    entered, release = threading.Event(), threading.Event()
+    blocking = [False]
+
+    def cache_factory() -> FakeTokenCache:
+        if blocking[0]:
+            entered.set()
+            release.wait(5)
+        return FakeTokenCache()
+
+    store = MsalTokenCacheStore(engine, cache_factory=cache_factory)
+    warm = store.load("u1", "k2")
+    blocking[0] = True
+    slow = threading.Thread(target=store.load, args=("u1", "k1"))
+    slow.start()
+    assert entered.wait(5)
+
+    served: list[object] = []
+    hit = threading.Thread(target=lambda: served.append(store.load("u1", "k2")))
+    hit.start()
+    hit.join(1)
+    release.set()
+    slow.join()
+
+    assert served == [warm]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import unittest
+
+from sqlalchemy import create_engine, func, select
+
+from apps.api.app.db.models import (
+    Base,
+    PlannerActionCard,
+    PlannerSkillRegistry,
+    PlannerThreadPass,
+    PlannerTimelineEvent,
+)
+from apps.api.app.threads.repository import SqlAlchemyPlannerOutputRepository
+from apps.api.app.threads.service import (
+    persist_planner_outputs,
+    persist_planner_outputs_async,
+    persist_planner_stream,
+)
+from packages.schemas.validator import BundleValidationError
+from tests.test_thread_service import valid_bundle
+
+
+def bundle_with_events(count: int) -> dict[str, object]:
+    bundle = valid_bundle()
+    template = bundle["timeline_events"][0]  # type: ignore[index]
+    bundle["timeline_events"] = [{**template, "event_id": f"e_{index}"} for index in range(count)]
+    return bundle
+
+
+class PlannerRepositoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+
+    def count(self, model: type[Base]) -> int:
+        with self.engine.connect() as connection:
+            return connection.execute(select(func.count()).select_from(model)).scalar_one()
+
+    def test_save_writes_all_rows_in_chunks(self) -> None:
+        repository = SqlAlchemyPlannerOutputRepository(self.engine, chunk_size=3)
+
+        persist_planner_outputs(repository, **bundle_with_events(10))  # type: ignore[arg-type]
+
+        self.assertEqual(self.count(PlannerThreadPass), 1)
+        self.assertEqual(self.count(PlannerSkillRegistry), 1)
+        self.assertEqual(self.count(PlannerActionCard), 1)
+        self.assertEqual(self.count(PlannerTimelineEvent), 10)
+
+    def test_failed_pass_writes_nothing(self) -> None:
+        repository = SqlAlchemyPlannerOutputRepository(self.engine, chunk_size=2)
+        bundle = bundle_with_events(5)
+        bundle["timeline_events"][4]["occurred_at"] = None  # type: ignore[index]
+
+        with self.assertRaises(TypeError):
+            repository.save_planner_outputs(**bundle)  # type: ignore[arg-type]
+
+        self.assertEqual(self.count(PlannerThreadPass), 0)
+        self.assertEqual(self.count(PlannerTimelineEvent), 0)
+
+    def test_accepted_timestamps_are_stored_and_the_rest_rejected_before_writing(self) -> None:
+        repository = SqlAlchemyPlannerOutputRepository(self.engine)
+        bundle = valid_bundle()
+        bundle["thread_pass"]["created_at"] = "2024-02-29T23:59:59.123456-08:30"  # type: ignore[index]
+
+        persist_planner_outputs(repository, **bundle)  # type: ignore[arg-type]
+        self.assertEqual(self.count(PlannerThreadPass), 1)
+
+        for created_at in ("2025-01-01t00:00:00z", "2025-06-30T23:59:60Z"):
+            with self.subTest(created_at=created_at):
+                bundle = valid_bundle()
+                bundle["thread_pass"]["pass_id"] = "p_2"  # type: ignore[index]
+                bundle["thread_pass"]["created_at"] = created_at  # type: ignore[index]
+                with self.assertRaisesRegex(BundleValidationError, "invalid date-time"):
+                    persist_planner_outputs(repository, **bundle)  # type: ignore[arg-type]
+                self.assertEqual(self.count(PlannerThreadPass), 1)
+
+    def test_stream_with_thread_pass_last_links_rows_to_pass(self) -> None:
+        repository = SqlAlchemyPlannerOutputRepository(self.engine)
+        bundle = bundle_with_events(3)
+        reordered = {key: bundle[key] for key in reversed(list(bundle))}
+        stream = io.BytesIO(json.dumps(reordered).encode("utf-8"))
+
+        persist_planner_stream(repository, stream)
+
+        with self.engine.connect() as connection:
+            pass_ids = set(connection.execute(select(PlannerTimelineEvent.pass_id)).scalars())
+            pass_ids |= set(connection.execute(select(PlannerSkillRegistry.pass_id)).scalars())
+        self.assertEqual(pass_ids, {"p_1"})
+
+
+HAS_ASYNC_DRIVER = all(
+    importlib.util.find_spec(name) is not None for name in ("aiosqlite", "greenlet")
+)
+
+
+@unittest.skipUnless(HAS_ASYNC_DRIVER, "aiosqlite and greenlet are required")
+class AsyncPlannerRepositoryTests(unittest.IsolatedAsyncioTestCase):
+    async def test_async_pipeline_persists_bundle(self) -> None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        from apps.api.app.threads.async_repository import AsyncSqlAlchemyPlannerOutputRepository
+
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        repository = AsyncSqlAlchemyPlannerOutputRepository(engine, chunk_size=2)
+
+        await persist_planner_outputs_async(
+            repository, **bundle_with_events(5), chunk_size=2  # type: ignore[arg-type]
+        )
+
+        async with engine.connect() as connection:
+            count = await connection.scalar(select(func.count()).select_from(PlannerTimelineEvent))
+        await engine.dispose()
+        self.assertEqual(count, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
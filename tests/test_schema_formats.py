@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import unittest
+
+from packages.schemas.formats import format_checker, register_format
+from packages.schemas.validator import SchemaValidationError, compile_schema, validate_payload
+
+
+def check(name: str, value: str) -> bool:
+    checker = format_checker(name)
+    assert checker is not None
+    return checker(value)
+
+
+class FormatTests(unittest.TestCase):
+    def test_date_time_is_rfc_3339_as_parsed_by_fromisoformat(self) -> None:
+        for value in (
+            "2025-01-01T00:00:00Z",
+            "2025-01-01T00:00:00+00:00",
+            "2025-12-31T23:59:59.123456-08:30",
+            "2025-12-31T23:59:59.5Z",
+            "2024-02-29T12:00:00Z",
+            "2000-02-29T12:00:00Z",
+            "0001-01-01T00:00:00Z",
+        ):
+            with self.subTest(value=value):
+                self.assertTrue(check("date-time", value))
+        for value in (
+            "yesterday",
+            "2025-01-01",
+            "2025-01-01T00:00:00",
+            "2025-01-01t00:00:00z",
+            "2025-06-30T23:59:60Z",
+            "2025-01-01T00:00:00.1234567Z",
+            "2025-01-01 00:00:00Z",
+            "2025-13-01T00:00:00Z",
+            "2025-04-31T00:00:00Z",
+            "2025-02-29T00:00:00Z",
+            "1900-02-29T00:00:00Z",
+            "0000-01-01T00:00:00Z",
+            "2025-01-01T24:00:00Z",
+            "2025-01-01T00:00:00+24:00",
+            "２０２５-01-01T00:00:00Z",
+        ):
+            with self.subTest(value=value):
+                self.assertFalse(check("date-time", value))
+
+    def test_builtin_formats(self) -> None:
+        cases = {
+            "uuid": (
+                ["123e4567-e89b-12d3-a456-426614174000"],
+                ["123e4567e89b12d3a456426614174000"],
+            ),
+            "uri": (
+                ["https://example.com/a?b=c#d", "urn:isbn:0451450523", "mailto:a@b.c"],
+                ["example.com", "https://a b", "http://x/%zz"],
+            ),
+            "email": (
+                ["dev@example.com", "a.b+c@mail.example.org"],
+                ["dev@", "dev@example", "a b@c.d"],
+            ),
+            "semver": (
+                ["1.0.0", "0.1.2-rc.1+build.5", "10.20.30-alpha-beta"],
+                ["1", "1.0", "01.0.0", "1.0.0-01", "v1.0.0"],
+            ),
+        }
+        for name, (valid, invalid) in cases.items():
+            for value in valid:
+                with self.subTest(format=name, value=value):
+                    self.assertTrue(check(name, value))
+            for value in invalid:
+                with self.subTest(format=name, value=value):
+                    self.assertFalse(check(name, value))
+
+    def test_custom_format_is_memoized(self) -> None:
+        calls: list[str] = []
+
+        def is_ticket(value: str) -> bool:
+            calls.append(value)
+            return value.startswith("TKT-")
+
+        register_format("test-ticket", is_ticket)
+        validate = compile_schema({"type": "string", "format": "test-ticket"})
+
+        validate("TKT-1")
+        validate("TKT-1")
+        with self.assertRaisesRegex(SchemaValidationError, "invalid test-ticket format"):
+            validate("BUG-1")
+        self.assertEqual(calls, ["TKT-1", "BUG-1"])
+
+    def test_unknown_format_is_not_checked(self) -> None:
+        compile_schema({"type": "string", "format": "no-such-format"})("anything")
+
+    def test_skill_registry_v2_versions_must_be_semver(self) -> None:
+        payload = {
+            "registry_id": "sr_1",
+            "generated_at": "2025-01-01T00:00:00Z",
+            "skills": [{"name": "a", "version": "1.0", "enabled": True}],
+        }
+        with self.assertRaisesRegex(SchemaValidationError, r"skills\[0\]\.version"):
+            validate_payload("skill_registry", payload)
+        validate_payload("skill_registry", payload, version=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from typing import Any
+
+from packages.schemas.registry import SchemaRegistry
+from packages.schemas.validator import SchemaValidationError
+
+
+def write_schema(path: Path, schema: dict[str, Any], *, bump: int = 0) -> None:
+    path.write_text(json.dumps(schema), encoding="utf-8")
+    if bump:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+def note_schema(*required: str) -> dict[str, Any]:
+    return {
+        "type": "object",
+        "required": list(required),
+        "properties": {name: {"type": "string"} for name in required},
+    }
+
+
+class SchemaRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+        write_schema(self.directory / "note.v1.json", note_schema("title"))
+        write_schema(self.directory / "note.v2.json", note_schema("title", "body"))
+        (self.directory / "README.json").write_text("{}", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_discovers_versions_and_defaults_to_latest(self) -> None:
+        registry = SchemaRegistry(self.directory)
+
+        self.assertEqual(registry.names(), ["note"])
+        self.assertEqual(registry.versions("note"), [1, 2])
+        self.assertEqual(registry.latest_version("note"), 2)
+        registry.validate("note", {"title": "t"}, version=1)
+        with self.assertRaisesRegex(SchemaValidationError, "missing required property 'body'"):
+            registry.validate("note", {"title": "t"})
+        with self.assertRaises(FileNotFoundError):
+            registry.validator("note", version=3)
+
+    def test_refresh_swaps_changed_files_only(self) -> None:
+        registry = SchemaRegistry(self.directory)
+        v1 = registry.validator("note", 1)
+        self.assertFalse(registry.refresh())
+
+        write_schema(self.directory / "note.v2.json", note_schema("body"), bump=10**9)
+        write_schema(self.directory / "note.v3.json", note_schema("summary"))
+        self.assertTrue(registry.refresh())
+
+        self.assertIs(registry.validator("note", 1), v1)
+        registry.validate("note", {"body": "b"}, version=2)
+        self.assertEqual(registry.latest_version("note"), 3)
+
+        (self.directory / "note.v3.json").unlink()
+        self.assertTrue(registry.refresh())
+        self.assertEqual(registry.versions("note"), [1, 2])
+
+    def test_new_versions_do_not_change_the_default_until_promoted(self) -> None:
+        registry = SchemaRegistry(self.directory)
+        write_schema(self.directory / "note.v3.json", note_schema("summary"))
+        registry.refresh()
+
+        self.assertEqual(
+            (registry.latest_version("note"), registry.default_version("note")), (3, 2)
+        )
+        registry.validate("note", {"title": "t", "body": "b"})
+
+        registry.set_default_version("note", 3)
+        with self.assertRaisesRegex(SchemaValidationError, "missing required property 'summary'"):
+            registry.validate("note", {"title": "t", "body": "b"})
+        with self.assertRaises(FileNotFoundError):
+            registry.set_default_version("note", 4)
+
+        (self.directory / "note.v3.json").unlink()
+        registry.refresh()
+        self.assertEqual(registry.default_version("note"), 2)
+
+    def test_default_versions_can_be_pinned(self) -> None:
+        registry = SchemaRegistry(self.directory, default_versions={"note": 1})
+
+        self.assertEqual(registry.default_version("note"), 1)
+        registry.validate("note", {"title": "t"})
+
+    def test_broken_file_keeps_previous_version(self) -> None:
+        registry = SchemaRegistry(self.directory)
+        path = self.directory / "note.v2.json"
+        path.write_text("{not json", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with self.assertLogs("packages.schemas.registry", "ERROR"):
+            registry.refresh()
+        with self.assertRaises(SchemaValidationError):
+            registry.validate("note", {"title": "t"})
+
+    def test_watcher_picks_up_new_versions(self) -> None:
+        registry = SchemaRegistry(self.directory, poll_interval=0.01)
+        registry.watch()
+        try:
+            write_schema(self.directory / "note.v3.json", note_schema("summary"))
+            deadline = time.monotonic() + 2.0
+            while registry.latest_version("note") != 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            registry.close()
+
+        self.assertEqual(registry.latest_version("note"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
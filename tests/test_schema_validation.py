@@ -1,8 +1,53 @@
 from __future__ import annotations
 
+import io
+import json
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
 
-from packages.schemas.validator import SchemaValidationError, validate_payload
+from packages.schemas.streaming import iter_planner_bundle
+from packages.schemas.validator import (
+    BundleValidationError,
+    SchemaValidationError,
+    _load_schema,
+    _validate,
+    check_planner_bundle,
+    compile_schema,
+    validate_payload,
+    validate_planner_bundle,
+)
+
+
+def timeline_event(index: int) -> dict[str, Any]:
+    return {
+        "event_id": f"e_{index}",
+        "event_type": "planner_passed",
+        "occurred_at": "2025-01-01T00:00:00Z",
+        "message": f"event {index}",
+    }
+
+
+def bundle_with_events(events: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "thread_pass": {
+            "thread_id": "t_1",
+            "pass_id": "p_1",
+            "pass_index": 0,
+            "created_at": "2025-01-01T00:00:00Z",
+            "planner_summary": "summary",
+            "action_card_ids": [],
+            "timeline_event_ids": [event.get("event_id") for event in events],
+            "skill_registry_id": "sr_1",
+        },
+        "action_cards": [],
+        "skill_registry": {
+            "registry_id": "sr_1",
+            "generated_at": "2025-01-01T00:00:00Z",
+            "skills": [],
+        },
+        "timeline_events": events,
+    }
 
 
 class SchemaValidationTests(unittest.TestCase):
@@ -47,6 +92,124 @@ class SchemaValidationTests(unittest.TestCase):
                 },
             )
 
+    def test_error_reports_nested_path(self) -> None:
+        with self.assertRaisesRegex(
+            SchemaValidationError,
+            r"^validation failed at <root>\.metadata\.confidence: value greater than maximum 1$",
+        ):
+            validate_payload(
+                "action_card",
+                {
+                    "card_id": "ac_1",
+                    "title": "Draft plan",
+                    "kind": "task",
+                    "status": "todo",
+                    "priority": 2,
+                    "created_at": "2025-01-01T00:00:00Z",
+                    "metadata": {"confidence": 1.5},
+                },
+            )
+
+    def test_compiled_validator_matches_reference_interpreter(self) -> None:
+        skill_registry = {
+            "registry_id": "sr_1",
+            "generated_at": "2025-01-01T00:00:00Z",
+            "skills": [{"name": "a", "version": "1.0.0", "enabled": True, "tags": ["x"]}],
+        }
+        cases = [
+            skill_registry,
+            {**skill_registry, "generated_at": "yesterday"},
+            {**skill_registry, "skills": [{"name": "a", "version": "1", "enabled": 1}]},
+            {**skill_registry, "skills": [{"name": "", "version": "1", "enabled": True}]},
+            {
+                **skill_registry,
+                "skills": [{"name": "a", "version": "1", "enabled": True, "tags": [3]}],
+            },
+            {**skill_registry, "skills": "none"},
+            {"registry_id": "sr_1", "skills": [], "extra": True},
+            [],
+        ]
+        schema = _load_schema("skill_registry")
+        compiled = compile_schema(schema)
+
+        for payload in cases:
+            with self.subTest(payload=payload):
+                try:
+                    _validate(schema, payload)
+                except SchemaValidationError as exc:
+                    expected: str | None = str(exc)
+                else:
+                    expected = None
+
+                try:
+                    compiled(payload)
+                except SchemaValidationError as exc:
+                    actual: str | None = str(exc)
+                else:
+                    actual = None
+
+                self.assertEqual(actual, expected)
+
+
+class BundleValidationTests(unittest.TestCase):
+    def test_all_violations_are_reported_with_indexes(self) -> None:
+        events = [timeline_event(index) for index in range(5)]
+        events[1]["event_type"] = "unknown"
+        events[3]["occurred_at"] = "not-a-date"
+        bundle = bundle_with_events(events)
+        bundle["thread_pass"]["pass_index"] = -1
+
+        with self.assertRaises(BundleValidationError) as ctx:
+            validate_planner_bundle(**bundle)
+
+        issues = ctx.exception.issues
+        self.assertEqual(
+            [(issue.artifact, issue.index) for issue in issues],
+            [("thread_pass", None), ("timeline_events", 1), ("timeline_events", 3)],
+        )
+        self.assertEqual(issues[2].path, "<root>.occurred_at")
+        self.assertIn("(and 2 more violations)", str(ctx.exception))
+
+    def test_executor_mode_matches_serial_mode(self) -> None:
+        events = [timeline_event(index) for index in range(50)]
+        for index in (0, 17, 49):
+            events[index]["message"] = ""
+        bundle = bundle_with_events(events)
+
+        serial = check_planner_bundle(**bundle)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = check_planner_bundle(**bundle, executor=executor, chunk_size=8)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual([issue.index for issue in parallel], [0, 17, 49])
+
+
+class StreamingValidationTests(unittest.TestCase):
+    def test_tiny_reads_yield_same_items_as_json_loads(self) -> None:
+        bundle = bundle_with_events([timeline_event(index) for index in range(20)])
+        bundle["thread_pass"]["pass_index"] = 12345
+        raw = json.dumps(bundle).encode("utf-8")
+
+        items = list(iter_planner_bundle(io.BytesIO(raw), read_size=3))
+
+        events = [item for section, item in items if section == "timeline_events"]
+        self.assertEqual(events, bundle["timeline_events"])
+        self.assertIn(("thread_pass", bundle["thread_pass"]), items)
+
+    def test_missing_and_unknown_sections_are_reported(self) -> None:
+        bundle = bundle_with_events([])
+        del bundle["skill_registry"]
+        bundle["extra"] = 1
+        raw = json.dumps(bundle).encode("utf-8")
+
+        with self.assertRaises(BundleValidationError) as ctx:
+            list(iter_planner_bundle(io.BytesIO(raw)))
+
+        self.assertEqual(
+            [(issue.artifact, issue.message) for issue in ctx.exception.issues],
+            [("extra", "unknown section"), ("skill_registry", "missing required section")],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from apps.api.app.auth.routes import router
+from apps.api.app.auth.session import CookieConfig
+from apps.api.app.auth.session_store import (
+    InMemorySessionBackend,
+    SessionRecord,
+    SessionStore,
+    ShardedSessionBackend,
+    SqlSessionBackend,
+    require_session,
+)
+from apps.api.app.db.models import Base
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def sql_backend(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'sessions.db'}")
+    Base.metadata.create_all(engine)
+    return SqlSessionBackend(engine)
+
+
+BACKENDS = {
+    "memory": lambda tmp_path: InMemorySessionBackend(),
+    "sql": sql_backend,
+    "sharded": lambda tmp_path: ShardedSessionBackend([InMemorySessionBackend() for _ in range(4)]),
+}
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def backend(request, tmp_path):
+    return BACKENDS[request.param](tmp_path)
+
+
+def test_sliding_expiry_and_revocation(backend):
+    clock = Clock()
+    store = SessionStore(
+        backend, config=CookieConfig(session_max_age=100), touch_interval=10, clock=clock
+    )
+    record = store.create(user_id="u-1", roles=["viewer"])
+
+    clock.now += 5
+    assert store.validate(record.session_id).expires_at == record.expires_at
+    clock.now += 90
+    assert store.validate(record.session_id).expires_at == clock.now + 100
+    clock.now += 99
+    assert store.roles(record.session_id).roles == frozenset({"viewer"})
+
+    assert store.revoke(record.session_id)
+    assert store.validate(record.session_id) is None
+    assert not store.revoke(record.session_id)
+
+
+def test_sweep_removes_expired_sessions_in_batches(backend):
+    clock = Clock()
+    store = SessionStore(backend, config=CookieConfig(session_max_age=100), clock=clock)
+    expired = [store.create() for _ in range(25)]
+    clock.now += 50
+    live = store.create()
+    clock.now += 60
+
+    assert store.sweep(batch_size=10) == 25
+    assert store.sweep(batch_size=10) == 0
+    assert store.validate(live.session_id) is not None
+    assert all(backend.get(record.session_id) is None for record in expired)
+
+
+def test_expired_session_is_rejected_on_lookup():
+    clock = Clock()
+    backend = InMemorySessionBackend()
+    backend.add(SessionRecord("old", None, frozenset(), created_at=0, expires_at=clock.now))
+
+    assert SessionStore(backend, clock=clock).validate("old") is None
+    assert len(backend) == 0
+
+
+def test_login_and_logout_use_the_app_session_store():
+    app = FastAPI()
+    app.include_router(router)
+    app.state.session_store = SessionStore()
+
+    @app.get("/me")
+    def me(session: SessionRecord = Depends(require_session)):
+        return {"session_id": session.session_id}
+
+    client = TestClient(app, base_url="https://testserver")
+    csrf_token = client.post("/auth/login").json()["csrf_token"]
+    session_id = client.cookies.get("session_id")
+    assert client.get("/me").json() == {"session_id": session_id}
+
+    client.post("/auth/logout", headers={"X-CSRF-Token": csrf_token})
+    client.cookies.set("session_id", session_id)
+    assert client.get("/me").status_code == 401
+
+
+def test_sliding_expiry_reissues_the_cookies():
+    clock = Clock()
+    app = FastAPI()
+    app.include_router(router)
+    app.state.session_store = SessionStore(
+        config=CookieConfig(session_max_age=100), touch_interval=10, clock=clock
+    )
+
+    @app.get("/me")
+    def me(session: SessionRecord = Depends(require_session)):
+        return {"session_id": session.session_id}
+
+    client = TestClient(app, base_url="https://testserver")
+    assert "Max-Age=100" in client.post("/auth/login").headers["set-cookie"]
+    csrf_token = client.cookies.get("csrf_token")
+
+    clock.now += 5
+    assert "set-cookie" not in client.get("/me").headers
+    clock.now += 90
+    cookies = client.get("/me").headers.get_list("set-cookie")
+
+    assert [cookie.split(";")[0].split("=")[0] for cookie in cookies] == [
+        "session_id",
+        "csrf_token",
+    ]
+    assert all("Max-Age=100" in cookie for cookie in cookies)
+    assert client.cookies.get("csrf_token") == csrf_token
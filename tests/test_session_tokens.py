@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import base64
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from apps.api.app.auth.lifespan import auth_lifespan
+from apps.api.app.auth.routes import router
+from apps.api.app.auth.session import CookieConfig
+from apps.api.app.auth.session_tokens import (
+    MissingSigningKeyError,
+    RevocationList,
+    SessionTokenCodec,
+    SqlRevocationStore,
+    _decode,
+    _encode,
+)
+from apps.api.app.db.models import Base
+
+KEY = b"k" * 32
+
+
+def test_token_round_trip_and_tampering():
+    codec = SessionTokenCodec(KEY)
+    token, claims = codec.issue()
+
+    assert codec.verify(token) == claims
+    raw = bytearray(_decode(token))
+    raw[3] ^= 1
+    assert codec.verify(_encode(bytes(raw))) is None
+    assert SessionTokenCodec(b"x" * 32).verify(token) is None
+    assert codec.verify("not a token") is None
+
+
+def test_expiry_and_revocation():
+    now = [1_000.0]
+    codec = SessionTokenCodec(KEY, config=CookieConfig(session_max_age=60), clock=lambda: now[0])
+    first, _ = codec.issue()
+    second, _ = codec.issue()
+
+    assert codec.revoke(first)
+    assert codec.verify(first) is None
+    assert codec.verify(second) is not None
+
+    codec.revocations.revoke_all()
+    assert codec.verify(second) is None
+    third, _ = codec.issue()
+    now[0] += 61
+    assert codec.verify(third) is None
+
+
+def test_csrf_token_is_derived_from_the_session():
+    codec = SessionTokenCodec(KEY)
+    _, first = codec.issue()
+    _, second = codec.issue()
+
+    assert codec.csrf_token(first) == codec.csrf_token(first)
+    assert codec.csrf_token(first) != codec.csrf_token(second)
+
+
+def test_from_env_requires_a_key(monkeypatch):
+    monkeypatch.delenv("APP_SESSION_SIGNING_KEY", raising=False)
+    with pytest.raises(MissingSigningKeyError):
+        SessionTokenCodec.from_env()
+    monkeypatch.setenv("APP_SESSION_SIGNING_KEY", base64.urlsafe_b64encode(KEY).decode())
+    assert SessionTokenCodec.from_env().verify(SessionTokenCodec(KEY).issue()[0]) is not None
+
+
+def test_login_and_logout_in_signed_token_mode():
+    app = FastAPI()
+    app.include_router(router)
+    codec = SessionTokenCodec(KEY)
+    app.state.session_tokens = codec
+    client = TestClient(app, base_url="https://testserver")
+
+    csrf_token = client.post("/auth/login").json()["csrf_token"]
+    token = client.cookies.get("session_id")
+    assert codec.verify(token) is not None
+
+    assert client.post("/auth/logout", headers={"X-CSRF-Token": "forged"}).status_code == 403
+    assert client.post("/auth/logout", headers={"X-CSRF-Token": csrf_token}).status_code == 200
+    assert codec.verify(token) is None
+
+
+def test_revocations_are_shared_through_the_store(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'revocations.db'}")
+    Base.metadata.create_all(engine)
+    now = [1_000.0]
+    node_a, node_b = (
+        SessionTokenCodec(
+            KEY,
+            config=CookieConfig(session_max_age=60),
+            revocations=RevocationList(SqlRevocationStore(engine)),
+            clock=lambda: now[0],
+        )
+        for _ in range(2)
+    )
+    first, _ = node_a.issue()
+    second, _ = node_a.issue()
+
+    assert node_a.revoke(first)
+    assert node_b.verify(first) is not None
+    node_b.revocations.refresh()
+    assert node_b.verify(first) is None
+    assert node_b.verify(second) is not None
+
+    assert node_b.revocations.revoke_all() == 1
+    node_a.revocations.refresh()
+    assert node_a.verify(second) is None
+    assert node_a.issue()[1].epoch == 1
+
+    node_b.revoke(node_b.issue()[0])
+    node_a.revocations.refresh()
+    assert len(node_a.revocations) == 1
+    assert node_a.revocations.prune(now[0] + 61) == 1
+    assert len(node_a.revocations) == 0
+    assert SqlRevocationStore(engine).read(0)[2] == []
+
+
+class UnreachableStore:
+    def add(self, session_id: str, expires_at: int) -> None:
+        raise ConnectionError("database is down")
+
+    def advance_epoch(self) -> int:
+        raise ConnectionError("database is down")
+
+    def read(self, after: int) -> tuple[int, int, list[tuple[str, int]]]:
+        raise ConnectionError("database is down")
+
+    def prune(self, now: float) -> int:
+        raise ConnectionError("database is down")
+
+
+def test_store_outages_keep_serving_the_last_snapshot(caplog):
+    revocations = RevocationList(UnreachableStore(), refresh_interval=0.01)
+    codec = SessionTokenCodec(KEY, revocations=revocations)
+    token, claims = codec.issue()
+
+    revocations.start()
+    try:
+        assert "keeping the last snapshot" in caplog.text
+        assert codec.verify(token) == claims
+        time.sleep(0.05)
+        assert codec.verify(token) == claims
+        assert codec.issue()[1].epoch == 0
+    finally:
+        revocations.close()
+
+
+def test_cookies_expire_with_the_token_and_the_lifespan_runs_pruning():
+    app = FastAPI(lifespan=auth_lifespan)
+    app.include_router(router)
+    codec = SessionTokenCodec(KEY, config=CookieConfig(session_max_age=120))
+    app.state.session_tokens = codec
+
+    with TestClient(app, base_url="https://testserver") as client:
+        assert codec.revocations._worker is not None
+        response = client.post("/auth/login")
+        token = client.cookies.get("session_id")
+
+    assert codec.revocations._worker is None
+    assert "Max-Age=120" in response.headers["set-cookie"]
+    claims = codec.verify(token)
+    assert claims is not None and claims.expires_at - 120 <= codec._clock() + 1
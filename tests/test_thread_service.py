@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import io
+import json
 import unittest
 
-from apps.api.app.threads.service import persist_planner_outputs
-from packages.schemas.validator import SchemaValidationError
+from apps.api.app.threads.service import (
+    persist_planner_outputs,
+    persist_planner_outputs_async,
+    persist_planner_stream,
+)
+from packages.schemas.validator import BundleValidationError, SchemaValidationError
 
 
 class FakeRepository:
@@ -14,6 +20,70 @@ class FakeRepository:
         self.saved = True
 
 
+class FakeWriter:
+    def __init__(self) -> None:
+        self.writes: list[tuple[str, object]] = []
+        self.committed = False
+        self.rolled_back = False
+
+    def write_thread_pass(self, thread_pass: dict[str, object]) -> None:
+        self.writes.append(("thread_pass", thread_pass))
+
+    def write_skill_registry(self, skill_registry: dict[str, object]) -> None:
+        self.writes.append(("skill_registry", skill_registry))
+
+    def write_action_cards(self, action_cards: list[dict[str, object]]) -> None:
+        self.writes.append(("action_cards", list(action_cards)))
+
+    def write_timeline_events(self, timeline_events: list[dict[str, object]]) -> None:
+        self.writes.append(("timeline_events", list(timeline_events)))
+
+    def commit(self) -> None:
+        self.committed = True
+
+    def rollback(self) -> None:
+        self.rolled_back = True
+
+
+class FakeStreamingRepository:
+    def __init__(self) -> None:
+        self.writer = FakeWriter()
+
+    def open_planner_outputs(self) -> FakeWriter:
+        return self.writer
+
+
+class FakeAsyncWriter:
+    def __init__(self) -> None:
+        self.sync = FakeWriter()
+
+    async def write_thread_pass(self, thread_pass: dict[str, object]) -> None:
+        self.sync.write_thread_pass(thread_pass)
+
+    async def write_skill_registry(self, skill_registry: dict[str, object]) -> None:
+        self.sync.write_skill_registry(skill_registry)
+
+    async def write_action_cards(self, action_cards: list[dict[str, object]]) -> None:
+        self.sync.write_action_cards(action_cards)
+
+    async def write_timeline_events(self, timeline_events: list[dict[str, object]]) -> None:
+        self.sync.write_timeline_events(timeline_events)
+
+    async def commit(self) -> None:
+        self.sync.commit()
+
+    async def rollback(self) -> None:
+        self.sync.rollback()
+
+
+class FakeAsyncRepository:
+    def __init__(self) -> None:
+        self.writer = FakeAsyncWriter()
+
+    async def open_planner_outputs(self) -> FakeAsyncWriter:
+        return self.writer
+
+
 def valid_bundle() -> dict[str, object]:
     return {
         "thread_pass": {
@@ -84,5 +154,94 @@ class ThreadServiceTests(unittest.TestCase):
         self.assertFalse(repo.saved)
 
 
+class PlannerStreamTests(unittest.TestCase):
+    def stream_bundle(self, bundle: dict[str, object], *, events: int = 0) -> io.BytesIO:
+        timeline_events = bundle["timeline_events"]
+        assert isinstance(timeline_events, list)
+        template = timeline_events[0]
+        for index in range(events):
+            timeline_events.append({**template, "event_id": f"e_extra_{index}"})
+        return io.BytesIO(json.dumps(bundle, indent=1).encode("utf-8"))
+
+    def test_stream_writes_chunks_and_commits(self) -> None:
+        repo = FakeStreamingRepository()
+        stream = self.stream_bundle(valid_bundle(), events=9)
+
+        persist_planner_stream(repo, stream, chunk_size=4)
+
+        writer = repo.writer
+        self.assertTrue(writer.committed)
+        self.assertFalse(writer.rolled_back)
+        event_chunks = [item for section, item in writer.writes if section == "timeline_events"]
+        self.assertEqual([len(chunk) for chunk in event_chunks], [4, 4, 2])  # type: ignore[arg-type]
+        sections = {section for section, _ in writer.writes}
+        self.assertEqual(
+            sections, {"thread_pass", "skill_registry", "action_cards", "timeline_events"}
+        )
+
+    def test_stream_rolls_back_and_reports_every_violation(self) -> None:
+        repo = FakeStreamingRepository()
+        bundle = valid_bundle()
+        bundle["timeline_events"][0]["event_type"] = "bogus"  # type: ignore[index]
+        bundle["action_cards"][0]["priority"] = 9  # type: ignore[index]
+
+        with self.assertRaises(BundleValidationError) as ctx:
+            persist_planner_stream(repo, self.stream_bundle(bundle), chunk_size=2)
+
+        self.assertEqual(
+            [(issue.artifact, issue.index) for issue in ctx.exception.issues],
+            [("action_cards", 0), ("timeline_events", 0)],
+        )
+        self.assertTrue(repo.writer.rolled_back)
+        self.assertFalse(repo.writer.committed)
+
+    def test_stream_rejects_malformed_json(self) -> None:
+        repo = FakeStreamingRepository()
+
+        with self.assertRaises(SchemaValidationError):
+            persist_planner_stream(repo, io.BytesIO(b'{"thread_pass": {"thread_id": '))
+
+        self.assertTrue(repo.writer.rolled_back)
+
+
+class AsyncPersistTests(unittest.IsolatedAsyncioTestCase):
+    async def test_pipeline_writes_every_chunk_then_commits(self) -> None:
+        repo = FakeAsyncRepository()
+        bundle = valid_bundle()
+        template = bundle["timeline_events"][0]  # type: ignore[index]
+        bundle["timeline_events"] = [{**template, "event_id": f"e_{i}"} for i in range(5)]
+
+        await persist_planner_outputs_async(repo, **bundle, chunk_size=2)  # type: ignore[arg-type]
+
+        writes = repo.writer.sync.writes
+        self.assertEqual(
+            [section for section, _ in writes],
+            [
+                "thread_pass",
+                "skill_registry",
+                "action_cards",
+                "timeline_events",
+                "timeline_events",
+                "timeline_events",
+            ],
+        )
+        self.assertTrue(repo.writer.sync.committed)
+
+    async def test_pipeline_rolls_back_on_late_violation(self) -> None:
+        repo = FakeAsyncRepository()
+        bundle = valid_bundle()
+        template = bundle["timeline_events"][0]  # type: ignore[index]
+        events = [{**template, "event_id": f"e_{i}"} for i in range(6)]
+        events[5]["message"] = ""
+        bundle["timeline_events"] = events
+
+        with self.assertRaises(BundleValidationError) as ctx:
+            await persist_planner_outputs_async(repo, **bundle, chunk_size=2)  # type: ignore[arg-type]
+
+        self.assertEqual([issue.index for issue in ctx.exception.issues], [5])
+        self.assertTrue(repo.writer.sync.rolled_back)
+        self.assertFalse(repo.writer.sync.committed)
+
+
 if __name__ == "__main__":
     unittest.main()
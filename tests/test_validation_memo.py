@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+
+from packages.schemas.memo import ValidationMemo
+from packages.schemas.registry import SchemaRegistry
+from packages.schemas.validator import (
+    BundleValidationError,
+    SchemaValidationError,
+    check_planner_bundle,
+    validate_planner_bundle,
+)
+
+
+def card(index: int, **overrides: Any) -> dict[str, Any]:
+    return {
+        "card_id": f"ac_{index}",
+        "title": f"Card {index}",
+        "kind": "task",
+        "status": "todo",
+        "priority": 1,
+        "created_at": "2025-01-01T00:00:00Z",
+        **overrides,
+    }
+
+
+def bundle(cards: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "thread_pass": {
+            "thread_id": "t_1",
+            "pass_id": "p_1",
+            "pass_index": 0,
+            "created_at": "2025-01-01T00:00:00Z",
+            "planner_summary": "summary",
+            "action_card_ids": [item["card_id"] for item in cards],
+            "timeline_event_ids": [],
+            "skill_registry_id": "sr_1",
+        },
+        "action_cards": cards,
+        "skill_registry": {
+            "registry_id": "sr_1",
+            "generated_at": "2025-01-01T00:00:00Z",
+            "skills": [{"name": "a", "version": "1.0.0", "enabled": True}],
+        },
+        "timeline_events": [],
+    }
+
+
+class ValidationMemoTests(unittest.TestCase):
+    def test_repeated_payloads_hit_regardless_of_key_order(self) -> None:
+        memo = ValidationMemo()
+        memo.validate("action_card", card(1))
+        memo.validate("action_card", dict(reversed(list(card(1).items()))))
+
+        stats = memo.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+
+    def test_invalid_payloads_are_never_remembered(self) -> None:
+        memo = ValidationMemo()
+        for _ in range(2):
+            with self.assertRaises(SchemaValidationError):
+                memo.validate("action_card", card(1, priority=99))
+        self.assertEqual(len(memo), 0)
+
+    def test_nan_and_null_do_not_share_a_digest(self) -> None:
+        memo = ValidationMemo()
+        memo.validate("action_card", card(1, metadata={"confidence": float("nan")}))
+
+        with self.assertRaises(SchemaValidationError):
+            memo.validate("action_card", card(1, metadata={"confidence": None}))
+
+    def test_collect_reports_original_indexes(self) -> None:
+        memo = ValidationMemo()
+        cards = [card(0), card(1, status="bogus"), card(2)]
+        memo.collect("action_card", [cards[0]])
+
+        issues = memo.collect("action_card", cards, artifact="action_cards", start=10)
+
+        self.assertEqual([(issue.index, issue.path) for issue in issues], [(11, "<root>.status")])
+        self.assertEqual(memo.stats().hits, 1)
+        self.assertEqual(len(memo), 2)
+
+    def test_bundle_check_matches_unmemoized_result(self) -> None:
+        memo = ValidationMemo()
+        payload = bundle([card(0), card(1, kind="unknown"), card(2)])
+
+        expected = check_planner_bundle(**payload)
+        self.assertEqual(check_planner_bundle(**payload, memo=memo), expected)
+        self.assertEqual(check_planner_bundle(**payload, memo=memo), expected)
+        self.assertGreater(memo.stats().hits, 0)
+
+        with self.assertRaises(BundleValidationError):
+            validate_planner_bundle(**payload, memo=memo)
+
+    def test_lru_is_bounded(self) -> None:
+        memo = ValidationMemo(max_entries=2)
+        for index in range(3):
+            memo.validate("action_card", card(index))
+
+        self.assertEqual(len(memo), 2)
+        self.assertEqual(memo.stats().evictions, 1)
+
+    def test_schema_reload_drops_remembered_payloads(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "note.v1.json"
+            path.write_text(json.dumps({"type": "object"}), encoding="utf-8")
+            registry = SchemaRegistry(tmp)
+            memo = ValidationMemo(registry=registry)
+            memo.validate("note", {"title": 1})
+
+            path.write_text(
+                json.dumps({"type": "object", "properties": {"title": {"type": "string"}}}),
+                encoding="utf-8",
+            )
+            registry.refresh()
+
+            with self.assertRaises(SchemaValidationError):
+                memo.validate("note", {"title": 1})
+
+    def test_hot_added_version_does_not_change_the_memo_verdict(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            note = {"type": "object", "required": ["a"]}
+            (Path(tmp) / "note.v1.json").write_text(json.dumps(note), encoding="utf-8")
+            registry = SchemaRegistry(tmp)
+            memo = ValidationMemo(registry=registry)
+            (Path(tmp) / "note.v2.json").write_text(
+                json.dumps({**note, "required": ["a", "b"]}), encoding="utf-8"
+            )
+            registry.refresh()
+
+            self.assertEqual(
+                (registry.default_version("note"), registry.latest_version("note")), (1, 2)
+            )
+            registry.validate("note", {"a": 1})
+            memo.validate("note", {"a": 1})
+            self.assertEqual(memo.check("note", {"a": 1}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()